@@ -0,0 +1,366 @@
+"""
+Benchmarks for the injection hot paths.
+
+Drives :class:`~quart.Quart` test apps through function views, class based views,
+websocket handlers, request scoped graphs of varying depth and singleton only
+graphs, and reports the per-request overhead against an equivalent un-wired app.
+
+Run with ``make bench`` or ``python benchmarks/bench_injection.py --help``.
+"""
+
+import argparse
+import asyncio
+import collections.abc
+import dataclasses
+import functools
+import statistics
+import time
+import typing
+
+import injector
+import quart
+import quart.views
+
+import quart_injector
+
+Configure = collections.abc.Callable[[injector.Binder], None]
+
+
+@dataclasses.dataclass(frozen=True)
+class Scenario:
+    """
+    Scenario.
+
+    A pair of equivalent applications, one wired for dependency injection and a
+    baseline that builds the same objects by hand.
+
+    :param name: name to report the scenario as
+    :param wired: factory returning the wired application
+    :param baseline: factory returning the un-wired application
+    :param websocket: whether to drive the ``/ws`` websocket instead of ``/``
+    """
+
+    name: str
+    wired: collections.abc.Callable[[], quart.Quart]
+    baseline: collections.abc.Callable[[], quart.Quart]
+    websocket: bool = False
+
+
+class Leaf:  # pylint: disable=too-few-public-methods
+    """
+    Leaf.
+
+    A dependency without dependencies of its own.
+    """
+
+
+def chain(depth: int) -> list[type]:
+    """
+    Chain.
+
+    Build classes that each depend on the previous one.
+
+    :param depth: number of classes in the chain
+
+    :return: classes, the last depending on all of the others
+    """
+    classes: list[type] = [Leaf]
+
+    for index in range(1, depth):
+
+        def __init__(self: typing.Any, child: typing.Any) -> None:
+            self.child = child
+
+        __init__.__annotations__ = {"child": classes[-1], "return": None}
+
+        classes.append(
+            type(f"Node{index}", (), {"__init__": injector.inject(__init__)})
+        )
+
+    return classes
+
+
+def build(classes: list[type]) -> typing.Any:
+    """
+    Build.
+
+    Construct a chain of classes by hand, as the baseline applications do.
+
+    :param classes: classes returned by :func:`chain`
+
+    :return: instance of the last class
+    """
+    instance = classes[0]()
+
+    for cls in classes[1:]:
+        instance = cls(instance)
+
+    return instance
+
+
+def scoped(classes: list[type], scope: type[injector.Scope]) -> Configure:
+    """
+    Scoped.
+
+    Bind every class in a chain to the given scope.
+
+    :param classes: classes returned by :func:`chain`
+    :param scope: scope to bind the classes in
+
+    :return: container configuration function
+    """
+
+    def configure(binder: injector.Binder) -> None:
+        for cls in classes:
+            binder.bind(cls, scope=scope)
+
+    return configure
+
+
+def function_view(
+    classes: list[type], configure: Configure | None, shared: bool = False
+) -> quart.Quart:
+    """
+    Function view.
+
+    :param classes: classes returned by :func:`chain`
+    :param configure: container configuration, or ``None`` for the baseline
+    :param shared: whether the baseline builds the chain once up front, like
+        singletons, rather than on every request
+
+    :return: application
+    """
+    app = quart.Quart(__name__)
+
+    if configure is None:
+        if shared:
+            build(classes)
+
+        @app.route("/")
+        async def baseline() -> str:
+            if not shared:
+                build(classes)
+
+            return "ok"
+
+        return app
+
+    async def view(dependency: typing.Any) -> str:
+        assert dependency is not None
+
+        return "ok"
+
+    view.__annotations__["dependency"] = classes[-1]
+
+    app.add_url_rule("/", "view", injector.inject(view))
+    quart_injector.wire(app, configure)
+
+    return app
+
+
+def method_view(classes: list[type], configure: Configure | None) -> quart.Quart:
+    """
+    Method view.
+
+    :param classes: classes returned by :func:`chain`
+    :param configure: container configuration, or ``None`` for the baseline
+
+    :return: application
+    """
+    app = quart.Quart(__name__)
+
+    class View(quart.views.MethodView):  # pylint: disable=too-few-public-methods
+        """
+        View.
+        """
+
+        def __init__(self, dependency: typing.Any) -> None:
+            self.dependency = dependency
+
+        async def get(self) -> str:
+            """
+            Get.
+            """
+            assert self.dependency is not None
+
+            return "ok"
+
+    if configure is None:
+
+        class Baseline(View):  # pylint: disable=too-few-public-methods
+            """
+            Baseline.
+            """
+
+            def __init__(self) -> None:
+                super().__init__(build(classes))
+
+        app.add_url_rule("/", view_func=Baseline.as_view("view"))
+
+        return app
+
+    View.__init__.__annotations__["dependency"] = classes[-1]
+    setattr(View, "__init__", injector.inject(View.__init__))
+
+    app.add_url_rule("/", view_func=View.as_view("view"))
+    quart_injector.wire(app, configure)
+
+    return app
+
+
+def websocket(classes: list[type], configure: Configure | None) -> quart.Quart:
+    """
+    Websocket.
+
+    :param classes: classes returned by :func:`chain`
+    :param configure: container configuration, or ``None`` for the baseline
+
+    :return: application
+    """
+    app = quart.Quart(__name__)
+
+    if configure is None:
+
+        @app.websocket("/ws")
+        async def baseline() -> None:
+            build(classes)
+            await quart.websocket.send(await quart.websocket.receive())
+
+        return app
+
+    async def view(dependency: typing.Any) -> None:
+        assert dependency is not None
+
+        await quart.websocket.send(await quart.websocket.receive())
+
+    view.__annotations__["dependency"] = classes[-1]
+
+    app.add_websocket("/ws", "view", injector.inject(view))
+    quart_injector.wire(app, configure)
+
+    return app
+
+
+def scenarios() -> list[Scenario]:
+    """
+    Scenarios.
+
+    :return: scenarios to benchmark
+    """
+    result = []
+    scopes: list[tuple[str, type[injector.Scope], bool]] = [
+        ("request", quart_injector.RequestScope, False),
+        (
+            "singleton",
+            typing.cast(type[injector.Scope], injector.SingletonScope),
+            True,
+        ),
+    ]
+
+    for depth in (1, 4, 16):
+        classes = chain(depth)
+
+        for label, scope, shared in scopes:
+            result.append(
+                Scenario(
+                    f"function view, {label} depth {depth}",
+                    functools.partial(function_view, classes, scoped(classes, scope)),
+                    functools.partial(function_view, classes, None, shared),
+                )
+            )
+
+    classes = chain(4)
+    configure = scoped(classes, quart_injector.RequestScope)
+
+    result.append(
+        Scenario(
+            "method view, request depth 4",
+            functools.partial(method_view, classes, configure),
+            functools.partial(method_view, classes, None),
+        )
+    )
+    result.append(
+        Scenario(
+            "websocket, request depth 4",
+            functools.partial(websocket, classes, configure),
+            functools.partial(websocket, classes, None),
+            websocket=True,
+        )
+    )
+
+    return result
+
+
+async def measure(app: quart.Quart, requests: int, use_websocket: bool) -> float:
+    """
+    Measure.
+
+    :param app: application to drive
+    :param requests: number of requests to time
+    :param use_websocket: whether to drive the websocket rather than the view
+
+    :return: median seconds per request
+    """
+    timings = []
+
+    async with app.test_app() as test_app:
+        client = test_app.test_client()
+
+        for _ in range(requests):
+            start = time.perf_counter()
+
+            if use_websocket:
+                async with client.websocket("/ws") as socket:
+                    await socket.send("ping")
+                    await socket.receive()
+            else:
+                await client.get("/")
+
+            timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings)
+
+
+async def run(requests: int, warmup: int) -> None:
+    """
+    Run.
+
+    Measure every scenario and print a table of the results.
+
+    :param requests: number of requests to time per application
+    :param warmup: number of untimed requests to send first
+    """
+    print(f"{'scenario':<36} {'baseline':>10} {'wired':>10} {'overhead':>10}")
+
+    for scenario in scenarios():
+        results = []
+
+        for factory in (scenario.baseline, scenario.wired):
+            app = factory()
+            await measure(app, warmup, scenario.websocket)
+            results.append(await measure(app, requests, scenario.websocket))
+
+        baseline, wired = (result * 1_000_000 for result in results)
+
+        print(
+            f"{scenario.name:<36} {baseline:>8.1f}us {wired:>8.1f}us "
+            f"{wired - baseline:>+8.1f}us"
+        )
+
+
+def main() -> None:
+    """
+    Main.
+
+    Parse command line arguments and run the benchmarks.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.requests, args.warmup))
+
+
+if __name__ == "__main__":
+    main()
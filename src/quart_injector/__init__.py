@@ -1,15 +1,81 @@
 """
 :class:`~injector.Injector` support for :class:`~quart.Quart` applications.
 """
-
-from quart_injector.module import QuartModule
-from quart_injector.scope import RequestScope, request
-from quart_injector.wiring import wire, wrap
+from quart_injector.body import BodyStream, JsonBody, Query
+from quart_injector.instrument import Instrument
+from quart_injector.lazy import Lazy
+from quart_injector.module import QuartModule, ViewArgs
+from quart_injector.provider import (
+    AsyncProvider,
+    AsyncResourceProvider,
+    BlockingExecutor,
+    BlockingProvider,
+    ContextProvider,
+    ResourceProvider,
+    async_provider,
+    bind,
+)
+from quart_injector.scope import (
+    CachedScope,
+    MessageScope,
+    RequestScope,
+    ScopeUsage,
+    TeardownError,
+    WebsocketScope,
+    cached,
+    cached_scope,
+    message,
+    request,
+    websocket,
+)
+from quart_injector.sessions import (
+    MemorySessionStore,
+    SessionScope,
+    SessionStore,
+    session,
+)
+from quart_injector.tenancy import Tenancy, TenantPool
+from quart_injector.validation import ValidationError
+from quart_injector.wiring import inline, install, reusable, warm_up, wire, wrap
 
 __all__ = (
+    "async_provider",
+    "AsyncProvider",
+    "AsyncResourceProvider",
+    "bind",
+    "BlockingExecutor",
+    "BlockingProvider",
+    "BodyStream",
+    "cached",
+    "cached_scope",
+    "CachedScope",
+    "ContextProvider",
+    "inline",
+    "install",
+    "Instrument",
+    "JsonBody",
+    "Lazy",
+    "MemorySessionStore",
+    "message",
+    "MessageScope",
     "QuartModule",
+    "Query",
     "request",
     "RequestScope",
+    "ResourceProvider",
+    "reusable",
+    "ScopeUsage",
+    "session",
+    "SessionScope",
+    "SessionStore",
+    "TeardownError",
+    "Tenancy",
+    "TenantPool",
+    "ValidationError",
+    "ViewArgs",
+    "warm_up",
+    "websocket",
+    "WebsocketScope",
     "wire",
     "wrap",
 )
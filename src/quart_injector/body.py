@@ -0,0 +1,217 @@
+"""
+Parsed request body and query string markers, and streamed request bodies.
+"""
+import asyncio
+import collections.abc
+import typing
+
+import injector
+import quart
+import quart.wrappers
+import werkzeug.exceptions
+
+import quart_injector.scope
+
+T = typing.TypeVar("T")
+
+
+if typing.TYPE_CHECKING:
+    # type checkers see the converted type rather than the marker
+    JsonBody = typing.Annotated[T, "JsonBody"]
+    Query = typing.Annotated[T, "Query"]
+else:
+
+    class JsonBody(typing.Generic[T]):  # pylint: disable=too-few-public-methods
+        """
+        JSON body.
+
+        Marker for the current request's JSON body converted to ``T``, declare a
+        parameter as ``injector.Inject[JsonBody[T]]`` to receive an instance of ``T``,
+        which is also the type checkers see. The body is passed to the application's
+        JSON provider as bytes, so a provider backed by a faster library such as
+        orjson is used, and is parsed and converted once per request. Hooks and the
+        view share the instance through the :class:`~quart_injector.RequestScope`.
+
+        Classes with a ``model_validate`` method, such as pydantic models, are
+        converted using it, other classes are called with the JSON object as keyword
+        arguments. ``dict``, ``list`` and ``typing.Any`` receive the parsed JSON as it
+        is. Requests that are not JSON, or that cannot be converted, are rejected with
+        a bad request error.
+        """
+
+    class Query(typing.Generic[T]):  # pylint: disable=too-few-public-methods
+        """
+        Query.
+
+        Marker for the current request's query string converted to ``T``, declare a
+        parameter as ``injector.Inject[Query[T]]`` to receive an instance of ``T``.
+        Only the first value of each argument is used, values are passed as strings.
+        Converted like a :class:`JsonBody`, once per request.
+        """
+
+
+class BodyStream:
+    """
+    Body stream.
+
+    The current request's body as an async iterator of chunks, read as they arrive
+    rather than buffered, for request scoped providers such as streaming parsers.
+    :class:`~quart_injector.QuartModule` binds it in the
+    :class:`~quart_injector.RequestScope`, limited to ``INJECTOR_BODY_MAX_SIZE`` bytes
+    in chunks of at most ``INJECTOR_BODY_CHUNK_SIZE`` bytes. A body can only be
+    iterated over once.
+
+    :param body: request body to read
+    :param content_length: length the request declares, if any
+    :param max_size: maximum number of bytes to read, or ``None`` for no limit
+    :param chunk_size: maximum number of bytes in each chunk
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(
+        self,
+        body: quart.wrappers.Body,
+        content_length: int | None = None,
+        max_size: int | None = None,
+        chunk_size: int = 65536,
+    ) -> None:
+        self.body = body
+        self.content_length = content_length
+        self.max_size = max_size
+        self.chunk_size = chunk_size
+        self.received = 0
+        self._consumed = False
+
+    def __aiter__(self) -> collections.abc.AsyncIterator[bytes]:
+        if self._consumed:
+            raise RuntimeError("BodyStream has already been consumed")
+
+        self._consumed = True
+
+        return self._chunks()
+
+    async def _chunks(self) -> collections.abc.AsyncIterator[bytes]:
+        max_size = self.max_size
+        chunk_size = self.chunk_size
+
+        # reject declared lengths over the limit before reading anything
+        if (
+            max_size is not None
+            and self.content_length is not None
+            and self.content_length > max_size
+        ):
+            raise werkzeug.exceptions.RequestEntityTooLarge()
+
+        # quart hands over everything received since the last chunk, as a copy
+        async for data in self.body:
+            self.received += len(data)
+
+            if max_size is not None and self.received > max_size:
+                raise werkzeug.exceptions.RequestEntityTooLarge()
+
+            if len(data) <= chunk_size:
+                yield data
+                continue
+
+            view = memoryview(data)
+
+            for start in range(0, len(data), chunk_size):
+                yield bytes(view[start : start + chunk_size])
+
+
+def _convert(model: typing.Any, data: typing.Any) -> typing.Any:
+    if model is typing.Any or typing.get_origin(model) in (dict, list):
+        return data
+
+    if isinstance(model, type) and isinstance(data, model):
+        return data
+
+    validate = getattr(model, "model_validate", None)
+
+    try:
+        if validate is not None:
+            return validate(data)
+
+        if isinstance(data, dict):
+            return model(**data)
+
+        return model(data)
+    except (TypeError, ValueError) as ex:
+        raise werkzeug.exceptions.BadRequest(
+            f"Could not convert to {getattr(model, '__qualname__', model)}: {ex}"
+        ) from ex
+
+
+class _JsonBodyProvider(injector.Provider[typing.Any]):
+    # pylint: disable=arguments-renamed,too-few-public-methods,unused-argument
+
+    #: injection plans await values from this provider
+    awaitable: typing.ClassVar[bool] = True
+
+    def __init__(self, model: typing.Any) -> None:
+        self.model = model
+
+    def get(self, container: injector.Injector) -> typing.Any:
+        # a task may be awaited by every hook and view sharing the request scope
+        return asyncio.ensure_future(self._parse())
+
+    async def _parse(self) -> typing.Any:
+        request = quart.request
+
+        if not request.is_json:
+            raise werkzeug.exceptions.UnsupportedMediaType("Expected a JSON body")
+
+        body = await request.get_data()
+
+        try:
+            data = request.json_module.loads(body)
+        except ValueError as ex:
+            data = request.on_json_loading_failed(ex)
+
+        return _convert(self.model, data)
+
+
+class _QueryProvider(injector.Provider[typing.Any]):
+    # pylint: disable=arguments-renamed,too-few-public-methods,unused-argument
+
+    def __init__(self, model: typing.Any) -> None:
+        self.model = model
+
+    def get(self, container: injector.Injector) -> typing.Any:
+        return _convert(self.model, quart.request.args.to_dict())
+
+
+_PROVIDERS: dict[
+    typing.Any, collections.abc.Callable[[typing.Any], injector.Provider[typing.Any]]
+] = {
+    JsonBody: _JsonBodyProvider,
+    Query: _QueryProvider,
+}
+
+
+def bind(binder: injector.Binder, interface: typing.Any) -> None:
+    """
+    Bind.
+
+    Bind a :class:`JsonBody` or :class:`Query` marker in the
+    :class:`~quart_injector.RequestScope`, unless it is already bound. Other
+    interfaces are ignored. Called when building injection plans.
+
+    :param binder: binder to add the binding to
+    :param interface: binding key that may be a marker
+    """
+    provider = _PROVIDERS.get(typing.get_origin(interface))
+
+    if provider is None:
+        return
+
+    try:
+        binder.get_binding(interface)
+    except injector.Error:
+        (model,) = typing.get_args(interface)
+        binder.bind(
+            interface,
+            to=provider(model),
+            scope=quart_injector.scope.RequestScope,
+        )
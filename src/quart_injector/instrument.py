@@ -0,0 +1,45 @@
+"""
+Injection timing instrumentation.
+"""
+import collections.abc
+import typing
+
+
+class Instrument(typing.Protocol):
+    """
+    Instrument.
+
+    Receives timings from wrapped views and request scoped providers, for export to a
+    metrics system. Pass an instance to :func:`~quart_injector.wire` to enable it,
+    durations are measured with :func:`time.perf_counter` and given in seconds.
+    """
+
+    def resolved(
+        self,
+        func: collections.abc.Callable[..., typing.Any],
+        duration: float,
+        built: int,
+    ) -> None:
+        """
+        Resolved.
+
+        Called once the dependencies of a wrapped view, hook or class based view have
+        been resolved, before it is called.
+
+        :param func: view function, hook or class based view
+        :param duration: time spent resolving dependencies, including awaiting
+            asynchronous providers
+        :param built: number of request scoped instances built while resolving
+        """
+
+    def built(self, interface: typing.Any, duration: float) -> None:
+        """
+        Built.
+
+        Called after a request scoped instance has been built. For asynchronous
+        providers the duration covers scheduling the build, awaiting it is included
+        in :meth:`resolved`.
+
+        :param interface: binding key of the instance
+        :param duration: time spent building the instance
+        """
@@ -0,0 +1,51 @@
+"""
+Lazily resolved dependencies.
+"""
+
+import collections.abc
+import typing
+
+T = typing.TypeVar("T")
+
+_MISSING: typing.Any = object()
+
+
+class Lazy(typing.Generic[T]):
+    """
+    Lazy.
+
+    A handle to a dependency that is only resolved the first time it is requested.
+    Declare a parameter of a view, hook, or async or resource provider as
+    ``injector.Inject[Lazy[T]]`` and call :meth:`get` on the branches that need it.
+    Asynchronous dependencies return an awaitable. Classes and providers built by
+    injector itself cannot depend on a handle, :func:`~quart_injector.wire` rejects
+    them.
+
+    A handle keeps its value once resolved, so a handle injected outside of a
+    :class:`~quart_injector.MessageScope` returns the first message's value for every
+    later activation, look per-message values up through the injector inside the
+    activated scope instead.
+
+    :param provide: zero argument callable returning an instance
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ("_provide", "_value")
+
+    def __init__(self, provide: collections.abc.Callable[[], T]) -> None:
+        self._provide = provide
+        self._value: T = _MISSING
+
+    def get(self) -> T:
+        """
+        Get.
+
+        Resolve the dependency, or return the previously resolved instance.
+
+        :return: instance of the dependency
+        """
+        if self._value is _MISSING:
+            self._value = self._provide()
+
+        return self._value
@@ -1,17 +1,109 @@
 """
 Quart :class:`~injector.Module`.
 """
+import asyncio
+import contextvars
 import logging
+import typing
 
 import injector
 import quart
+import quart.ctx
+import quart.globals
+import quart.routing
 import quart.sessions
 
+import quart_injector.body
+import quart_injector.provider
+import quart_injector.scope
+import quart_injector.sessions
+
+T = typing.TypeVar("T")
+
+# the context variables behind quart's proxies since 0.18, read directly to skip them
+_APP = quart.globals._cv_app  # pylint: disable=protected-access
+_REQUEST = quart.globals._cv_request  # pylint: disable=protected-access
+_WEBSOCKET = quart.globals._cv_websocket  # pylint: disable=protected-access
+
+
+class ViewArgs(dict[str, typing.Any]):
+    """
+    View args.
+
+    The arguments matched from the current request or websocket's URL.
+    """
+
+
+def _current(variable: contextvars.ContextVar[T], message: str) -> T:
+    try:
+        return variable.get()
+    except LookupError:
+        raise RuntimeError(message) from None
+
+
+def _app_context() -> quart.ctx.AppContext:
+    return _current(_APP, "Not within an app context")
+
+
+def _request_context() -> quart.ctx.RequestContext:
+    return _current(_REQUEST, "Not within a request context")
+
+
+def _websocket_context() -> quart.ctx.WebsocketContext:
+    return _current(_WEBSOCKET, "Not within a websocket context")
+
+
+def _context() -> quart.ctx.RequestContext | quart.ctx.WebsocketContext:
+    context = _REQUEST.get(None) or _WEBSOCKET.get(None)
+
+    if context is None:
+        raise RuntimeError("Not within a request nor websocket context")
+
+    return context
+
+
+def _g() -> typing.Any:
+    return _app_context().g
+
+
+def _request() -> quart.Request:
+    return _request_context().request
+
+
+def _websocket() -> quart.Websocket:
+    return _websocket_context().websocket
+
+
+def _session() -> quart.sessions.SessionMixin:
+    return typing.cast(quart.sessions.SessionMixin, _context().session)
+
+
+def _url_rule() -> quart.routing.QuartRule | None:
+    return _context().request_websocket.url_rule
+
+
+def _view_args() -> ViewArgs:
+    return ViewArgs(_context().request_websocket.view_args or {})
+
 
 class QuartModule(injector.Module):
     """
     Quart module.
 
+    The :class:`~quart_injector.BlockingExecutor` is limited to
+    ``INJECTOR_BLOCKING_MAX_WORKERS`` threads when it is set in the application's
+    configuration, and is shut down after the application stops serving. The
+    :class:`~quart_injector.SessionStore` is bound to a
+    :class:`~quart_injector.MemorySessionStore` sized using ``INJECTOR_SESSION_MAXSIZE``
+    and ``INJECTOR_SESSION_TTL``. The :class:`~quart_injector.BodyStream` is limited to
+    ``INJECTOR_BODY_MAX_SIZE`` bytes, in chunks of at most ``INJECTOR_BODY_CHUNK_SIZE``
+    bytes.
+
+    The current request, websocket, session, ``g``, request and websocket contexts,
+    URL rule and :class:`~quart_injector.ViewArgs` are bound using a
+    :class:`~quart_injector.ContextProvider`, so the objects themselves are injected
+    rather than quart's proxies.
+
     :param app: quart application
     """
 
@@ -19,11 +111,71 @@ class QuartModule(injector.Module):
 
     def __init__(self, app: quart.Quart) -> None:
         self.app = app
+        self._executor: quart_injector.provider.BlockingExecutor | None = None
 
     def configure(self, binder: injector.Binder) -> None:
+        context = quart_injector.provider.ContextProvider
+
         binder.bind(quart.Quart, to=self.app, scope=injector.singleton)
         binder.bind(quart.Config, to=self.app.config, scope=injector.singleton)
-        binder.bind(quart.Request, to=lambda: quart.request)
-        binder.bind(quart.sessions.SessionMixin, to=lambda: quart.session)
-        binder.bind(quart.Websocket, to=lambda: quart.websocket)
+        binder.bind(self.app.app_ctx_globals_class, to=context(_g))
+        binder.bind(quart.Request, to=context(_request))
+        binder.bind(quart.Websocket, to=context(_websocket))
+        binder.bind(
+            quart.sessions.SessionMixin,  # type: ignore[type-abstract]
+            to=context(_session),
+        )
+        binder.bind(quart.ctx.RequestContext, to=context(_request_context))
+        binder.bind(quart.ctx.WebsocketContext, to=context(_websocket_context))
+        # the rule is None when no URL rule matched
+        binder.bind(
+            quart.routing.QuartRule, to=context(_url_rule)  # type: ignore[arg-type]
+        )
+        binder.bind(ViewArgs, to=context(_view_args))
         binder.bind(logging.Logger, to=self.app.logger)
+        binder.bind(
+            quart_injector.body.BodyStream,
+            to=self._body_stream,
+            scope=quart_injector.scope.RequestScope,
+        )
+        binder.bind(
+            quart_injector.provider.BlockingExecutor,
+            to=self._blocking_executor,
+            scope=injector.singleton,
+        )
+        binder.bind(
+            quart_injector.sessions.SessionStore,  # type: ignore[type-abstract]
+            to=self._session_store,
+            scope=injector.singleton,
+        )
+
+        self.app.after_serving(self._shutdown)
+
+    def _body_stream(self) -> quart_injector.body.BodyStream:
+        request = _request()
+
+        return quart_injector.body.BodyStream(
+            request.body,
+            content_length=request.content_length,
+            max_size=self.app.config.get("INJECTOR_BODY_MAX_SIZE"),
+            chunk_size=self.app.config.get("INJECTOR_BODY_CHUNK_SIZE", 65536),
+        )
+
+    def _blocking_executor(self) -> quart_injector.provider.BlockingExecutor:
+        self._executor = quart_injector.provider.BlockingExecutor(
+            max_workers=self.app.config.get("INJECTOR_BLOCKING_MAX_WORKERS"),
+            thread_name_prefix="quart-injector-blocking",
+        )
+
+        return self._executor
+
+    async def _shutdown(self) -> None:
+        # wait for blocking calls still running without stalling the event loop
+        if self._executor is not None:
+            await asyncio.to_thread(self._executor.shutdown)
+
+    def _session_store(self) -> quart_injector.sessions.SessionStore:
+        return quart_injector.sessions.MemorySessionStore(
+            maxsize=self.app.config.get("INJECTOR_SESSION_MAXSIZE", 1024),
+            ttl=self.app.config.get("INJECTOR_SESSION_TTL", 3600),
+        )
@@ -0,0 +1,224 @@
+"""
+Injection plans for callables.
+"""
+
+import asyncio
+import collections.abc
+import dataclasses
+import functools
+import inspect
+import typing
+
+import injector
+
+import quart_injector.body
+import quart_injector.lazy
+
+_POSITIONAL = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+
+
+def _deferred(
+    interface: typing.Any,
+    container: injector.Injector,
+    owner: typing.Any,
+) -> collections.abc.Callable[[], typing.Any]:
+    def provide() -> typing.Any:
+        try:
+            return container.get(interface)
+        except injector.UnsatisfiedRequirement as ex:
+            if ex.owner:
+                raise
+
+            raise injector.UnsatisfiedRequirement(owner, ex.interface) from ex
+
+    return provide
+
+
+def _provide(
+    interface: typing.Any,
+    container: injector.Injector,
+    owner: typing.Any,
+) -> tuple[type[injector.Scope] | None, bool, collections.abc.Callable[[], typing.Any]]:
+    if typing.get_origin(interface) is quart_injector.lazy.Lazy:
+        (target,) = typing.get_args(interface)
+        target_scope, _, provide_target = _provide(target, container, owner)
+
+        return (
+            target_scope,
+            False,
+            functools.partial(quart_injector.lazy.Lazy, provide_target),
+        )
+
+    quart_injector.body.bind(container.binder, interface)
+
+    try:
+        binding, binder = container.binder.get_binding(interface)
+    except injector.UnsatisfiedRequirement:
+        return None, False, _deferred(interface, container, owner)
+
+    scope: type[injector.Scope] = (
+        binding.scope.scope
+        if isinstance(binding.scope, injector.ScopeDecorator)
+        else binding.scope or injector.NoScope
+    )
+
+    provider = binding.provider
+
+    # context locals are looked up on every call, skip the scope and provider
+    if scope is injector.NoScope and getattr(provider, "contextual", False):
+        return scope, False, getattr(provider, "getter")
+
+    scope_binding, _ = binder.get_binding(scope)
+    scope_instance: injector.Scope = scope_binding.provider.get(container)
+
+    def provide() -> typing.Any:
+        return scope_instance.get(interface, provider).get(container)
+
+    return (
+        scope,
+        getattr(provider, "awaitable", False),
+        provide,
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class Dependency:
+    """
+    Dependency.
+
+    A single injectable parameter of a callable.
+
+    :param name: parameter name
+    :param interface: binding key to resolve
+    :param position: positional index of the parameter, if it can be passed by position
+    :param scope: scope the interface is bound in, if the binding is known
+    :param awaitable: whether the provided value must be awaited
+    :param provide: zero argument callable returning an instance of the interface
+    """
+
+    name: str
+    interface: typing.Any
+    position: int | None
+    scope: type[injector.Scope] | None
+    awaitable: bool
+    provide: collections.abc.Callable[[], typing.Any]
+
+
+@dataclasses.dataclass(frozen=True)
+class InjectionPlan:
+    """
+    Injection plan.
+
+    The injectable parameters of a callable, resolved against a container ahead of
+    time so they can be provided without inspecting the callable again.
+
+    :param dependencies: dependencies of the callable
+    """
+
+    dependencies: tuple[Dependency, ...]
+
+    @property
+    def awaitable(self) -> bool:
+        """
+        Whether any of the dependencies must be awaited.
+        """
+        return any(dependency.awaitable for dependency in self.dependencies)
+
+    @classmethod
+    def build(
+        cls,
+        func: collections.abc.Callable[..., typing.Any],
+        container: injector.Injector,
+        exclude: collections.abc.Collection[str] = (),
+    ) -> "InjectionPlan":
+        """
+        Build.
+
+        Inspect the given callable and look up the providers for its dependencies.
+
+        :param func: callable to build a plan for
+        :param container: dependency injection container
+        :param exclude: names of parameters that will always be passed by the caller
+
+        :return: injection plan
+        """
+        bindings = injector.get_bindings(func)
+
+        if not bindings:
+            return cls(())
+
+        parameters = list(inspect.signature(func).parameters.values())
+        positions = {
+            parameter.name: index
+            for index, parameter in enumerate(parameters)
+            if parameter.kind in _POSITIONAL
+        }
+
+        return cls(
+            tuple(
+                Dependency(
+                    name,
+                    interface,
+                    positions.get(name),
+                    *_provide(interface, container, func.__module__),
+                )
+                for name, interface in bindings.items()
+                if name not in exclude
+            )
+        )
+
+    def resolve(
+        self,
+        args: tuple[typing.Any, ...],
+        kwargs: collections.abc.Mapping[str, typing.Any],
+    ) -> dict[str, typing.Any]:
+        """
+        Resolve.
+
+        Provide the dependencies not already passed by the caller.
+
+        :param args: positional arguments passed by the caller
+        :param kwargs: keyword arguments passed by the caller
+
+        :return: keyword arguments for the dependencies
+        """
+        count = len(args)
+
+        return {
+            dependency.name: dependency.provide()
+            for dependency in self.dependencies
+            if dependency.name not in kwargs
+            and (dependency.position is None or dependency.position >= count)
+        }
+
+    async def aresolve(
+        self,
+        args: tuple[typing.Any, ...],
+        kwargs: collections.abc.Mapping[str, typing.Any],
+    ) -> dict[str, typing.Any]:
+        """
+        Resolve asynchronously.
+
+        Like :meth:`resolve` but awaits asynchronous dependencies concurrently.
+
+        :param args: positional arguments passed by the caller
+        :param kwargs: keyword arguments passed by the caller
+
+        :return: keyword arguments for the dependencies
+        """
+        resolved = self.resolve(args, kwargs)
+
+        names = [
+            dependency.name
+            for dependency in self.dependencies
+            if dependency.awaitable and dependency.name in resolved
+        ]
+
+        if names:
+            values = await asyncio.gather(*(resolved[name] for name in names))
+            resolved.update(zip(names, values))
+
+        return resolved
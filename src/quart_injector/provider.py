@@ -0,0 +1,440 @@
+"""
+Asynchronous :class:`~injector.Provider` support.
+"""
+import asyncio
+import collections.abc
+import concurrent.futures
+import contextlib
+import contextvars
+import functools
+import inspect
+import typing
+
+import injector
+
+import quart_injector.lazy
+import quart_injector.plan
+import quart_injector.scope
+
+T = typing.TypeVar("T")
+F = typing.TypeVar("F", bound=collections.abc.Callable[..., typing.Any])
+
+#: attribute of injectors holding the plans of provider functions built against them
+_PLANS = "_quart_injector_plans"
+
+
+def _plan(
+    func: collections.abc.Callable[..., typing.Any],
+    container: injector.Injector,
+) -> quart_injector.plan.InjectionPlan:
+    # plans refer to the injector, so are kept on it rather than on the provider,
+    # which may outlive it when shared with child injectors
+    plans: dict[
+        collections.abc.Callable[..., typing.Any], quart_injector.plan.InjectionPlan
+    ] = vars(container).setdefault(_PLANS, {})
+
+    try:
+        return plans[func]
+    except KeyError:
+        plan = plans[func] = quart_injector.plan.InjectionPlan.build(func, container)
+
+        return plan
+
+
+class Pending(typing.Generic[T]):
+    """
+    Pending.
+
+    An awaitable result of an :class:`AsyncProvider`. Building starts straight away,
+    and may be awaited any number of times. Once a failed build has been reported to
+    an awaiter it is retried the next time it is awaited, so scopes never keep hold
+    of an error. Cancelling an awaiter does not cancel the build.
+
+    :param factory: zero argument coroutine function building the instance
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ("_factory", "_task", "_failed")
+
+    def __init__(
+        self,
+        factory: collections.abc.Callable[
+            [], collections.abc.Coroutine[typing.Any, typing.Any, T]
+        ],
+    ) -> None:
+        self._factory = factory
+        self._task = asyncio.ensure_future(factory())
+        self._failed = False
+
+    def __await__(self) -> collections.abc.Generator[typing.Any, None, T]:
+        if self._failed:
+            self._task = asyncio.ensure_future(self._factory())
+            self._failed = False
+
+        task = self._task
+
+        try:
+            return (yield from asyncio.shield(task))
+        except BaseException:
+            if task is self._task and task.done():
+                self._failed = True
+
+            raise
+
+
+class AsyncProvider(injector.Provider[T]):
+    """
+    Async provider.
+
+    Provides an instance using a coroutine function. The provided value is a
+    :class:`Pending` awaitable that wrapped views await before they are called,
+    allowing independent dependencies to be built concurrently. The provider is typed
+    by the instance it builds, so it can be bound to the instance's interface.
+
+    :param func: coroutine function returning an instance
+    """
+
+    # pylint: disable=arguments-renamed
+
+    #: injection plans await values from this provider
+    awaitable: typing.ClassVar[bool] = True
+
+    def __init__(
+        self, func: collections.abc.Callable[..., collections.abc.Awaitable[T]]
+    ) -> None:
+        self._func = func
+
+    def get(self, container: injector.Injector) -> T:
+        # injection plans await the pending value before it reaches a consumer
+        return typing.cast(T, Pending(functools.partial(self._create, container)))
+
+    async def _create(self, container: injector.Injector) -> T:
+        plan = _plan(self._func, container)
+
+        return await self._func(**await plan.aresolve((), {}))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._func!r})"
+
+
+class ResourceProvider(injector.Provider[T]):
+    """
+    Resource provider.
+
+    Provides the value of a context manager that is exited when the current
+    :class:`~quart_injector.RequestScope` is torn down.
+
+    :param func: generator function, or callable returning a context manager
+    :param scope: request scope class the resource is bound in
+    """
+
+    # pylint: disable=arguments-renamed
+
+    def __init__(
+        self,
+        func: collections.abc.Callable[..., typing.Any],
+        scope: type[quart_injector.scope.RequestScope] = (
+            quart_injector.scope.RequestScope
+        ),
+    ) -> None:
+        self._func = func
+        self._manager: collections.abc.Callable[
+            ..., contextlib.AbstractContextManager[T]
+        ] = (
+            contextlib.contextmanager(func)
+            if inspect.isgeneratorfunction(func)
+            else func
+        )
+        self._scope = scope
+
+    def get(self, container: injector.Injector) -> T:
+        plan = _plan(self._func, container)
+        stack = contextlib.ExitStack()
+        value = stack.enter_context(self._manager(**plan.resolve((), {})))
+
+        container.get(self._scope).register(stack)
+
+        return value
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._func!r})"
+
+
+class AsyncResourceProvider(AsyncProvider[T]):
+    """
+    Async resource provider.
+
+    Provides the value of an async context manager that is exited when the current
+    :class:`~quart_injector.RequestScope` is torn down.
+
+    :param func: async generator function, or callable returning an async context
+        manager
+    :param scope: request scope class the resource is bound in
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(
+        self,
+        func: collections.abc.Callable[..., typing.Any],
+        scope: type[quart_injector.scope.RequestScope] = (
+            quart_injector.scope.RequestScope
+        ),
+    ) -> None:
+        super().__init__(func)
+
+        self._manager: collections.abc.Callable[
+            ..., contextlib.AbstractAsyncContextManager[T]
+        ] = (
+            contextlib.asynccontextmanager(func)
+            if inspect.isasyncgenfunction(func)
+            else func
+        )
+        self._scope = scope
+
+    async def _create(self, container: injector.Injector) -> T:
+        plan = _plan(self._func, container)
+        stack = contextlib.AsyncExitStack()
+        value = await stack.enter_async_context(
+            self._manager(**await plan.aresolve((), {}))
+        )
+
+        container.get(self._scope).register(stack)
+
+        return value
+
+
+class ContextProvider(injector.Provider[T]):
+    """
+    Context provider.
+
+    Provides the object behind one of quart's context locals, such as the current
+    request, rather than the proxy. Injection plans call the getter directly when
+    the binding is not scoped.
+
+    :param getter: zero argument callable returning the object for the current context
+    """
+
+    # pylint: disable=arguments-renamed,unused-argument
+
+    #: injection plans call the getter directly when the binding is not scoped
+    contextual: typing.ClassVar[bool] = True
+
+    def __init__(self, getter: collections.abc.Callable[[], T]) -> None:
+        self.getter = getter
+
+    def get(self, container: injector.Injector) -> T:
+        return self.getter()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.getter!r})"
+
+
+@injector.singleton
+class BlockingExecutor(concurrent.futures.ThreadPoolExecutor):
+    """
+    Blocking executor.
+
+    The thread pool :class:`BlockingProvider` instances run in, kept apart from the
+    event loop's default executor. :class:`~quart_injector.QuartModule` sizes it
+    using the ``INJECTOR_BLOCKING_MAX_WORKERS`` configuration value.
+    """
+
+
+class BlockingProvider(AsyncProvider[T]):
+    """
+    Blocking provider.
+
+    Provides an instance using a blocking function, which is called in the
+    :class:`BlockingExecutor` so it does not stall the event loop. Dependencies of
+    the function are resolved on the event loop first. Like an :class:`AsyncProvider`
+    the provided value is a :class:`Pending` awaitable.
+
+    :param func: blocking function returning an instance
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, func: collections.abc.Callable[..., T]) -> None:
+        super().__init__(typing.cast(typing.Any, func))
+
+        self._blocking = func
+
+    async def _create(self, container: injector.Injector) -> T:
+        plan = _plan(self._func, container)
+        kwargs = await plan.aresolve((), {})
+        context = contextvars.copy_context()
+
+        return await asyncio.get_running_loop().run_in_executor(
+            container.get(BlockingExecutor),
+            context.run,
+            functools.partial(self._blocking, **kwargs),
+        )
+
+
+def async_provider(func: F) -> F:
+    """
+    Async provider.
+
+    Like :func:`injector.provider` but for coroutine functions, the return annotation
+    is the interface the awaited result is bound to.
+
+    :param func: coroutine function
+
+    :return: provider function
+    """
+    if not inspect.iscoroutinefunction(func):
+        raise TypeError(f"{func.__qualname__} is not a coroutine function")
+
+    return injector.provider(func)
+
+
+def bind(
+    binder: injector.Binder,
+    interface: type[T],
+    to: (
+        collections.abc.Callable[..., collections.abc.Awaitable[T]]
+        | collections.abc.Callable[..., collections.abc.Iterator[T]]
+        | collections.abc.Callable[..., collections.abc.AsyncIterator[T]]
+    ),
+    scope: type[injector.Scope] | injector.ScopeDecorator | None = None,
+) -> None:
+    """
+    Bind.
+
+    Bind an interface to a coroutine, generator or async generator function, which
+    :func:`promote` turns into the matching provider. Like
+    :meth:`injector.Binder.bind`, but typed so type checkers accept functions that
+    build an instance of the interface rather than return one.
+
+    :param binder: binder to add the binding to
+    :param interface: interface to bind
+    :param to: coroutine, generator or async generator function providing an instance
+    :param scope: scope to bind the interface in
+    """
+    binder.bind(interface, to=typing.cast(typing.Any, to), scope=scope)
+
+
+def _promoted(binding: injector.Binding) -> injector.Provider[typing.Any] | None:
+    provider = binding.provider
+
+    if binding.is_multibinding() or not isinstance(provider, injector.CallableProvider):
+        return None
+
+    func = getattr(provider, "_callable")
+
+    if inspect.iscoroutinefunction(func):
+        return AsyncProvider(func)
+
+    if not inspect.isasyncgenfunction(func) and not inspect.isgeneratorfunction(func):
+        return None
+
+    scope = binding.scope
+
+    if not isinstance(scope, type) or not issubclass(
+        scope, quart_injector.scope.RequestScope
+    ):
+        raise RuntimeError(
+            f"{binding.interface!r} is provided by a generator so must be bound in "
+            "a RequestScope"
+        )
+
+    if inspect.isasyncgenfunction(func):
+        return AsyncResourceProvider(func, scope)
+
+    return ResourceProvider(func, scope)
+
+
+def _binders(container: injector.Injector) -> collections.abc.Iterator[injector.Binder]:
+    binder: injector.Binder | None = container.binder
+
+    while binder is not None:  # pylint: disable=while-used
+        yield binder
+        binder = binder.parent
+
+
+def _bindings(binder: injector.Binder) -> list[injector.Binding]:
+    return list(getattr(binder, "_bindings").values())
+
+
+def promote(container: injector.Injector) -> None:
+    """
+    Promote.
+
+    Rebind bindings to coroutine functions as an :class:`AsyncProvider`, and bindings
+    to generator functions as a :class:`ResourceProvider` or
+    :class:`AsyncResourceProvider`. Called by :func:`~quart_injector.wire`, containers
+    used with :func:`~quart_injector.wrap` directly should be promoted before
+    wrapping.
+
+    :param container: dependency injection container
+    :raises RuntimeError: if a generator function is not bound in a
+        :class:`~quart_injector.RequestScope`
+    """
+    for binder in _binders(container):
+        for binding in _bindings(binder):
+            provider = _promoted(binding)
+
+            if provider is not None:
+                binder.bind(binding.interface, to=provider, scope=binding.scope)
+
+
+def dependencies(provider: injector.Provider[typing.Any]) -> dict[str, typing.Any]:
+    """
+    Dependencies.
+
+    :param provider: provider to inspect
+
+    :return: injectable parameters of the class or callable the provider builds
+        instances with, or an empty dict if they cannot be determined
+    """
+    if isinstance(provider, injector.ClassProvider):
+        target = getattr(provider, "_cls").__init__
+    elif isinstance(provider, injector.CallableProvider):
+        target = getattr(provider, "_callable")
+    else:
+        return {}
+
+    try:
+        return injector.get_bindings(target)
+    except (NameError, TypeError):
+        return {}
+
+
+def check(container: injector.Injector) -> None:
+    """
+    Check.
+
+    Ensure no synchronous provider depends on an asynchronous binding, as it would
+    receive an awaitable rather than an instance, or on a
+    :class:`~quart_injector.Lazy` handle, which injector cannot provide.
+
+    :param container: dependency injection container
+    :raises RuntimeError: if a synchronous provider depends on an asynchronous binding
+        or a lazy handle
+    """
+    for binder in _binders(container):
+        for binding in _bindings(binder):
+            if getattr(binding.provider, "awaitable", False):
+                continue
+
+            for name, interface in dependencies(binding.provider).items():
+                if typing.get_origin(interface) is quart_injector.lazy.Lazy:
+                    raise RuntimeError(
+                        f"{binding.interface!r} cannot depend on {interface!r} for "
+                        f"{name!r}, lazy handles are only injected into views, hooks "
+                        "and async or resource providers"
+                    )
+
+                try:
+                    dependency, _ = binder.get_binding(interface)
+                except injector.Error:
+                    continue
+
+                if getattr(dependency.provider, "awaitable", False):
+                    raise RuntimeError(
+                        f"{binding.interface!r} cannot depend on asynchronous binding "
+                        f"{interface!r} for {name!r}, inject it into a view or an "
+                        "async provider instead"
+                    )
@@ -1,76 +1,794 @@
 """
-Request :class:`~injector.Scope`.
+Request, websocket, message and cached :class:`~injector.Scope`.
 """
-
+import asyncio
+import collections
+import collections.abc
+import contextlib
+import contextvars
+import dataclasses
+import logging
+import sys
+import threading
+import time
 import typing
+import warnings
 
 import injector
 import quart
-import werkzeug.local
+
+import quart_injector.instrument
 
 T = typing.TypeVar("T")
 
+_MISSING: typing.Any = object()
+
+Receive = collections.abc.Callable[[], collections.abc.Awaitable[typing.Any]]
+Send = collections.abc.Callable[[typing.Any], collections.abc.Awaitable[None]]
+ASGIApp = collections.abc.Callable[
+    [typing.Any, Receive, Send], collections.abc.Awaitable[None]
+]
+
+Manager = (
+    contextlib.AbstractContextManager[typing.Any]
+    | contextlib.AbstractAsyncContextManager[typing.Any]
+)
+
+
+class TeardownError(Exception):
+    """
+    Teardown error.
+
+    Raised when exiting one or more resources during scope teardown fails. The
+    functions and middleware :func:`~quart_injector.wire` activates scopes with log the
+    errors instead, as the response has already been sent.
+
+    :param errors: exceptions raised by the resources
+    """
+
+    def __init__(self, errors: list[Exception]) -> None:
+        super().__init__(f"{len(errors)} error(s) releasing scoped resources")
+
+        self.errors = errors
+
+
+def _log(logger: logging.Logger, error: TeardownError) -> None:
+    for ex in error.errors:
+        logger.error("Error releasing scoped resource", exc_info=ex)
+
+
+def _logger(container: injector.Injector) -> logging.Logger:
+    current: injector.Injector | None = container
+
+    # the application's logger, when bound by QuartModule
+    while current is not None:  # pylint: disable=while-used
+        if current.binder.has_explicit_binding_for(logging.Logger):
+            return container.get(logging.Logger)
+
+        current = current.parent
+
+    return logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class ScopeUsage:
+    """
+    Scope usage.
+
+    The instances held by the topmost item of a :class:`RequestScope`.
+
+    :param instances: number of instances held
+    :param size: estimated size of the instances in bytes, using
+        :func:`sys.getsizeof`, or ``None`` if the scope is not measuring sizes
+    """
+
+    instances: int
+    size: int | None
+
+
+class _Frame:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    __slots__ = (
+        "slots",
+        "managers",
+        "built",
+        "parent",
+        "count",
+        "size",
+        "sizes",
+        "owned",
+        "warned",
+        "children",
+    )
+
+    def __init__(self, size: int, parent: "_Frame | None") -> None:
+        self.slots: list[typing.Any] = [_MISSING] * size
+        self.managers: list[Manager] = []
+        self.built = 0
+        self.parent = parent
+        self.count = 0
+        self.size = 0
+        self.sizes: dict[int, int] = {}
+        self.owned: dict[int, list[Manager]] = {}
+        self.warned = False
+        self.children: dict[RequestScope, _Frame] = {}
+
+
+async def _exit(
+    managers: collections.abc.Sequence[Manager],
+    exception: BaseException | None,
+) -> list[Exception]:
+    errors: list[Exception] = []
+
+    exc_info = (
+        (type(exception), exception, exception.__traceback__)
+        if exception
+        else (None, None, None)
+    )
+
+    for manager in reversed(managers):
+        try:
+            if isinstance(manager, contextlib.AbstractAsyncContextManager):
+                await manager.__aexit__(*exc_info)
+            else:
+                manager.__exit__(*exc_info)
+        except Exception as ex:  # pylint: disable=broad-except
+            errors.append(ex)
+
+    return errors
+
+
+class _SlotProvider(injector.Provider[T]):
+    # pylint: disable=too-few-public-methods,arguments-renamed,protected-access
+
+    __slots__ = ("scope", "key", "index", "provider")
+
+    def __init__(
+        self,
+        scope: "RequestScope",
+        key: typing.Any,
+        index: int,
+        provider: injector.Provider[T],
+    ) -> None:
+        self.scope = scope
+        self.key = key
+        self.index = index
+        self.provider = provider
+
+    def get(self, container: injector.Injector) -> T:
+        frame = self.scope._top()
+        slots = frame.slots
+
+        try:
+            value = slots[self.index]
+        except IndexError:
+            slots.extend([_MISSING] * (self.index + 1 - len(slots)))
+            value = _MISSING
+
+        if value is _MISSING:
+            value = slots[self.index] = self._build(container)
+            frame.built += 1
+            frame.count += 1
+            self.scope._account(frame, self.index, value)
+
+        return typing.cast(T, value)
+
+    def _build(self, container: injector.Injector) -> T:
+        instrument = self.scope.instrument
+        token = self.scope._building.set(self.index)
+
+        try:
+            if instrument is None:
+                return self.provider.get(container)
+
+            start = time.perf_counter()
+            value = self.provider.get(container)
+            instrument.built(self.key, time.perf_counter() - start)
+
+            return value
+        finally:
+            self.scope._building.reset(token)
+
 
 class RequestScope(injector.Scope):
     """
     Request scope
 
     A :class:`~injector.Scope` that returns a per-request instance for a key.
+
+    Each key is assigned a slot the first time it is scoped, instances are stored in a
+    per-request list held in a :class:`~contextvars.ContextVar`. When ``instrument`` is
+    set to an :class:`~quart_injector.Instrument` it is told how long each instance
+    took to build.
+
+    The instances held are counted, and when ``measure`` is set their size is
+    estimated using :func:`sys.getsizeof`, which does not include the objects they
+    refer to. Holding more than ``max_instances`` instances, or more than ``max_size``
+    bytes, warns with a :class:`RuntimeWarning`, or raises a :class:`RuntimeError`
+    when ``strict`` is set. :func:`~quart_injector.wire` sets these from the
+    ``INJECTOR_SCOPE_MAX_INSTANCES``, ``INJECTOR_SCOPE_MAX_SIZE``,
+    ``INJECTOR_SCOPE_MEASURE`` and ``INJECTOR_SCOPE_STRICT`` configuration values.
+
+    Child injectors use a scope created with :meth:`child`, which is active along with
+    this one but assigns slots of its own, so they are dropped with the child.
     """
 
+    # pylint: disable=too-many-instance-attributes,protected-access
+
     def configure(self) -> None:
-        self._stack = werkzeug.local.LocalStack()
+        self._frame: contextvars.ContextVar[_Frame | None] = contextvars.ContextVar(
+            f"quart_injector.{type(self).__name__}", default=None
+        )
+        self._building: contextvars.ContextVar[int | None] = contextvars.ContextVar(
+            f"quart_injector.{type(self).__name__}.building", default=None
+        )
+        self._providers: dict[
+            tuple[typing.Any, injector.Provider[typing.Any]], _SlotProvider[typing.Any]
+        ] = {}
+        self.instrument: quart_injector.instrument.Instrument | None = None
+        self.max_instances: int | None = None
+        self.max_size: int | None = None
+        self.measure = False
+        self.strict = False
+        self._parent: RequestScope | None = None
+
+    def child(self, container: injector.Injector) -> "RequestScope":
+        """
+        Child.
+
+        Create a scope for a child injector's bindings. It is pushed, popped and torn
+        down along with this scope, and its instances are held by this scope's topmost
+        item, but its slots belong to the child scope and are dropped along with it.
+
+        :param container: child injector
+        :return: child scope
+        """
+        scope = type(self)(container)
+        scope._parent = self
+        scope.instrument = self.instrument
+        scope.max_instances = self.max_instances
+        scope.max_size = self.max_size
+        scope.measure = self.measure
+        scope.strict = self.strict
+
+        return scope
+
+    def _current(self) -> _Frame | None:
+        if self._parent is None:
+            return self._frame.get()
+
+        parent = self._parent._current()
+
+        if parent is None:
+            return None
+
+        try:
+            return parent.children[self]
+        except KeyError:
+            return parent.children.setdefault(self, _Frame(len(self._providers), None))
+
+    def _top(self) -> _Frame:
+        frame = self._current()
+
+        if frame is None:
+            raise RuntimeError(f"{type(self).__name__} is not active")
+
+        return frame
 
     def push(self) -> None:
         """
         Push new item onto stack.
         """
-        self._stack.push({})
+        if self._parent is not None:
+            self._parent.push()
+            return
+
+        self._frame.set(_Frame(len(self._providers), self._frame.get()))
 
     def pop(self) -> None:
         """
         Remove topmost item from stack.
         """
-        self._stack.pop()
+        if self._parent is not None:
+            self._parent.pop()
+            return
+
+        frame = self._frame.get()
+
+        if frame is not None:
+            self._frame.set(frame.parent)
+
+    def _account(self, frame: _Frame, index: int, value: typing.Any) -> None:
+        if self.measure or self.max_size is not None:
+            size = frame.sizes[index] = sys.getsizeof(value)
+            frame.size += size
+
+        if frame.warned:
+            return
+
+        if self.max_instances is not None and frame.count > self.max_instances:
+            limit = f"{frame.count} instances, more than {self.max_instances}"
+        elif self.max_size is not None and frame.size > self.max_size:
+            limit = f"{frame.size} bytes, more than {self.max_size}"
+        else:
+            return
+
+        description = f"{type(self).__name__} holds {limit}"
+
+        if self.strict:
+            raise RuntimeError(description)
+
+        frame.warned = True
+        warnings.warn(description, RuntimeWarning, stacklevel=2)
+
+    def usage(self) -> ScopeUsage:
+        """
+        Usage.
+
+        :return: instances held by the topmost item
+        :raises RuntimeError: if the scope is not active
+        """
+        frame = self._top()
+
+        return ScopeUsage(
+            frame.count,
+            frame.size if self.measure or self.max_size is not None else None,
+        )
+
+    async def release(self, key: typing.Any) -> None:
+        """
+        Release.
+
+        Drop the instance for a key held by the topmost item before it is torn down,
+        exiting any context managers registered while building it. The next time the
+        key is needed a new instance is built.
+
+        :param key: binding key of the instance
+        :raises RuntimeError: if the scope is not active
+        :raises TeardownError: if any of the context managers fail to exit
+        """
+        frame = self._top()
+        managers: list[Manager] = []
+
+        for provider in list(self._providers.values()):
+            index = provider.index
+
+            if (
+                provider.key != key
+                or index >= len(frame.slots)
+                or frame.slots[index] is _MISSING
+            ):
+                continue
+
+            frame.slots[index] = _MISSING
+            frame.count -= 1
+            frame.size -= frame.sizes.pop(index, 0)
+            managers.extend(frame.owned.pop(index, ()))
+
+        frame.managers = [
+            manager for manager in frame.managers if manager not in managers
+        ]
+
+        errors = await _exit(managers, None)
+
+        if errors:
+            raise TeardownError(errors)
+
+    def built(self) -> int:
+        """
+        Built.
+
+        :return: number of instances built for the topmost item, including those built
+            by the parent of a child scope, or ``0`` if the scope is not active
+        """
+        frame = self._current()
+        built = 0 if frame is None else frame.built
+
+        if self._parent is not None:
+            built += self._parent.built()
+
+        return built
+
+    def register(self, manager: Manager) -> None:
+        """
+        Register.
+
+        Register an entered context manager to be exited when the topmost item is torn
+        down.
+
+        :param manager: entered context manager or async context manager
+        """
+        frame = self._top()
+        frame.managers.append(manager)
+
+        index = self._building.get()
+
+        if index is not None:
+            frame.owned.setdefault(index, []).append(manager)
+
+    @contextlib.asynccontextmanager
+    async def activate(self) -> collections.abc.AsyncIterator[None]:
+        """
+        Activate.
+
+        Push a new item onto the stack for the duration of an ``async with`` block and
+        tear it down afterwards, passing on any exception raised inside the block.
+        """
+        self.push()
+
+        try:
+            yield
+        except BaseException as ex:
+            await self.teardown(ex)
+            raise
+
+        await self.teardown()
+
+    async def teardown(self, exception: BaseException | None = None) -> None:
+        """
+        Teardown.
+
+        Exit registered context managers in reverse order, then remove the topmost item
+        from the stack.
+
+        :param exception: exception that ended the request, if any
+        :raises TeardownError: if any of the context managers fail to exit
+        """
+        if self._parent is not None:
+            await self._parent.teardown(exception)
+            return
+
+        frame = self._top()
+        errors: list[Exception] = []
+
+        # child scopes' instances may depend on this scope's, so are exited first
+        for child in reversed(frame.children.values()):
+            errors.extend(await _exit(child.managers, exception))
+
+        errors.extend(await _exit(frame.managers, exception))
+
+        self.pop()
+
+        if errors:
+            raise TeardownError(errors)
 
     def get(self, key: type[T], provider: injector.Provider[T]) -> injector.Provider[T]:
         try:
-            return self._stack.top[key]
+            return self._providers[key, provider]
         except KeyError:
-            provider = injector.InstanceProvider(provider.get(self.injector))
+            with injector.lock:
+                return self._providers.setdefault(
+                    (key, provider),
+                    _SlotProvider(self, key, len(self._providers), provider),
+                )
+
+
+class WebsocketScope(RequestScope):
+    """
+    Websocket scope
 
-            self._stack.top[key] = provider
+    A :class:`RequestScope` that returns a per-connection instance for a key, only
+    active for websockets. Instances live as long as the connection.
+    """
+
+
+class MessageScope(RequestScope):
+    """
+    Message scope
+
+    A :class:`RequestScope` that is not activated automatically, intended to be
+    entered using :meth:`~RequestScope.activate` around the handling of each message
+    received by a websocket.
+    """
 
-            return provider
 
+class _Entry:  # pylint: disable=too-few-public-methods
+    __slots__ = ("value", "expires", "refreshing")
+
+    def __init__(self, value: typing.Any, expires: float) -> None:
+        self.value = value
+        self.expires = expires
+        self.refreshing = False
+
+
+class _CachedProvider(injector.Provider[T]):
+    # pylint: disable=too-few-public-methods,arguments-renamed,protected-access
+
+    __slots__ = ("scope", "key", "provider")
+
+    def __init__(
+        self,
+        scope: "CachedScope",
+        key: typing.Any,
+        provider: injector.Provider[T],
+    ) -> None:
+        self.scope = scope
+        self.key = key
+        self.provider = provider
+
+    def get(self, container: injector.Injector) -> T:
+        entry = self.scope._entry(self.key, self.provider)
+
+        if entry is None:
+            entry = self.scope._store(
+                self.key, self.provider, self.provider.get(container)
+            )
+        elif entry.expires <= time.monotonic() and not entry.refreshing:
+            entry = self.scope._refresh(self, entry, container)
+
+        return typing.cast(T, entry.value)
+
+
+class CachedScope(injector.Scope):
+    """
+    Cached scope
+
+    A :class:`~injector.Scope` that shares an instance for a key for ``ttl`` seconds,
+    keeping instances for at most ``maxsize`` keys. Once an instance has expired it is
+    still returned while a replacement is built in the background, synchronous
+    providers in the event loop's default executor, and swapped in once it is ready.
+    If building the replacement fails the failure is logged as a warning, to the
+    bound :class:`logging.Logger` if there is one, the expired instance is kept and
+    the next lookup tries again.
+
+    Use :func:`cached_scope` to create a scope with a different ``ttl`` or ``maxsize``.
+    """
+
+    #: seconds instances are shared for before they are refreshed
+    ttl: typing.ClassVar[float] = 60
+
+    #: maximum number of keys to keep instances for
+    maxsize: typing.ClassVar[int] = 128
+
+    def configure(self) -> None:
+        self._entries: collections.OrderedDict[
+            tuple[typing.Any, injector.Provider[typing.Any]], _Entry
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._tasks: set[asyncio.Future[typing.Any]] = set()
+        self._providers: dict[
+            tuple[typing.Any, injector.Provider[typing.Any]],
+            _CachedProvider[typing.Any],
+        ] = {}
+
+    def _entry(
+        self, key: typing.Any, provider: injector.Provider[typing.Any]
+    ) -> _Entry | None:
+        with self._lock:
+            entry = self._entries.get((key, provider))
+
+            if entry is not None:
+                self._entries.move_to_end((key, provider))
+
+            return entry
+
+    def _store(
+        self,
+        key: typing.Any,
+        provider: injector.Provider[typing.Any],
+        value: typing.Any,
+    ) -> _Entry:
+        with self._lock:
+            entry = self._entries[key, provider] = _Entry(
+                value, time.monotonic() + self.ttl
+            )
+            self._entries.move_to_end((key, provider))
+
+            while len(self._entries) > self.maxsize:  # pylint: disable=while-used
+                self._entries.popitem(last=False)
+
+            return entry
+
+    def _refresh(
+        self,
+        scoped: _CachedProvider[typing.Any],
+        entry: _Entry,
+        container: injector.Injector,
+    ) -> _Entry:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._store(
+                scoped.key, scoped.provider, scoped.provider.get(container)
+            )
+
+        entry.refreshing = True
+        task = asyncio.ensure_future(self._rebuild(loop, scoped, entry, container))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        return entry
+
+    async def _rebuild(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        scoped: _CachedProvider[typing.Any],
+        entry: _Entry,
+        container: injector.Injector,
+    ) -> None:
+        provider = scoped.provider
+
+        try:
+            if getattr(provider, "awaitable", False):
+                value = provider.get(container)
+                await value
+            else:
+                context = contextvars.copy_context()
+                value = await loop.run_in_executor(
+                    None, context.run, provider.get, container
+                )
+        except Exception as ex:  # pylint: disable=broad-except
+            entry.refreshing = False
+            _logger(container).warning(
+                "Failed to refresh %r, keeping the expired instance",
+                scoped.key,
+                exc_info=ex,
+            )
+            return
+
+        self._store(scoped.key, provider, value)
+
+    async def wait(self) -> None:
+        """
+        Wait.
+
+        Wait for the refreshes in progress to finish, for example before the
+        application shuts down.
+        """
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    def get(self, key: type[T], provider: injector.Provider[T]) -> injector.Provider[T]:
+        try:
+            return self._providers[key, provider]
+        except KeyError:
+            scoped = self._providers[key, provider] = _CachedProvider(
+                self, key, provider
+            )
+
+            return scoped
+
+
+def cached_scope(ttl: float, maxsize: int = 128) -> type[CachedScope]:
+    """
+    Cached scope.
+
+    Create a :class:`CachedScope` sharing instances for ``ttl`` seconds.
+
+    :param ttl: seconds instances are shared for before they are refreshed
+    :param maxsize: maximum number of keys to keep instances for
+
+    :return: scope class to bind in
+    """
+    return type(
+        f"CachedScope_{ttl:g}_{maxsize}",
+        (CachedScope,),
+        {"ttl": ttl, "maxsize": maxsize},
+    )
+
+
+#: scopes activated per request, connection or message, shared with child injectors
+SCOPES = (RequestScope, WebsocketScope, MessageScope)
 
 request = injector.ScopeDecorator(RequestScope)
+cached = injector.ScopeDecorator(CachedScope)
+websocket = injector.ScopeDecorator(WebsocketScope)
+message = injector.ScopeDecorator(MessageScope)
 
 
 def bind_scope(
-    scope_cls: type[injector.Scope],
+    scope_cls: type[RequestScope],
     app: quart.Quart,
     container: injector.Injector,
+    requests: bool = True,
+    websockets: bool = True,
 ) -> None:
     """
     Bind scope.
 
     Bind the request scope class to applications before/teardown functions for requests
-    and websockets.
+    and websockets. Errors exiting resources on teardown are logged to the
+    application's logger, as the response has already been sent.
 
     :param scope_cls: scope class to bind
     :param app: quart application
     :param container: dependency injection container
+    :param requests: whether to activate the scope for requests
+    :param websockets: whether to activate the scope for websockets
     """
 
     async def before_func() -> None:
         container.get(scope_cls).push()
 
-    async def teardown_func(_: BaseException | None) -> None:
-        container.get(scope_cls).pop()
+    async def teardown_func(exception: BaseException | None) -> None:
+        try:
+            await container.get(scope_cls).teardown(exception)
+        except TeardownError as ex:
+            _log(app.logger, ex)
+
+    if requests:
+        app.before_request_funcs[None].insert(0, before_func)
+        app.teardown_request_funcs[None].insert(0, teardown_func)
 
-    app.before_request_funcs[None].insert(0, before_func)
-    app.before_websocket_funcs[None].insert(0, before_func)
+    if websockets:
+        app.before_websocket_funcs[None].insert(0, before_func)
+        app.teardown_websocket_funcs[None].insert(0, teardown_func)
 
-    app.teardown_request_funcs[None].insert(0, teardown_func)
-    app.teardown_websocket_funcs[None].insert(0, teardown_func)
+
+class ScopeMiddleware:
+    """
+    Scope middleware.
+
+    ASGI middleware that pushes a scope around every HTTP request and websocket
+    connection, and tears it down once the application has finished with it. Errors
+    exiting resources on teardown are logged rather than raised.
+
+    :param asgi_app: ASGI application to wrap
+    :param request_scope: scope to push
+    :param types: ASGI connection scope types to push the scope for
+    :param logger: logger to log teardown errors to, defaults to this module's
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(
+        self,
+        asgi_app: ASGIApp,
+        request_scope: RequestScope,
+        types: collections.abc.Collection[str] = frozenset({"http", "websocket"}),
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.asgi_app = asgi_app
+        self.request_scope = request_scope
+        self.types = types
+        self.logger = logger or logging.getLogger(__name__)
+
+    async def __call__(
+        self,
+        scope: typing.Any,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        if scope["type"] not in self.types:
+            await self.asgi_app(scope, receive, send)
+            return
+
+        self.request_scope.push()
+
+        try:
+            await self.asgi_app(scope, receive, send)
+        except BaseException as ex:
+            await self._teardown(ex)
+            raise
+
+        await self._teardown(None)
+
+    async def _teardown(self, exception: BaseException | None) -> None:
+        try:
+            await self.request_scope.teardown(exception)
+        except TeardownError as ex:
+            _log(self.logger, ex)
+
+
+def bind_middleware(
+    scope_cls: type[RequestScope],
+    app: quart.Quart,
+    container: injector.Injector,
+    types: collections.abc.Collection[str] = frozenset({"http", "websocket"}),
+) -> None:
+    """
+    Bind middleware.
+
+    Bind the request scope class to the application using :class:`ScopeMiddleware`
+    instead of before/teardown functions.
+
+    :param scope_cls: scope class to bind
+    :param app: quart application
+    :param container: dependency injection container
+    :param types: ASGI connection scope types to push the scope for
+    """
+    app.asgi_app = ScopeMiddleware(  # type: ignore
+        app.asgi_app,
+        container.get(scope_cls),
+        types,
+        app.logger,
+    )
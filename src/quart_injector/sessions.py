@@ -0,0 +1,226 @@
+"""
+Session :class:`~injector.Scope`.
+"""
+import collections
+import functools
+import math
+import secrets
+import threading
+import time
+import typing
+
+import injector
+import quart
+
+T = typing.TypeVar("T")
+
+#: session key the session identifier is stored under
+SESSION_KEY = "_injector_session_id"
+
+
+@typing.runtime_checkable
+class SessionStore(typing.Protocol):
+    """
+    Session store.
+
+    Holds the instances of a :class:`SessionScope`, keyed by session identifier and
+    binding key. Bind an implementation to this interface to share instances between
+    processes, :class:`~quart_injector.QuartModule` binds a
+    :class:`MemorySessionStore` by default.
+    """
+
+    def get(self, session_id: str, key: typing.Any) -> typing.Any:
+        """
+        Get.
+
+        :param session_id: session identifier
+        :param key: binding key of the instance
+
+        :return: stored instance
+        :raises KeyError: if there is no instance stored, or it has expired
+        """
+
+    def set(self, session_id: str, key: typing.Any, value: typing.Any) -> None:
+        """
+        Set.
+
+        :param session_id: session identifier
+        :param key: binding key of the instance
+        :param value: instance to store
+        """
+
+    def clear(self, session_id: str) -> None:
+        """
+        Clear.
+
+        Remove every instance stored for a session.
+
+        :param session_id: session identifier
+        """
+
+
+class MemorySessionStore:
+    """
+    Memory session store.
+
+    An in-process :class:`SessionStore` keeping the instances of the most recently used
+    ``maxsize`` sessions, each instance expiring ``ttl`` seconds after it was stored.
+    :class:`~quart_injector.QuartModule` configures it using the
+    ``INJECTOR_SESSION_MAXSIZE`` and ``INJECTOR_SESSION_TTL`` configuration values.
+
+    :param maxsize: maximum number of sessions to keep instances for
+    :param ttl: seconds instances are kept for, or ``None`` to keep them until the
+        session is evicted
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = 3600) -> None:
+        self.maxsize = maxsize
+        self.ttl = math.inf if ttl is None else ttl
+        self._sessions: collections.OrderedDict[
+            str, dict[typing.Any, tuple[float, typing.Any]]
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str, key: typing.Any) -> typing.Any:
+        """
+        Get.
+
+        :param session_id: session identifier
+        :param key: binding key of the instance
+
+        :return: stored instance
+        :raises KeyError: if there is no instance stored, or it has expired
+        """
+        with self._lock:
+            entries = self._sessions[session_id]
+            self._sessions.move_to_end(session_id)
+            expires, value = entries[key]
+
+            if expires <= time.monotonic():
+                del entries[key]
+                raise KeyError(key)
+
+            return value
+
+    def set(self, session_id: str, key: typing.Any, value: typing.Any) -> None:
+        """
+        Set.
+
+        Store an instance, evicting the least recently used session if there are more
+        than ``maxsize``.
+
+        :param session_id: session identifier
+        :param key: binding key of the instance
+        :param value: instance to store
+        """
+        with self._lock:
+            entries = self._sessions.setdefault(session_id, {})
+            self._sessions.move_to_end(session_id)
+            entries[key] = (time.monotonic() + self.ttl, value)
+
+            while len(self._sessions) > self.maxsize:  # pylint: disable=while-used
+                self._sessions.popitem(last=False)
+
+    def clear(self, session_id: str) -> None:
+        """
+        Clear.
+
+        :param session_id: session identifier
+        """
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+
+class _SessionProvider(injector.Provider[T]):
+    # pylint: disable=too-few-public-methods,arguments-renamed
+
+    __slots__ = ("scope", "key", "provider")
+
+    def __init__(
+        self,
+        scope: "SessionScope",
+        key: typing.Any,
+        provider: injector.Provider[T],
+    ) -> None:
+        self.scope = scope
+        self.key = key
+        self.provider = provider
+
+    def get(self, container: injector.Injector) -> T:
+        session_id = self.scope.session_id()
+        store = self.scope.store
+
+        try:
+            return typing.cast(T, store.get(session_id, self.key))
+        except KeyError:
+            value = self.provider.get(container)
+            store.set(session_id, self.key, value)
+
+            return value
+
+
+class SessionScope(injector.Scope):
+    """
+    Session scope
+
+    A :class:`~injector.Scope` that returns a per-session instance for a key, kept in
+    the bound :class:`SessionStore` between requests of the same session.
+
+    Sessions are identified by a random identifier stored in the Quart session, so the
+    application must have a ``secret_key`` for the default session interface.
+    """
+
+    def configure(self) -> None:
+        self._providers: dict[
+            tuple[typing.Any, injector.Provider[typing.Any]],
+            _SessionProvider[typing.Any],
+        ] = {}
+
+    @functools.cached_property
+    def store(self) -> SessionStore:
+        """
+        The bound :class:`SessionStore`.
+        """
+        return self.injector.get(SessionStore)  # type: ignore[type-abstract]
+
+    def session_id(self) -> str:
+        """
+        Session identifier.
+
+        :return: identifier of the current session, assigning one if it has none
+        :raises RuntimeError: if there is no request or websocket context
+        """
+        if not quart.has_request_context() and not quart.has_websocket_context():
+            raise RuntimeError(f"{type(self).__name__} is not active")
+
+        session_id = quart.session.get(SESSION_KEY)
+
+        if session_id is None:
+            session_id = quart.session[SESSION_KEY] = secrets.token_urlsafe(16)
+
+        return typing.cast(str, session_id)
+
+    def clear(self) -> None:
+        """
+        Clear.
+
+        Remove every instance stored for the current session, so they are built again
+        the next time they are needed.
+
+        :raises RuntimeError: if there is no request or websocket context
+        """
+        self.store.clear(self.session_id())
+
+    def get(self, key: type[T], provider: injector.Provider[T]) -> injector.Provider[T]:
+        scoped = self._providers.get((key, provider))
+
+        if scoped is None:
+            with injector.lock:
+                scoped = self._providers.setdefault(
+                    (key, provider), _SessionProvider(self, key, provider)
+                )
+
+        return scoped
+
+
+session = injector.ScopeDecorator(SessionScope)
@@ -0,0 +1,191 @@
+"""
+Multi-tenant :class:`~injector.Injector` support.
+"""
+import collections
+import collections.abc
+import dataclasses
+import threading
+import time
+import typing
+
+import injector
+
+import quart_injector.provider
+import quart_injector.scope
+
+
+def child_injector(
+    parent: injector.Injector,
+    modules: (
+        injector._InstallableModuleType
+        | collections.abc.Iterable[injector._InstallableModuleType]
+    ),
+    root: injector.Injector,
+) -> injector.Injector:
+    """
+    Child injector.
+
+    Create a child injector with child scopes of the root injector's request,
+    websocket and message scopes, so they are activated along with the root's.
+
+    :param parent: injector to look up anything the child does not bind in
+    :param modules: configuration module or iterable of configuration modules
+    :param root: injector wired to the application
+
+    :return: child injector
+    """
+    child = parent.create_child_injector(modules)
+
+    for scope_cls in quart_injector.scope.SCOPES:
+        child.binder.bind(scope_cls, to=root.get(scope_cls).child(child))
+
+    quart_injector.provider.promote(child)
+
+    return child
+
+
+@dataclasses.dataclass(frozen=True)
+class Tenancy:
+    """
+    Tenancy.
+
+    Configuration for serving many tenants from one application, pass an instance to
+    :func:`~quart_injector.wire` to enable it.
+
+    :param resolver: function returning the current tenant, called during requests,
+        for example returning ``quart.request.host``
+    :param modules: function returning the configuration modules for a tenant
+    :param maxsize: maximum number of tenant injectors to keep
+    :param idle: seconds a tenant injector is kept without being used, or ``None``
+        to keep it until it is the least recently used of more than ``maxsize``
+    """
+
+    resolver: collections.abc.Callable[[], collections.abc.Hashable]
+    modules: collections.abc.Callable[
+        [typing.Any],
+        injector._InstallableModuleType
+        | collections.abc.Iterable[injector._InstallableModuleType],
+    ]
+    maxsize: int = 128
+    idle: float | None = None
+
+
+class _Tenant:  # pylint: disable=too-few-public-methods
+    __slots__ = ("used", "container", "wrappers")
+
+    def __init__(self, used: float, container: injector.Injector) -> None:
+        self.used = used
+        self.container = container
+        self.wrappers: dict[
+            collections.abc.Callable[..., typing.Any],
+            collections.abc.Callable[..., typing.Any],
+        ] = {}
+
+
+class TenantPool:
+    """
+    Tenant pool.
+
+    Child injectors of the application's injector, one per tenant, created when a
+    tenant is first seen. Evicting a tenant drops its injector along with the
+    singletons it built and the views and hooks wrapped for it.
+
+    :param container: injector wired to the application
+    :param tenancy: tenancy configuration
+    """
+
+    def __init__(self, container: injector.Injector, tenancy: Tenancy) -> None:
+        self.container = container
+        self.tenancy = tenancy
+        self._children: collections.OrderedDict[typing.Any, _Tenant] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._children)
+
+    def get(self, tenant: collections.abc.Hashable) -> injector.Injector:
+        """
+        Get.
+
+        :param tenant: tenant to get the injector for
+
+        :return: the tenant's injector, created if it does not exist
+        """
+        return self._tenant(tenant).container
+
+    def current(self) -> injector.Injector:
+        """
+        Current.
+
+        :return: injector of the tenant returned by the resolver
+        """
+        return self.get(self.tenancy.resolver())
+
+    def wrapper(
+        self,
+        func: collections.abc.Callable[..., typing.Any],
+        wrap: collections.abc.Callable[
+            [injector.Injector], collections.abc.Callable[..., typing.Any]
+        ],
+    ) -> collections.abc.Callable[..., typing.Any]:
+        """
+        Wrapper.
+
+        :param func: view function or hook to get the wrapper of
+        :param wrap: function wrapping it for an injector
+        :return: wrapper of the function for the injector of the tenant returned by
+            the resolver, kept until the tenant is evicted
+        """
+        tenant = self._tenant(self.tenancy.resolver())
+
+        try:
+            return tenant.wrappers[func]
+        except KeyError:
+            return tenant.wrappers.setdefault(func, wrap(tenant.container))
+
+    def _tenant(self, tenant: collections.abc.Hashable) -> _Tenant:
+        now = time.monotonic()
+        maxsize = self.tenancy.maxsize
+
+        with self._lock:
+            self._expire(now)
+
+            try:
+                entry = self._children.pop(tenant)
+                entry.used = now
+            except KeyError:
+                child = child_injector(
+                    self.container, self.tenancy.modules(tenant), self.container
+                )
+                quart_injector.provider.check(child)
+                entry = _Tenant(now, child)
+
+            self._children[tenant] = entry
+
+            while len(self._children) > maxsize:  # pylint: disable=while-used
+                self._children.popitem(last=False)
+
+            return entry
+
+    def evict(self, tenant: collections.abc.Hashable) -> None:
+        """
+        Evict.
+
+        Drop a tenant's injector, it is created again the next time it is needed.
+
+        :param tenant: tenant to evict
+        """
+        with self._lock:
+            self._children.pop(tenant, None)
+
+    def _expire(self, now: float) -> None:
+        if self.tenancy.idle is None:
+            return
+
+        for tenant, entry in list(self._children.items()):
+            if now - entry.used < self.tenancy.idle:
+                break
+
+            del self._children[tenant]
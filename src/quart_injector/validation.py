@@ -0,0 +1,220 @@
+"""
+Dependency graph validation.
+"""
+import collections.abc
+import inspect
+import typing
+
+import injector
+
+import quart_injector.lazy
+import quart_injector.provider
+import quart_injector.scope
+import quart_injector.sessions
+
+#: scopes that hold instances for longer than a request
+_LONG_LIVED = (
+    injector.SingletonScope,
+    quart_injector.scope.CachedScope,
+    quart_injector.sessions.SessionScope,
+)
+
+
+class ValidationError(RuntimeError):
+    """
+    Validation error.
+
+    Raised when the dependency graph of an application has one or more problems.
+
+    :param problems: descriptions of the problems found
+    """
+
+    def __init__(self, problems: list[str]) -> None:
+        super().__init__(
+            f"{len(problems)} problem(s) in the dependency graph:\n"
+            + "\n".join(f"  - {problem}" for problem in problems)
+        )
+
+        self.problems = problems
+
+
+def _name(value: typing.Any) -> str:
+    return getattr(value, "__qualname__", None) or repr(value)
+
+
+def _scope(binding: injector.Binding) -> typing.Any:
+    scope = binding.scope
+
+    return scope.scope if isinstance(scope, injector.ScopeDecorator) else scope
+
+
+def _abstract(provider: injector.Provider[typing.Any]) -> bool:
+    if not isinstance(provider, injector.ClassProvider):
+        return False
+
+    cls = getattr(provider, "_cls")
+
+    return inspect.isabstract(cls) or getattr(cls, "_is_protocol", False)
+
+
+def _long_lived(scope: typing.Any) -> bool:
+    return isinstance(scope, type) and issubclass(scope, _LONG_LIVED)
+
+
+def _unscoped(scope: typing.Any) -> bool:
+    return isinstance(scope, type) and issubclass(scope, injector.NoScope)
+
+
+def _request_lived(binding: injector.Binding, scope: typing.Any) -> str | None:
+    if isinstance(scope, type) and issubclass(scope, quart_injector.scope.RequestScope):
+        return f"bound in {_name(scope)}"
+
+    # unscoped context providers return an object of the current request context
+    if _unscoped(scope) and getattr(binding.provider, "contextual", False):
+        return "provided by the current request context"
+
+    return None
+
+
+#: nearest scoped binding key along a path and its scope
+_Holder = tuple[typing.Any, typing.Any] | None
+
+
+class _Walker:  # pylint: disable=too-few-public-methods
+    def __init__(self, container: injector.Injector) -> None:
+        self.container = container
+        self.seen: set[tuple[typing.Any, _Holder]] = set()
+        self.problems: list[str] = []
+
+    def _report(self, problem: str) -> None:
+        if problem not in self.problems:
+            self.problems.append(problem)
+
+    def _held(
+        self,
+        interface: typing.Any,
+        lifetime: str | None,
+        holder: tuple[typing.Any, typing.Any],
+        through: tuple[typing.Any, ...],
+    ) -> None:
+        if lifetime is None:
+            return
+
+        problem = (
+            f"{_name(holder[0])} bound in {_name(holder[1])} cannot depend on "
+            f"{_name(interface)} {lifetime}"
+        )
+
+        if through:
+            problem += f" through {' -> '.join(_name(item) for item in through)}"
+
+        self._report(problem)
+
+    def _lazy(self, interface: typing.Any, name: str, dependency: typing.Any) -> None:
+        if typing.get_origin(dependency) is not quart_injector.lazy.Lazy:
+            return
+
+        (target,) = typing.get_args(dependency)
+        self._report(
+            f"{_name(interface)} cannot depend on Lazy[{_name(target)}] for {name!r}, "
+            "lazy handles are only injected into views, hooks and async or resource "
+            "providers"
+        )
+
+    def visit(  # pylint: disable=too-many-arguments
+        self,
+        interface: typing.Any,
+        owner: typing.Any,
+        path: tuple[typing.Any, ...],
+        holder: _Holder = None,
+        through: tuple[typing.Any, ...] = (),
+    ) -> None:
+        """
+        Visit.
+
+        :param interface: binding key to check
+        :param owner: callable or binding key depending on the interface
+        :param path: binding keys depended on to reach the interface
+        :param holder: nearest scoped binding key on the path and its scope, which
+            holds on to the unscoped values built for it
+        :param through: unscoped binding keys between the holder and the interface
+        """
+        if typing.get_origin(interface) is quart_injector.lazy.Lazy:
+            # lazy dependencies are provided on first use, so may form cycles
+            (interface,) = typing.get_args(interface)
+            path = ()
+
+        if interface in path:
+            cycle = " -> ".join(_name(item) for item in (*path, interface))
+            self._report(f"dependency cycle {cycle}")
+            return
+
+        if (interface, holder) in self.seen:
+            return
+
+        self.seen.add((interface, holder))
+
+        try:
+            binding, _ = self.container.binder.get_binding(interface)
+        except injector.Error:
+            self._report(
+                f"no binding for {_name(interface)} required by {_name(owner)}"
+            )
+            return
+
+        scope = _scope(binding)
+
+        if holder is not None and _long_lived(holder[1]):
+            self._held(interface, _request_lived(binding, scope), holder, through)
+
+        if _abstract(binding.provider):
+            self._report(
+                f"cannot instantiate abstract {_name(interface)} required by "
+                f"{_name(owner)}, bind it to an implementation"
+            )
+
+        # unscoped values live as long as whatever holds on to them
+        if _unscoped(scope):
+            through = (*through, interface)
+        else:
+            holder, through = (interface, scope), ()
+
+        dependencies = quart_injector.provider.dependencies(binding.provider)
+
+        for name, dependency in dependencies.items():
+            self._lazy(interface, name, dependency)
+            self.visit(dependency, interface, (*path, interface), holder, through)
+
+
+def validate(
+    container: injector.Injector,
+    roots: collections.abc.Iterable[collections.abc.Callable[..., typing.Any]],
+) -> None:
+    """
+    Validate.
+
+    Resolve the dependency graph of each callable without building anything, looking
+    for missing bindings, abstract classes without a binding, cycles that are not
+    broken by a :class:`~quart_injector.Lazy` dependency, lazy dependencies of
+    providers injector builds, and singleton, cached or session scoped values
+    depending on request scoped values or objects of the current request context,
+    directly or through unscoped values. Every problem found is reported together.
+
+    :param container: dependency injection container
+    :param roots: view functions, hooks and class based view initialisers
+    :raises ValidationError: if any problems are found
+    """
+    walker = _Walker(container)
+
+    for root in roots:
+        try:
+            bindings = injector.get_bindings(root)
+        except (NameError, TypeError):
+            # annotations that cannot be resolved yet are left for injector
+            continue
+
+        for interface in bindings.values():
+            walker.visit(interface, root, ())
+
+    if walker.problems:
+        raise ValidationError(walker.problems)
@@ -2,31 +2,222 @@
 Wire up :class:`~quart.Quart` application to :class:`~injector.Injector` instance.
 """
 
-
+import asyncio
 import collections.abc
 import functools
 import inspect
+import time
 import typing
 
 import injector
 import quart
 import quart.views
 
+import quart_injector.body
+import quart_injector.instrument
+import quart_injector.lazy
 import quart_injector.module
+import quart_injector.plan
+import quart_injector.provider
 import quart_injector.scope
+import quart_injector.tenancy
+import quart_injector.validation
+
+V = typing.TypeVar("V", bound=type[quart.views.View])
+F = typing.TypeVar("F", bound=collections.abc.Callable[..., typing.Any])
+
+_WRAPPED = "__quart_injector_wrapped__"
+_MODULES = "__quart_injector_modules__"
+_BLUEPRINTS = "injector_blueprints"
+_TENANTS = "injector_tenants"
+
+_COLLECTIONS = (
+    "after_request_funcs",
+    "after_websocket_funcs",
+    "before_request_funcs",
+    "before_websocket_funcs",
+    "error_handler_spec",
+    "teardown_request_funcs",
+    "teardown_websocket_funcs",
+    "template_context_processors",
+)
+
+_HOOKS = (
+    "after_request",
+    "after_websocket",
+    "before_request",
+    "before_websocket",
+    "context_processor",
+    "teardown_request",
+    "teardown_websocket",
+)
+
+Containers = dict[str | None, injector.Injector]
+
+Resolve = collections.abc.Callable[
+    [tuple[typing.Any, ...], collections.abc.Mapping[str, typing.Any]],
+    collections.abc.Awaitable[dict[str, typing.Any]],
+]
+
+
+def reusable(cls: V) -> V:
+    """
+    Reusable.
+
+    Mark a class based view as stateless so a single instance is created and reused
+    for every request. All of the views dependencies must be singletons.
+
+    :param cls: class based view
+
+    :return: class based view
+    """
+    setattr(cls, "__reusable__", True)
+
+    return cls
+
+
+def inline(func: F) -> F:
+    """
+    Inline.
+
+    Mark a cheap synchronous view function or hook to be called directly on the event
+    loop, rather than in an executor. It must not block.
+
+    :param func: synchronous view function or hook
+
+    :return: view function or hook
+    """
+    setattr(func, "__inline__", True)
+
+    return func
+
+
+def _inlined(func: collections.abc.Callable[..., typing.Any]) -> bool:
+    return getattr(func, "__inline__", False) and not inspect.iscoroutinefunction(func)
+
+
+def _ensure_async(
+    app: quart.Quart,
+    func: collections.abc.Callable[..., typing.Any],
+) -> collections.abc.Callable[..., collections.abc.Awaitable[typing.Any]]:
+    if not _inlined(func):
+        return app.ensure_async(func)
+
+    async def inline_func(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        return func(*args, **kwargs)
+
+    return inline_func
+
+
+def _reuse(
+    cls: type[quart.views.View],
+    plan: quart_injector.plan.InjectionPlan,
+    factory: collections.abc.Callable[[], collections.abc.Awaitable[quart.views.View]],
+) -> collections.abc.Callable[[], collections.abc.Awaitable[quart.views.View]]:
+    for dependency in plan.dependencies:
+        if dependency.scope is None or not issubclass(
+            dependency.scope, injector.SingletonScope
+        ):
+            raise RuntimeError(
+                f"cannot reuse {cls.__name__} instances as {dependency.name!r} is not "
+                "bound as a singleton"
+            )
+
+    instance: list[quart.views.View] = []
+    lock = asyncio.Lock()
+
+    async def reuse() -> quart.views.View:
+        if not instance:
+            async with lock:
+                if not instance:
+                    instance.append(await factory())
+
+        return instance[0]
+
+    return reuse
+
+
+def _timed(
+    func: collections.abc.Callable[..., typing.Any],
+    plan: quart_injector.plan.InjectionPlan,
+    container: injector.Injector,
+    instrument: quart_injector.instrument.Instrument,
+) -> Resolve:
+    request_scope = container.get(quart_injector.scope.RequestScope)
+
+    async def aresolve(
+        args: tuple[typing.Any, ...],
+        kwargs: collections.abc.Mapping[str, typing.Any],
+    ) -> dict[str, typing.Any]:
+        built = request_scope.built()
+        start = time.perf_counter()
+        resolved = await plan.aresolve(args, kwargs)
+
+        instrument.resolved(
+            func, time.perf_counter() - start, request_scope.built() - built
+        )
+
+        return resolved
+
+    return aresolve
+
+
+def _view_factory(
+    cls: type[quart.views.View],
+    container: injector.Injector,
+    class_kwargs: dict[str, typing.Any],
+    instrument: quart_injector.instrument.Instrument | None,
+) -> collections.abc.Callable[[], collections.abc.Awaitable[quart.views.View]] | None:
+    init = cls.__init__
+    reuse = getattr(cls, "__reusable__", False)
+
+    try:
+        plan = quart_injector.plan.InjectionPlan.build(init, container, class_kwargs)
+    except NameError:
+        if reuse:
+            raise
+
+        # annotations that cannot be resolved yet are left for injector to deal with
+        async def fallback() -> quart.views.View:
+            return container.create_object(cls, class_kwargs)
+
+        return fallback
+
+    if not plan.dependencies and not reuse:
+        return None
+
+    aresolve = (
+        plan.aresolve
+        if instrument is None
+        else _timed(cls, plan, container, instrument)
+    )
+
+    async def factory() -> quart.views.View:
+        self = cls.__new__(cls)
+
+        init(self, **await aresolve((), class_kwargs), **class_kwargs)
+
+        return self
+
+    if reuse:
+        return _reuse(cls, plan, factory)
+
+    return factory
 
 
 def _wrap_view_class(
     view_func: collections.abc.Callable,
     app: quart.Quart,
     container: injector.Injector,
+    instrument: quart_injector.instrument.Instrument | None,
 ) -> collections.abc.Callable:
     cls: type[quart.views.View] = typing.cast(typing.Any, view_func).view_class
+    as_view = view_func
 
-    while getattr(view_func, "__wrapped__", None):  # pylint: disable=while-used
-        view_func = view_func.__wrapped__
+    while getattr(as_view, "__wrapped__", None):  # pylint: disable=while-used
+        as_view = as_view.__wrapped__
 
-    closure = inspect.getclosurevars(view_func)
+    closure = inspect.getclosurevars(as_view)
 
     if closure.nonlocals.get("class_args"):
         raise RuntimeError(
@@ -35,12 +226,15 @@ def _wrap_view_class(
 
     class_kwargs = closure.nonlocals["class_kwargs"]
 
-    async def view(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
-        self = container.create_object(cls, additional_kwargs=class_kwargs)
+    factory = _view_factory(cls, container, class_kwargs, instrument)
+
+    if factory is None:
+        return view_func
 
-        dispatch_request = app.ensure_async(self.dispatch_request)
+    dispatch_request = app.ensure_async(cls.dispatch_request)
 
-        return await dispatch_request(*args, **kwargs)
+    async def view(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        return await dispatch_request(await factory(), *args, **kwargs)
 
     if cls.decorators:
         view.__name__ = cls.__name__
@@ -62,64 +256,547 @@ def wrap(
     view_func: collections.abc.Callable,
     app: quart.Quart,
     container: injector.Injector,
+    instrument: quart_injector.instrument.Instrument | None = None,
 ) -> collections.abc.Callable:
     """
     Wrap
 
-    Wrap the given view function for dependency injection.
+    Wrap the given view function for dependency injection. Functions that have
+    already been wrapped, or that have no injectable parameters, are returned as
+    they are.
 
     :param view_func: view function or class based view
     :param app: quart application
     :param container: dependency injection container
+    :param instrument: instrument to report dependency resolution timings to
 
     :return: wrapped view function
     """
+    if hasattr(view_func, _WRAPPED):
+        return view_func
+
+    wrapped = _wrap(view_func, app, container, instrument)
+
+    if wrapped is not view_func:
+        setattr(wrapped, _WRAPPED, view_func)
+
+    return wrapped
+
+
+def _wrap_tenant(
+    view_func: collections.abc.Callable[..., typing.Any],
+    app: quart.Quart,
+    pool: quart_injector.tenancy.TenantPool,
+    instrument: quart_injector.instrument.Instrument | None,
+) -> collections.abc.Callable[..., typing.Any]:
+    if hasattr(view_func, _WRAPPED):
+        return view_func
+
+    # wrapping against the application's injector finds functions without
+    # injectable parameters, and any errors, before the first request
+    if _wrap(view_func, app, pool.container, instrument) is view_func:
+        return view_func
+
+    def wrap_for(
+        container: injector.Injector,
+    ) -> collections.abc.Callable[..., typing.Any]:
+        return _wrap(view_func, app, container, instrument)
+
+    # wrappers are kept by the pool, so are dropped when their tenant is evicted
+    @functools.wraps(view_func)
+    async def tenant_view(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        return await pool.wrapper(view_func, wrap_for)(*args, **kwargs)
+
+    setattr(tenant_view, _WRAPPED, view_func)
+
+    return tenant_view
+
+
+def _inject(
+    view_func: collections.abc.Callable[..., typing.Any],
+    app: quart.Quart,
+    container: injector.Injector,
+    instrument: quart_injector.instrument.Instrument | None,
+) -> collections.abc.Callable[..., typing.Any]:
+    pool = app.extensions.get(_TENANTS)
+
+    if pool is not None and container is pool.container:
+        return _wrap_tenant(view_func, app, pool, instrument)
+
+    return wrap(view_func, app, container, instrument)
+
+
+def _wrap(
+    view_func: collections.abc.Callable[..., typing.Any],
+    app: quart.Quart,
+    container: injector.Injector,
+    instrument: quart_injector.instrument.Instrument | None,
+) -> collections.abc.Callable[..., typing.Any]:
+    _bind_markers(container, _roots(view_func))
 
     if hasattr(view_func, "view_class"):
-        return _wrap_view_class(view_func, app, container)
+        return _wrap_view_class(view_func, app, container, instrument)
+
+    async_func = _ensure_async(app, view_func)
+
+    try:
+        plan = quart_injector.plan.InjectionPlan.build(view_func, container)
+    except NameError:
+        # annotations that cannot be resolved yet are left for injector to deal with
+        @functools.wraps(view_func)
+        async def fallback(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            return await container.call_with_injection(async_func, None, args, kwargs)
+
+        return fallback
+
+    # inline functions are still wrapped so quart does not run them in an executor
+    if not plan.dependencies and not _inlined(view_func):
+        return view_func
+
+    return _wrap_function(view_func, async_func, plan, container, instrument)
+
+
+def _wrap_function(
+    view_func: collections.abc.Callable[..., typing.Any],
+    async_func: collections.abc.Callable[..., collections.abc.Awaitable[typing.Any]],
+    plan: quart_injector.plan.InjectionPlan,
+    container: injector.Injector,
+    instrument: quart_injector.instrument.Instrument | None,
+) -> collections.abc.Callable[..., typing.Any]:
+    if instrument is not None:
+        aresolve = _timed(view_func, plan, container, instrument)
+
+        @functools.wraps(view_func)
+        async def timed_view(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            return await async_func(*args, **await aresolve(args, kwargs), **kwargs)
 
-    async_func = app.ensure_async(view_func)
+        return timed_view
+
+    if plan.awaitable:
+
+        @functools.wraps(view_func)
+        async def async_view(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            return await async_func(
+                *args, **await plan.aresolve(args, kwargs), **kwargs
+            )
+
+        return async_view
 
     @functools.wraps(view_func)
     async def view(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
-        return await container.call_with_injection(async_func, None, args, kwargs)
+        return await async_func(*args, **plan.resolve(args, kwargs), **kwargs)
 
     return view
 
 
+def install(
+    blueprint: quart.Blueprint,
+    modules: (
+        injector._InstallableModuleType
+        | collections.abc.Iterable[injector._InstallableModuleType]
+    ),
+) -> quart.Blueprint:
+    """
+    Install.
+
+    Attach configuration modules to a blueprint, so :func:`~quart_injector.wire`
+    builds a child injector from them for the blueprint's views and hooks. The child
+    has its own bindings and singletons, looks up anything it does not bind in the
+    injector of the parent blueprint or application, and shares their request
+    scopes. Blueprints nested in it use the same child unless they have modules of
+    their own.
+
+    :param blueprint: quart blueprint
+    :param modules: configuration module or iterable of configuration modules
+
+    :return: blueprint
+    """
+    if not isinstance(modules, collections.abc.Iterable):
+        modules = [modules]
+
+    if not hasattr(blueprint, _MODULES):
+        setattr(blueprint, _MODULES, [])
+
+    getattr(blueprint, _MODULES).extend(modules)
+
+    return blueprint
+
+
+def _blueprint(endpoint: str) -> str | None:
+    return endpoint.rpartition(".")[0] or None
+
+
+def _container(containers: Containers, name: str | None) -> injector.Injector:
+    while name not in containers:  # pylint: disable=while-used
+        name = _blueprint(typing.cast(str, name))
+
+    return containers[name]
+
+
+def _containers(app: quart.Quart) -> Containers:
+    return {None: app.extensions["injector"], **app.extensions[_BLUEPRINTS]}
+
+
+def _create_children(app: quart.Quart) -> None:
+    containers = _containers(app)
+
+    # parent blueprints are registered before the blueprints nested in them
+    for name, blueprint in app.blueprints.items():
+        modules = getattr(blueprint, _MODULES, None)
+
+        if not modules or name in containers:
+            continue
+
+        child = quart_injector.tenancy.child_injector(
+            _container(containers, _blueprint(name)), modules, containers[None]
+        )
+
+        containers[name] = app.extensions[_BLUEPRINTS][name] = child
+
+
 def _wire_collection(
     value: typing.Any,
     app: quart.Quart,
     container: injector.Injector,
+    instrument: quart_injector.instrument.Instrument | None,
 ) -> None:
     if isinstance(value, dict):
         for key, item in value.items():
             if isinstance(item, (list, dict)):
-                _wire_collection(item, app, container)
+                _wire_collection(item, app, container, instrument)
             else:
-                value[key] = wrap(item, app, container)
+                value[key] = _inject(item, app, container, instrument)
+
+    if isinstance(value, list):
+        value[:] = [_inject(item, app, container, instrument) for item in value]
+
+
+def _wire_hooks(
+    app: quart.Quart,
+    instrument: quart_injector.instrument.Instrument | None,
+) -> None:
+    containers = _containers(app)
+
+    for name in _COLLECTIONS:
+        for key, value in getattr(app, name).items():
+            _wire_collection(value, app, _container(containers, key), instrument)
+
+
+def _wire_views(
+    app: quart.Quart,
+    instrument: quart_injector.instrument.Instrument | None,
+) -> None:
+    containers = _containers(app)
+
+    for endpoint, view_func in app.view_functions.items():
+        app.view_functions[endpoint] = _inject(
+            view_func, app, _container(containers, _blueprint(endpoint)), instrument
+        )
+
+
+def _wire_hook(
+    register: collections.abc.Callable[[F], F],
+    inject: collections.abc.Callable[[F], F],
+) -> collections.abc.Callable[[F], F]:
+    @functools.wraps(register)
+    def hook(func: F) -> F:
+        register(inject(func))
+
+        return func
+
+    return hook
+
+
+def _wire_incrementally(
+    app: quart.Quart,
+    instrument: quart_injector.instrument.Instrument | None,
+) -> None:
+    container = app.extensions["injector"]
+
+    def inject(func: F) -> F:
+        return typing.cast(F, _inject(func, app, container, instrument))
+
+    add_url_rule = app.add_url_rule
+    register_blueprint = app.register_blueprint
+    register_error_handler = app.register_error_handler
+
+    @functools.wraps(add_url_rule)
+    def wire_url_rule(
+        rule: str,
+        endpoint: str | None = None,
+        view_func: collections.abc.Callable[..., typing.Any] | None = None,
+        provide_automatic_options: bool | None = None,
+        **kwargs: typing.Any,
+    ) -> None:
+        if view_func is None:
+            add_url_rule(rule, endpoint, view_func, provide_automatic_options, **kwargs)
+            return
+
+        endpoint = endpoint or view_func.__name__
+        existing = app.view_functions.get(endpoint)
+
+        # re-registering a function must pass its wrapper, as quart refuses to
+        # replace an endpoint's view function
+        if getattr(existing, _WRAPPED, None) is view_func:
+            view_func = existing
+
+        add_url_rule(rule, endpoint, view_func, provide_automatic_options, **kwargs)
+
+        # blueprints are added to the application before their views
+        _create_children(app)
+
+        app.view_functions[endpoint] = _inject(
+            app.view_functions[endpoint],
+            app,
+            _container(_containers(app), _blueprint(endpoint)),
+            instrument,
+        )
+
+    @functools.wraps(register_blueprint)
+    def wire_blueprint(blueprint: quart.Blueprint, **options: typing.Any) -> None:
+        register_blueprint(blueprint, **options)
+
+        # blueprint views are added through add_url_rule, only hooks need wiring
+        _wire_hooks(app, instrument)
+
+    @functools.wraps(register_error_handler)
+    def wire_error_handler(
+        error: type[Exception] | int,
+        func: collections.abc.Callable[..., typing.Any],
+    ) -> None:
+        register_error_handler(error, inject(func))
+
+    setattr(app, "add_url_rule", wire_url_rule)
+    setattr(app, "register_blueprint", wire_blueprint)
+    setattr(app, "register_error_handler", wire_error_handler)
+
+    for name in _HOOKS:
+        setattr(app, name, _wire_hook(getattr(app, name), inject))
+
+
+def _roots(value: typing.Any) -> collections.abc.Iterator[typing.Any]:
+    if isinstance(value, dict):
+        value = list(value.values())
 
     if isinstance(value, list):
-        value[:] = [wrap(item, app, container) for item in value]
+        for item in value:
+            yield from _roots(item)
+        return
+
+    func = getattr(value, _WRAPPED, value)
+    cls = getattr(func, "view_class", None)
+
+    yield func if cls is None else cls.__init__
+
+
+def _app_roots(app: quart.Quart) -> dict[injector.Injector, list[typing.Any]]:
+    containers = _containers(app)
+    roots: dict[injector.Injector, list[typing.Any]] = {
+        container: [] for container in containers.values()
+    }
+
+    for name in _COLLECTIONS:
+        for key, value in getattr(app, name).items():
+            roots[_container(containers, key)].extend(_roots(value))
+
+    for endpoint, view_func in app.view_functions.items():
+        roots[_container(containers, _blueprint(endpoint))].extend(_roots(view_func))
+
+    return roots
+
+
+def _graph(
+    container: injector.Injector,
+    roots: collections.abc.Iterable[typing.Any],
+    follow_lazy: bool,
+) -> collections.abc.Iterator[tuple[typing.Any, injector.Binding]]:
+    pending: list[typing.Any] = []
+    seen: set[typing.Any] = set()
+
+    for root in roots:
+        try:
+            pending.extend(injector.get_bindings(root).values())
+        except (NameError, TypeError):
+            continue
+
+    while pending:  # pylint: disable=while-used
+        interface = pending.pop()
+
+        if interface in seen:
+            continue
+
+        seen.add(interface)
+
+        if typing.get_origin(interface) is quart_injector.lazy.Lazy:
+            if follow_lazy:
+                pending.extend(typing.get_args(interface))
+
+            continue
+
+        # markers deeper in the graph are resolved by injector, not a plan
+        quart_injector.body.bind(container.binder, interface)
+
+        try:
+            binding, _ = container.binder.get_binding(interface)
+        except injector.Error:
+            continue
 
+        yield interface, binding
 
-def wire(
+        pending.extend(quart_injector.provider.dependencies(binding.provider).values())
+
+
+def _bind_markers(
+    container: injector.Injector,
+    roots: collections.abc.Iterable[typing.Any],
+) -> None:
+    # walking the graph binds every marker found in it
+    for _ in _graph(container, roots, follow_lazy=True):
+        pass
+
+
+def _singletons(
+    container: injector.Injector,
+    roots: collections.abc.Iterable[typing.Any],
+) -> dict[typing.Any, injector.Binding]:
+    result: dict[typing.Any, injector.Binding] = {}
+
+    for interface, binding in _graph(container, roots, follow_lazy=False):
+        scope = binding.scope
+
+        if isinstance(scope, injector.ScopeDecorator):
+            scope = scope.scope
+
+        if isinstance(scope, type) and issubclass(scope, injector.SingletonScope):
+            result[interface] = binding
+
+    return result
+
+
+async def warm_up(
+    app: quart.Quart,
+    instrument: quart_injector.instrument.Instrument | None = None,
+) -> dict[typing.Any, float]:
+    """
+    Warm up.
+
+    Build the singletons the application's view functions, hooks and class based views
+    depend on, directly or through other bindings, so the first requests do not pay
+    for building them. Asynchronous singletons are built concurrently, dependencies
+    wrapped in :class:`~quart_injector.Lazy` are left to be built when first used.
+    Build times are logged to the application's logger at debug level, and reported
+    to the instrument if given. Singletons of blueprints with modules attached using
+    :func:`install` are built by the blueprint's child injector.
+
+    :param app: quart application wired using :func:`~quart_injector.wire`
+    :param instrument: instrument to report build times to
+
+    :return: seconds taken to build each singleton, keyed by interface
+    """
+    timings: dict[typing.Any, float] = {}
+    awaiting: list[collections.abc.Awaitable[None]] = []
+
+    async def wait(interface: typing.Any, value: typing.Any, start: float) -> None:
+        await value
+        timings[interface] = time.perf_counter() - start
+
+    for container, roots in _app_roots(app).items():
+        singletons = _singletons(container, roots)
+
+        # dependencies are found after their dependents, build them first
+        for interface, binding in reversed(singletons.items()):
+            start = time.perf_counter()
+            value = container.get(interface)
+
+            if getattr(binding.provider, "awaitable", False):
+                awaiting.append(wait(interface, value, start))
+            else:
+                timings[interface] = time.perf_counter() - start
+
+    await asyncio.gather(*awaiting)
+
+    for interface, duration in timings.items():
+        app.logger.debug("built %r in %.6fs", interface, duration)
+
+        if instrument is not None:
+            instrument.built(interface, duration)
+
+    return timings
+
+
+def _configure_scope(
+    scope: quart_injector.scope.RequestScope,
+    config: quart.Config,
+    instrument: quart_injector.instrument.Instrument | None,
+) -> None:
+    scope.instrument = instrument
+    scope.max_instances = config.get("INJECTOR_SCOPE_MAX_INSTANCES")
+    scope.max_size = config.get("INJECTOR_SCOPE_MAX_SIZE")
+    scope.measure = bool(config.get("INJECTOR_SCOPE_MEASURE", False))
+    scope.strict = bool(config.get("INJECTOR_SCOPE_STRICT", False))
+
+
+def _bind_scopes(
+    app: quart.Quart,
+    container: injector.Injector,
+    middleware: bool,
+) -> None:
+    if middleware:
+        quart_injector.scope.bind_middleware(
+            quart_injector.scope.RequestScope, app, container
+        )
+        quart_injector.scope.bind_middleware(
+            quart_injector.scope.WebsocketScope, app, container, {"websocket"}
+        )
+    else:
+        quart_injector.scope.bind_scope(
+            quart_injector.scope.RequestScope, app, container
+        )
+        quart_injector.scope.bind_scope(
+            quart_injector.scope.WebsocketScope, app, container, requests=False
+        )
+
+
+def wire(  # pylint: disable=too-many-arguments
     app: quart.Quart,
-    modules: injector._InstallableModuleType
-    | collections.abc.Iterable[injector._InstallableModuleType]
-    | None = None,
+    modules: (
+        injector._InstallableModuleType
+        | collections.abc.Iterable[injector._InstallableModuleType]
+        | None
+    ) = None,
     auto_bind: bool = True,
     parent: injector.Injector | None = None,
+    middleware: bool = False,
+    instrument: quart_injector.instrument.Instrument | None = None,
+    incremental: bool = False,
+    warm: bool = False,
+    validate: bool = False,
+    tenancy: quart_injector.tenancy.Tenancy | None = None,
 ) -> None:
     """
     Wire.
 
     Wire up a dependency injection container to the given application.
 
+    Blueprints with modules attached using :func:`install` get a child injector,
+    available from ``app.extensions["injector_blueprints"]`` by blueprint name.
+
     :param app: quart application
     :param modules: configuration module or iterable of configuration modules
     :param auto_bind: whether to automatically bind missing types
     :param parent: dependency injection container
+    :param middleware: whether to activate the request and websocket scopes using
+        ASGI middleware rather than before/teardown functions
+    :param instrument: instrument to report dependency resolution timings to
+    :param incremental: whether to also wire views, hooks and blueprints registered
+        after wiring
+    :param warm: whether to build the singletons views depend on before the
+        application starts serving, see :func:`warm_up`
+    :param validate: whether to check the dependency graphs of views and hooks for
+        missing bindings, cycles and scope mismatches, raising a
+        :class:`~quart_injector.ValidationError` listing every problem found
+    :param tenancy: tenancy configuration, injecting views and hooks from a child
+        injector per tenant, available from ``app.extensions["injector_tenants"]``
     """
     if not modules:
         modules = []
@@ -132,15 +809,34 @@ def wire(
     container = injector.Injector(modules, auto_bind, parent)
 
     app.extensions["injector"] = container
+    app.extensions[_BLUEPRINTS] = {}
+
+    quart_injector.provider.promote(container)
+
+    for scope_cls in quart_injector.scope.SCOPES:
+        _configure_scope(container.get(scope_cls), app.config, instrument)
+
+    if tenancy is not None:
+        app.extensions[_TENANTS] = quart_injector.tenancy.TenantPool(container, tenancy)
+
+    _create_children(app)
+    _wire_hooks(app, instrument)
+    _wire_views(app, instrument)
+
+    for child, roots in _app_roots(app).items():
+        # validation reports problems check would stop at one by one
+        if validate:
+            quart_injector.validation.validate(child, roots)
+
+        quart_injector.provider.check(child)
+
+    if incremental:
+        _wire_incrementally(app, instrument)
+
+    if warm:
+
+        @app.before_serving
+        async def _() -> None:
+            await warm_up(app, instrument)
 
-    _wire_collection(app.after_request_funcs, app, container)
-    _wire_collection(app.after_websocket_funcs, app, container)
-    _wire_collection(app.before_request_funcs, app, container)
-    _wire_collection(app.before_websocket_funcs, app, container)
-    _wire_collection(app.error_handler_spec, app, container)
-    _wire_collection(app.teardown_request_funcs, app, container)
-    _wire_collection(app.teardown_websocket_funcs, app, container)
-    _wire_collection(app.template_context_processors, app, container)
-    _wire_collection(app.view_functions, app, container)
-
-    quart_injector.scope.bind_scope(quart_injector.scope.RequestScope, app, container)
+    _bind_scopes(app, container, middleware)
@@ -0,0 +1,60 @@
+"""
+Helpers shared by the tests.
+"""
+import collections.abc
+import typing
+
+import injector
+
+import quart_injector
+import quart_injector.provider
+
+T = typing.TypeVar("T")
+
+Provide = (
+    collections.abc.Callable[[], collections.abc.Awaitable[T]]
+    | collections.abc.Callable[[], collections.abc.Iterator[T]]
+    | collections.abc.Callable[[], collections.abc.AsyncIterator[T]]
+)
+
+
+def module(
+    interface: type[T],
+    provide: Provide[T],
+    scope: type[injector.Scope] | injector.ScopeDecorator | None = None,
+) -> collections.abc.Callable[[injector.Binder], None]:
+    """
+    Module.
+
+    :param interface: interface to bind
+    :param provide: coroutine, generator or async generator function to bind it to
+    :param scope: scope to bind the interface in
+
+    :return: configuration module binding the interface
+    """
+
+    def configure(binder: injector.Binder) -> None:
+        quart_injector.bind(binder, interface, provide, scope=scope)
+
+    return configure
+
+
+def container(
+    interface: type[T],
+    provide: Provide[T],
+    scope: type[injector.Scope] | injector.ScopeDecorator | None = None,
+) -> injector.Injector:
+    """
+    Container.
+
+    :param interface: interface to bind
+    :param provide: coroutine, generator or async generator function to bind it to
+    :param scope: scope to bind the interface in
+
+    :return: promoted container with the interface bound
+    """
+    result = injector.Injector(module(interface, provide, scope))
+
+    quart_injector.provider.promote(result)
+
+    return result
@@ -0,0 +1,57 @@
+"""
+Tests for :func:`~quart_injector.scope.bind_scope`.
+"""
+import collections.abc
+
+import injector
+import pytest
+import quart
+
+import quart_injector
+
+import tests.helpers
+
+
+class EmptyClass:  # pylint: disable=too-few-public-methods
+    """
+    Empty class.
+    """
+
+
+class CustomError(Exception):
+    """
+    Custom error.
+    """
+
+
+@pytest.mark.asyncio
+async def test_it_should_log_errors_releasing_resources(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """
+    it should log errors releasing request scoped resources rather than raise them
+    """
+    app = quart.Quart(__name__)
+    error = CustomError("exit")
+
+    async def provide() -> collections.abc.AsyncIterator[EmptyClass]:
+        yield EmptyClass()
+        raise error
+
+    @app.route("/test")
+    async def _(empty: injector.Inject[EmptyClass]) -> quart.Response:
+        assert isinstance(empty, EmptyClass)
+
+        return quart.Response(b"content here")
+
+    quart_injector.wire(
+        app,
+        tests.helpers.module(EmptyClass, provide, quart_injector.RequestScope),
+    )
+
+    response = await app.test_client().get("/test")
+
+    assert response.status_code == 200
+    assert [record.exc_info[1] for record in caplog.records if record.exc_info] == [
+        error
+    ]
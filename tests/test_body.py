@@ -0,0 +1,315 @@
+"""
+Tests for :class:`~quart_injector.JsonBody` and :class:`~quart_injector.Query`.
+"""
+import dataclasses
+import typing
+
+import injector
+import pytest
+import quart
+import quart.json.provider
+import quart.wrappers
+import werkzeug.exceptions
+
+import quart_injector
+
+
+@dataclasses.dataclass
+class Item:
+    """
+    Item.
+
+    :param name: name of the item
+    :param quantity: number of items
+    """
+
+    name: str
+    quantity: int = 1
+
+
+@dataclasses.dataclass
+class Page:
+    """
+    Page.
+
+    :param page: page number, as passed in the query string
+    """
+
+    page: str
+
+
+class CountingProvider(quart.json.provider.DefaultJSONProvider):
+    """
+    Counting provider.
+
+    A JSON provider recording what it parses.
+    """
+
+    parsed: list[typing.Any] = []
+
+    def loads(self, object_: str | bytes, **kwargs: typing.Any) -> typing.Any:
+        self.parsed.append(object_)
+
+        return super().loads(object_, **kwargs)
+
+
+def factory(items: list[Item]) -> quart.Quart:
+    """
+    Factory.
+
+    Create an application with a hook and view both injected with the body.
+
+    :param items: list to record the injected items in
+    """
+    app = quart.Quart(__name__)
+    app.json = CountingProvider(app)
+
+    @app.before_request  # type: ignore
+    async def before(item: injector.Inject[quart_injector.JsonBody[Item]]) -> None:
+        items.append(item)
+
+    @app.route("/", methods=["POST"])
+    async def _(item: injector.Inject[quart_injector.JsonBody[Item]]) -> quart.Response:
+        items.append(item)
+
+        return quart.Response(item.name.encode())
+
+    quart_injector.wire(app)
+
+    return app
+
+
+@pytest.fixture(autouse=True)
+def clear() -> None:
+    """
+    Clear the bodies parsed.
+    """
+    CountingProvider.parsed.clear()
+
+
+@pytest.mark.asyncio
+async def test_it_should_parse_the_body_once_per_request() -> None:
+    """
+    it should parse and convert the body once, sharing it between hooks and the view
+    """
+    items: list[Item] = []
+    app = factory(items)
+
+    response = await app.test_client().post("/", json={"name": "apple"})
+
+    assert response.status_code == 200
+    assert items == [Item("apple"), Item("apple")]
+    assert items[0] is items[1]
+    assert CountingProvider.parsed == [b'{"name": "apple"}']
+
+
+@pytest.mark.asyncio
+async def test_it_should_reject_bodies_that_are_not_json() -> None:
+    """
+    it should reject requests without a JSON body
+    """
+    app = factory([])
+
+    response = await app.test_client().post("/", data="name=apple")
+
+    assert response.status_code == 415
+
+
+@pytest.mark.asyncio
+async def test_it_should_reject_bodies_that_cannot_be_converted() -> None:
+    """
+    it should reject bodies that cannot be converted to the model
+    """
+    app = factory([])
+
+    response = await app.test_client().post("/", json={"colour": "red"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_it_should_inject_the_parsed_json_as_it_is() -> None:
+    """
+    it should inject the parsed JSON as it is for dict models
+    """
+    app = quart.Quart(__name__)
+    bodies: list[dict[str, typing.Any]] = []
+
+    @app.route("/", methods=["POST"])
+    async def _(
+        body: injector.Inject[quart_injector.JsonBody[dict[str, typing.Any]]],
+    ) -> quart.Response:
+        bodies.append(body)
+
+        return quart.Response(b"content here")
+
+    quart_injector.wire(app)
+
+    await app.test_client().post("/", json={"name": "apple"})
+
+    assert bodies == [{"name": "apple"}]
+
+
+@pytest.mark.asyncio
+async def test_it_should_inject_the_query_string() -> None:
+    """
+    it should convert the query string to the model
+    """
+    app = quart.Quart(__name__)
+    pages: list[Page] = []
+
+    @app.route("/")
+    async def _(page: injector.Inject[quart_injector.Query[Page]]) -> quart.Response:
+        pages.append(page)
+
+        return quart.Response(b"content here")
+
+    quart_injector.wire(app)
+
+    await app.test_client().get("/?page=2&page=3")
+
+    assert pages == [Page("2")]
+
+
+def stream_factory(chunks: list[bytes]) -> quart.Quart:
+    """
+    Stream factory.
+
+    Create an application with a view reading the body as a stream.
+
+    :param chunks: list to record the chunks read in
+    """
+    app = quart.Quart(__name__)
+    app.config["INJECTOR_BODY_MAX_SIZE"] = 10
+    app.config["INJECTOR_BODY_CHUNK_SIZE"] = 4
+
+    @app.route("/", methods=["POST"])
+    async def _(stream: injector.Inject[quart_injector.BodyStream]) -> quart.Response:
+        async for chunk in stream:
+            chunks.append(chunk)
+
+        return quart.Response(b"content here")
+
+    quart_injector.wire(app)
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_it_should_stream_the_body_in_chunks() -> None:
+    """
+    it should stream the body in chunks no larger than the chunk size
+    """
+    chunks: list[bytes] = []
+    app = stream_factory(chunks)
+
+    response = await app.test_client().post("/", data=b"0123456789")
+
+    assert response.status_code == 200
+    assert chunks == [b"0123", b"4567", b"89"]
+
+
+@pytest.mark.asyncio
+async def test_it_should_reject_bodies_over_the_maximum_size() -> None:
+    """
+    it should reject bodies larger than the maximum size
+    """
+    chunks: list[bytes] = []
+    app = stream_factory(chunks)
+
+    response = await app.test_client().post("/", data=b"0123456789a")
+
+    assert response.status_code == 413
+    assert not chunks
+
+
+@pytest.mark.asyncio
+async def test_it_should_only_stream_the_body_once() -> None:
+    """
+    it should refuse to stream the body a second time
+    """
+    body = quart.wrappers.Body(None, None)
+    body.set_result(b"content here")
+    stream = quart_injector.BodyStream(body)
+
+    assert [chunk async for chunk in stream] == [b"content here"]
+
+    with pytest.raises(RuntimeError, match="already been consumed"):
+        aiter(stream)
+
+
+@pytest.mark.asyncio
+async def test_it_should_enforce_the_maximum_size_while_reading() -> None:
+    """
+    it should stop reading once more than the maximum size has been received
+    """
+    body = quart.wrappers.Body(None, None)
+    body.set_result(b"content here")
+    stream = quart_injector.BodyStream(body, max_size=4)
+
+    with pytest.raises(werkzeug.exceptions.RequestEntityTooLarge):
+        async for _ in stream:
+            pass  # pragma: no cover
+
+
+class Search:  # pylint: disable=too-few-public-methods
+    """
+    Search.
+
+    A class depending on the query string.
+
+    :param page: page requested
+    """
+
+    @injector.inject
+    def __init__(self, page: quart_injector.Query[Page]) -> None:
+        self.page = page
+
+
+class Order:  # pylint: disable=too-few-public-methods
+    """
+    Order.
+
+    A class depending on the body, which it cannot await.
+
+    :param item: item ordered
+    """
+
+    @injector.inject
+    def __init__(self, item: quart_injector.JsonBody[Item]) -> None:
+        self.item = item
+
+
+@pytest.mark.asyncio
+async def test_it_should_inject_markers_into_providers() -> None:
+    """
+    it should bind markers that views only depend on through other providers
+    """
+    app = quart.Quart(__name__)
+    searches: list[Search] = []
+
+    @app.route("/")
+    async def _(search: injector.Inject[Search]) -> quart.Response:
+        searches.append(search)
+
+        return quart.Response(b"content here")
+
+    quart_injector.wire(app)
+
+    await app.test_client().get("/?page=2")
+
+    assert searches[0].page == Page("2")
+
+
+def test_it_should_reject_synchronous_consumers_of_the_body() -> None:
+    """
+    it should reject providers that cannot await the body they depend on
+    """
+    app = quart.Quart(__name__)
+
+    @app.route("/", methods=["POST"])
+    async def _(order: injector.Inject[Order]) -> quart.Response:
+        return quart.Response(order.item.name.encode())
+
+    with pytest.raises(RuntimeError, match="Order"):
+        quart_injector.wire(app)
@@ -0,0 +1,181 @@
+"""
+Tests for :class:`~quart_injector.CachedScope`.
+"""
+import itertools
+import logging
+
+import injector
+import pytest
+
+import quart_injector
+
+
+class Counter:  # pylint: disable=too-few-public-methods
+    """
+    Counter.
+
+    Counts the number of instances built.
+
+    :param error: whether building the next instance should fail
+    """
+
+    def __init__(self) -> None:
+        self.count = itertools.count(1)
+        self.error = False
+
+    def build(self) -> int:
+        """
+        Build an instance.
+        """
+        if self.error:
+            raise ValueError("error")
+
+        return next(self.count)
+
+
+def test_it_should_share_values_until_they_expire() -> None:
+    """
+    it should share values until they expire, rebuilding them inline outside an
+    event loop
+    """
+    counter = Counter()
+    scope = quart_injector.cached_scope(ttl=3600)
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(int, to=counter.build, scope=scope)
+        binder.bind(
+            str, to=lambda: str(counter.build()), scope=quart_injector.cached_scope(0)
+        )
+
+    container = injector.Injector(configure)
+
+    assert container.get(int) == 1
+    assert container.get(int) == 1
+    assert container.get(str) == "2"
+    assert container.get(str) == "3"
+
+
+@pytest.mark.asyncio
+async def test_it_should_refresh_expired_values_in_the_background() -> None:
+    """
+    it should return expired values while refreshing them in the background
+    """
+    counter = Counter()
+    scope_cls = quart_injector.cached_scope(ttl=0)
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(int, to=counter.build, scope=scope_cls)
+
+    container = injector.Injector(configure)
+    scope = container.get(scope_cls)
+
+    assert container.get(int) == 1
+    assert container.get(int) == 1
+    assert container.get(int) == 1
+
+    await scope.wait()
+
+    assert container.get(int) == 2
+
+    await scope.wait()
+
+
+@pytest.mark.asyncio
+async def test_it_should_keep_expired_values_when_refreshing_fails(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """
+    it should keep expired values when refreshing them fails, logging a warning, and
+    try again later
+    """
+    counter = Counter()
+    scope_cls = quart_injector.cached_scope(ttl=0)
+    logger = logging.getLogger("tests")
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(int, to=counter.build, scope=scope_cls)
+        binder.bind(logging.Logger, to=logger)
+
+    container = injector.Injector(configure)
+    scope = container.get(scope_cls)
+
+    assert container.get(int) == 1
+
+    counter.error = True
+
+    assert container.get(int) == 1
+
+    await scope.wait()
+    counter.error = False
+
+    assert [(record.name, record.levelno) for record in caplog.records] == [
+        ("tests", logging.WARNING)
+    ]
+
+    assert container.get(int) == 1
+
+    await scope.wait()
+
+    assert container.get(int) == 2
+
+    await scope.wait()
+
+
+@pytest.mark.asyncio
+async def test_it_should_refresh_async_values_in_the_background() -> None:
+    """
+    it should refresh values from asynchronous providers in the background
+    """
+    counter = Counter()
+    scope_cls = quart_injector.cached_scope(ttl=0)
+
+    async def provide() -> int:
+        return counter.build()
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(
+            int,
+            to=quart_injector.AsyncProvider(provide),
+            scope=scope_cls,
+        )
+
+    container = injector.Injector(configure)
+    scope = container.get(scope_cls)
+
+    assert await container.get(int) == 1  # type: ignore
+    assert await container.get(int) == 1  # type: ignore
+
+    await scope.wait()
+
+    assert await container.get(int) == 2  # type: ignore
+
+    await scope.wait()
+
+
+def test_it_should_evict_least_recently_used_values() -> None:
+    """
+    it should evict the least recently used values
+    """
+    counter = Counter()
+    scope = quart_injector.cached_scope(ttl=3600, maxsize=1)
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(int, to=counter.build, scope=scope)
+        binder.bind(str, to=lambda: str(counter.build()), scope=scope)
+
+    container = injector.Injector(configure)
+
+    assert container.get(int) == 1
+    assert container.get(str) == "2"
+    assert container.get(int) == 3
+
+
+def test_it_should_create_scopes_with_options() -> None:
+    """
+    it should create cached scopes with the given options
+    """
+    scope = quart_injector.cached_scope(ttl=5, maxsize=2)
+
+    assert issubclass(scope, quart_injector.CachedScope)
+    assert scope.ttl == 5
+    assert scope.maxsize == 2
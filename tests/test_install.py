@@ -0,0 +1,162 @@
+"""
+Tests for :func:`~quart_injector.install`.
+"""
+import injector
+import pytest
+import quart
+
+import quart_injector
+
+
+class Client:  # pylint: disable=too-few-public-methods
+    """
+    Client.
+
+    A class bound differently per blueprint.
+
+    :param name: name of the blueprint the client is for
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class EmptyClass:  # pylint: disable=too-few-public-methods
+    """
+    Empty class.
+    """
+
+
+def configure(binder: injector.Binder) -> None:
+    """
+    Configure injector.
+
+    Bind the client for the application, and empty class to the request scope.
+    """
+    binder.bind(Client, to=Client("app"), scope=injector.singleton)
+    binder.bind(EmptyClass, scope=quart_injector.RequestScope)
+
+
+def configure_api(binder: injector.Binder) -> None:
+    """
+    Configure API injector.
+
+    Bind the client for the API blueprint.
+    """
+    binder.bind(Client, to=Client("api"), scope=injector.singleton)
+
+
+def factory(names: list[str]) -> tuple[quart.Quart, quart.Blueprint]:
+    """
+    Factory.
+
+    Create an application and API blueprint with views recording the client they
+    were injected with.
+
+    :param names: list to record client names in
+    """
+    app = quart.Quart(__name__)
+    api = quart.Blueprint("api", __name__)
+
+    async def view(client: injector.Inject[Client]) -> quart.Response:
+        names.append(client.name)
+
+        return quart.Response(b"content here")
+
+    app.add_url_rule("/", "view", view)
+    api.add_url_rule("/", "view", view)
+
+    quart_injector.install(api, configure_api)
+
+    return app, api
+
+
+@pytest.mark.asyncio
+async def test_it_should_inject_blueprint_views_from_child_injector() -> None:
+    """
+    it should inject blueprint views from the blueprint's child injector
+    """
+    names: list[str] = []
+    app, api = factory(names)
+
+    app.register_blueprint(api, url_prefix="/api")
+
+    quart_injector.wire(app, configure)
+
+    test_client = app.test_client()
+    await test_client.get("/")
+    await test_client.get("/api/")
+
+    assert names == ["app", "api"]
+
+    child = app.extensions["injector_blueprints"]["api"]
+
+    assert child.parent is app.extensions["injector"]
+
+
+@pytest.mark.asyncio
+async def test_it_should_share_request_scope_with_child_injectors() -> None:
+    """
+    it should share the request scope between the application and child injectors
+    """
+    app, api = factory([])
+    instances: list[EmptyClass] = []
+
+    @app.before_request  # type: ignore
+    async def _(empty: injector.Inject[EmptyClass]) -> None:
+        instances.append(empty)
+
+    @api.before_request  # type: ignore
+    async def _(empty: injector.Inject[EmptyClass]) -> None:
+        instances.append(empty)
+
+    app.register_blueprint(api, url_prefix="/api")
+
+    quart_injector.wire(app, configure)
+
+    await app.test_client().get("/api/")
+
+    assert len(instances) == 2
+    assert instances[0] is instances[1]
+
+
+@pytest.mark.asyncio
+async def test_it_should_use_parent_child_injector_for_nested_blueprints() -> None:
+    """
+    it should use the child injector of the parent blueprint for nested blueprints
+    """
+    names: list[str] = []
+    app, api = factory(names)
+    nested = quart.Blueprint("nested", __name__)
+
+    @nested.route("/")
+    async def _(client: injector.Inject[Client]) -> quart.Response:
+        names.append(client.name)
+
+        return quart.Response(b"content here")
+
+    api.register_blueprint(nested, url_prefix="/nested")
+    app.register_blueprint(api, url_prefix="/api")
+
+    quart_injector.wire(app, configure)
+
+    await app.test_client().get("/api/nested/")
+
+    assert names == ["api"]
+
+
+@pytest.mark.asyncio
+async def test_it_should_create_child_injectors_incrementally() -> None:
+    """
+    it should create child injectors for blueprints registered after wiring
+    """
+    names: list[str] = []
+    app, api = factory(names)
+
+    quart_injector.wire(app, configure, incremental=True)
+
+    app.register_blueprint(api, url_prefix="/api")
+
+    await app.test_client().get("/api/")
+
+    assert names == ["api"]
@@ -0,0 +1,165 @@
+"""
+Tests for :class:`~quart_injector.Instrument`.
+"""
+import collections.abc
+import typing
+
+import injector
+import pytest
+import quart
+import quart.views
+
+import quart_injector
+
+
+class EmptyClass:  # pylint: disable=too-few-public-methods
+    """
+    Empty class.
+    """
+
+
+class DependsOnEmptyClass:  # pylint: disable=too-few-public-methods
+    """
+    Depends on EmptyClass.
+
+    A class depending on EmptyClass.
+
+    :param child: instance of the class
+    """
+
+    @injector.inject
+    def __init__(self, child: EmptyClass) -> None:
+        self.child = child
+
+
+class Recorder:
+    """
+    Recorder.
+
+    An instrument that records what it is told.
+    """
+
+    def __init__(self) -> None:
+        self.resolved_calls: list[tuple[typing.Any, float, int]] = []
+        self.built_calls: list[tuple[typing.Any, float]] = []
+
+    def resolved(
+        self,
+        func: collections.abc.Callable[..., typing.Any],
+        duration: float,
+        built: int,
+    ) -> None:
+        """
+        Record a resolution.
+        """
+        self.resolved_calls.append((func, duration, built))
+
+    def built(self, interface: typing.Any, duration: float) -> None:
+        """
+        Record a build.
+        """
+        self.built_calls.append((interface, duration))
+
+
+def configure(binder: injector.Binder) -> None:
+    """
+    Configure injector.
+
+    Bind both classes to the request scope.
+    """
+    binder.bind(EmptyClass, scope=quart_injector.RequestScope)
+    binder.bind(DependsOnEmptyClass, scope=quart_injector.RequestScope)
+
+
+@pytest.mark.asyncio
+async def test_it_should_report_view_resolution() -> None:
+    """
+    it should report resolution timings for views
+    """
+    app = quart.Quart(__name__)
+    recorder = Recorder()
+
+    async def view(depends: injector.Inject[DependsOnEmptyClass]) -> str:
+        assert isinstance(depends, DependsOnEmptyClass)
+
+        return "content here"
+
+    app.add_url_rule("/test", "view", view)
+
+    quart_injector.wire(app, configure, instrument=recorder)
+
+    await app.test_client().get("/test")
+
+    assert len(recorder.resolved_calls) == 1
+
+    func, duration, built = recorder.resolved_calls[0]
+
+    assert func is view
+    assert duration >= 0
+    assert built == 2
+    assert [interface for interface, _ in recorder.built_calls] == [
+        EmptyClass,
+        DependsOnEmptyClass,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_it_should_report_class_based_view_resolution() -> None:
+    """
+    it should report resolution timings for class based views
+    """
+    app = quart.Quart(__name__)
+    recorder = Recorder()
+
+    class _View(quart.views.View):
+        methods = ["GET"]
+
+        def __init__(self, empty: injector.Inject[EmptyClass]) -> None:
+            self.empty = empty
+
+        async def dispatch_request(  # pylint: disable=unused-argument
+            self,
+            *args: typing.Any,
+            **kwargs: typing.Any,
+        ) -> str:
+            return "content here"
+
+    app.add_url_rule("/test", view_func=_View.as_view("view"))
+
+    quart_injector.wire(app, configure, instrument=recorder)
+
+    await app.test_client().get("/test")
+
+    assert len(recorder.resolved_calls) == 1
+
+    func, _, built = recorder.resolved_calls[0]
+
+    assert func is _View
+    assert built == 1
+
+
+@pytest.mark.asyncio
+async def test_it_should_not_report_values_already_built() -> None:
+    """
+    it should not report request scoped values already built for the request
+    """
+    app = quart.Quart(__name__)
+    recorder = Recorder()
+
+    @app.before_request  # type: ignore
+    async def _(empty: injector.Inject[EmptyClass]) -> None:
+        assert isinstance(empty, EmptyClass)
+
+    async def view(empty: injector.Inject[EmptyClass]) -> str:
+        assert isinstance(empty, EmptyClass)
+
+        return "content here"
+
+    app.add_url_rule("/test", "view", view)
+
+    quart_injector.wire(app, configure, instrument=recorder)
+
+    await app.test_client().get("/test")
+
+    assert [built for _, _, built in recorder.resolved_calls] == [1, 0]
+    assert len(recorder.built_calls) == 1
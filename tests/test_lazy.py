@@ -0,0 +1,166 @@
+"""
+Tests for :class:`~quart_injector.Lazy`.
+"""
+import typing
+
+import injector
+import pytest
+import quart
+import quart.views
+
+import quart_injector
+
+
+class EmptyClass:  # pylint: disable=too-few-public-methods
+    """
+    Empty class.
+    """
+
+
+def test_it_should_resolve_on_first_get() -> None:
+    """
+    it should resolve on first get
+    """
+    calls: list[EmptyClass] = []
+
+    def provide() -> EmptyClass:
+        calls.append(EmptyClass())
+        return calls[-1]
+
+    lazy = quart_injector.Lazy(provide)
+
+    assert not calls
+    assert lazy.get() is calls[0]
+    assert lazy.get() is calls[0]
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_it_should_inject_lazy_handles() -> None:
+    """
+    it should inject lazy handles
+    """
+    app = quart.Quart(__name__)
+
+    calls: list[EmptyClass] = []
+
+    def provide() -> EmptyClass:
+        calls.append(EmptyClass())
+        return calls[-1]
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(EmptyClass, to=provide)
+
+    container = injector.Injector(configure)
+
+    async def view(
+        use: bool,
+        empty: injector.Inject[quart_injector.Lazy[EmptyClass]],
+    ) -> typing.Any:
+        return empty.get() if use else None
+
+    wrapped = quart_injector.wrap(view, app, container)
+
+    assert await wrapped(use=False) is None
+    assert not calls
+    assert isinstance(await wrapped(use=True), EmptyClass)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_it_should_share_lazy_values_within_request_scope() -> None:
+    """
+    it should share lazy values within request scope
+    """
+    app = quart.Quart(__name__)
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(EmptyClass, scope=quart_injector.RequestScope)
+
+    container = injector.Injector(configure)
+
+    async def view(
+        empty: injector.Inject[quart_injector.Lazy[EmptyClass]],
+    ) -> typing.Any:
+        return empty.get()
+
+    wrapped = quart_injector.wrap(view, app, container)
+
+    async with container.get(quart_injector.RequestScope).activate():
+        instance1 = await wrapped()
+        instance2 = await wrapped()
+
+    assert isinstance(instance1, EmptyClass)
+    assert instance1 is instance2
+
+
+@pytest.mark.asyncio
+async def test_it_should_inject_lazy_handles_into_class_based_views() -> None:
+    """
+    it should inject lazy handles into class based views
+    """
+    app = quart.Quart(__name__)
+
+    container = injector.Injector()
+
+    class _View(quart.views.View):
+        methods = ["GET"]
+
+        def __init__(
+            self,
+            empty: injector.Inject[quart_injector.Lazy[EmptyClass]],
+        ) -> None:
+            self.empty = empty
+
+        async def dispatch_request(  # pylint: disable=unused-argument
+            self,
+            *args: typing.Any,
+            **kwargs: typing.Any,
+        ) -> typing.Any:
+            return self.empty.get()
+
+    wrapped = quart_injector.wrap(_View.as_view("view"), app, container)
+
+    assert isinstance(await wrapped(), EmptyClass)
+
+
+@pytest.mark.asyncio
+async def test_it_should_return_awaitables_for_async_providers() -> None:
+    """
+    it should return awaitables for asynchronous providers
+    """
+    app = quart.Quart(__name__)
+
+    async def provide() -> EmptyClass:
+        return EmptyClass()
+
+    container = injector.Injector()
+    container.binder.bind(EmptyClass, to=quart_injector.AsyncProvider(provide))
+
+    async def view(
+        empty: injector.Inject[quart_injector.Lazy[EmptyClass]],
+    ) -> typing.Any:
+        return await typing.cast(typing.Any, empty.get())
+
+    wrapped = quart_injector.wrap(view, app, container)
+
+    assert isinstance(await wrapped(), EmptyClass)
+
+
+def test_it_should_reject_lazy_handles_outside_of_plans() -> None:
+    """
+    it should reject classes injector builds depending on lazy handles
+    """
+    app = quart.Quart(__name__)
+
+    class _Service:  # pylint: disable=too-few-public-methods
+        @injector.inject
+        def __init__(self, empty: quart_injector.Lazy[EmptyClass]) -> None:
+            self.empty = empty
+
+    @app.route("/")
+    async def _(service: injector.Inject[_Service]) -> str:  # pragma: no cover
+        return str(service)
+
+    with pytest.raises(RuntimeError, match="lazy handles are only injected into"):
+        quart_injector.wire(app)
@@ -0,0 +1,138 @@
+"""
+Tests for :class:`~quart_injector.plan.InjectionPlan`.
+"""
+
+import injector
+import pytest
+
+import quart_injector
+import quart_injector.plan
+
+
+class EmptyClass:  # pylint: disable=too-few-public-methods
+    """
+    Empty class.
+    """
+
+
+def test_it_should_plan_injectable_parameters() -> None:
+    """
+    it should plan injectable parameters
+    """
+    container = injector.Injector()
+
+    def func(  # pylint: disable=unused-argument
+        arg: str, empty: injector.Inject[EmptyClass]
+    ) -> None:
+        """
+        Function.
+        """
+
+    plan = quart_injector.plan.InjectionPlan.build(func, container)
+
+    assert [dependency.name for dependency in plan.dependencies] == ["empty"]
+    assert plan.dependencies[0].interface is EmptyClass
+    assert plan.dependencies[0].position == 1
+
+
+def test_it_should_exclude_parameters() -> None:
+    """
+    it should exclude parameters
+    """
+    container = injector.Injector()
+
+    @injector.inject
+    def func(arg: str, empty: EmptyClass) -> None:  # pylint: disable=unused-argument
+        """
+        Function.
+        """
+
+    plan = quart_injector.plan.InjectionPlan.build(func, container, exclude={"arg"})
+
+    assert [dependency.name for dependency in plan.dependencies] == ["empty"]
+
+
+def test_it_should_resolve_dependencies() -> None:
+    """
+    it should resolve dependencies
+    """
+    container = injector.Injector()
+
+    def func(  # pylint: disable=unused-argument
+        empty: injector.Inject[EmptyClass],
+    ) -> None:
+        """
+        Function.
+        """
+
+    plan = quart_injector.plan.InjectionPlan.build(func, container)
+
+    assert isinstance(plan.resolve((), {})["empty"], EmptyClass)
+
+
+def test_it_should_not_resolve_dependencies_passed_by_caller() -> None:
+    """
+    it should not resolve dependencies passed by caller
+    """
+    container = injector.Injector()
+
+    def func(  # pylint: disable=unused-argument
+        empty: injector.Inject[EmptyClass],
+    ) -> None:
+        """
+        Function.
+        """
+
+    plan = quart_injector.plan.InjectionPlan.build(func, container)
+
+    assert not plan.resolve((EmptyClass(),), {})
+    assert not plan.resolve((), {"empty": EmptyClass()})
+
+
+def test_it_should_respect_scopes() -> None:
+    """
+    it should respect scopes
+    """
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(EmptyClass, scope=quart_injector.RequestScope)
+
+    container = injector.Injector(configure)
+
+    def func(  # pylint: disable=unused-argument
+        empty: injector.Inject[EmptyClass],
+    ) -> None:
+        """
+        Function.
+        """
+
+    plan = quart_injector.plan.InjectionPlan.build(func, container)
+
+    container.get(quart_injector.RequestScope).push()
+    instance1 = plan.resolve((), {})["empty"]
+    instance2 = plan.resolve((), {})["empty"]
+    container.get(quart_injector.RequestScope).pop()
+
+    assert instance1 is instance2
+
+
+def test_it_should_defer_missing_bindings() -> None:
+    """
+    it should defer missing bindings
+    """
+    container = injector.Injector(auto_bind=False)
+
+    def func(  # pylint: disable=unused-argument
+        empty: injector.Inject[EmptyClass],
+    ) -> None:
+        """
+        Function.
+        """
+
+    plan = quart_injector.plan.InjectionPlan.build(func, container)
+
+    with pytest.raises(
+        injector.UnsatisfiedRequirement,
+        match="unsatisfied requirement on EmptyClass",
+    ):
+        plan.resolve((), {})
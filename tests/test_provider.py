@@ -0,0 +1,466 @@
+"""
+Tests for :class:`~quart_injector.AsyncProvider`.
+"""
+import asyncio
+import collections.abc
+import re
+import threading
+import typing
+
+import injector
+import pytest
+import quart
+
+import quart_injector
+import quart_injector.provider
+
+import tests.helpers
+
+
+class EmptyClass:  # pylint: disable=too-few-public-methods
+    """
+    Empty class.
+    """
+
+
+class DependsOnEmptyClass:  # pylint: disable=too-few-public-methods
+    """
+    Depends on EmptyClass.
+
+    A class depending on EmptyClass.
+
+    :param child: instance of the class
+    """
+
+    def __init__(self, child: EmptyClass) -> None:
+        self.child = child
+
+
+@pytest.mark.asyncio
+async def test_it_should_provide_awaited_values() -> None:
+    """
+    it should provide awaited values
+    """
+    app = quart.Quart(__name__)
+
+    async def provide() -> EmptyClass:
+        return EmptyClass()
+
+    container = tests.helpers.container(EmptyClass, provide)
+
+    def view(empty: injector.Inject[EmptyClass]) -> typing.Any:
+        return empty
+
+    wrapped = quart_injector.wrap(view, app, container)
+
+    assert isinstance(await wrapped(), EmptyClass)
+
+
+@pytest.mark.asyncio
+async def test_it_should_provide_awaited_values_from_module_methods() -> None:
+    """
+    it should provide awaited values from module methods
+    """
+    app = quart.Quart(__name__)
+
+    class _Module(injector.Module):
+        @quart_injector.async_provider
+        async def provide(self) -> EmptyClass:
+            """
+            Provide.
+            """
+            return EmptyClass()
+
+    container = injector.Injector(_Module())
+
+    quart_injector.provider.promote(container)
+
+    async def view(empty: injector.Inject[EmptyClass]) -> typing.Any:
+        return empty
+
+    wrapped = quart_injector.wrap(view, app, container)
+
+    assert isinstance(await wrapped(), EmptyClass)
+
+
+@pytest.mark.asyncio
+async def test_it_should_provide_nested_awaited_values() -> None:
+    """
+    it should provide nested awaited values
+    """
+    app = quart.Quart(__name__)
+
+    async def provide_empty() -> EmptyClass:
+        return EmptyClass()
+
+    @injector.inject
+    async def provide_depends(child: EmptyClass) -> DependsOnEmptyClass:
+        return DependsOnEmptyClass(child)
+
+    def configure(binder: injector.Binder) -> None:
+        quart_injector.bind(binder, EmptyClass, provide_empty)
+        quart_injector.bind(binder, DependsOnEmptyClass, provide_depends)
+
+    container = injector.Injector(configure)
+
+    quart_injector.provider.promote(container)
+
+    async def view(depends: injector.Inject[DependsOnEmptyClass]) -> typing.Any:
+        return depends
+
+    wrapped = quart_injector.wrap(view, app, container)
+
+    result = await wrapped()
+
+    assert isinstance(result, DependsOnEmptyClass)
+    assert isinstance(result.child, EmptyClass)
+
+
+@pytest.mark.asyncio
+async def test_it_should_provide_awaited_values_concurrently() -> None:
+    """
+    it should provide awaited values concurrently
+    """
+    app = quart.Quart(__name__)
+
+    Left = typing.NewType("Left", str)
+    Right = typing.NewType("Right", str)
+
+    events: list[str] = []
+
+    async def provide_left() -> Left:
+        events.append("start left")
+        await asyncio.sleep(0)
+        events.append("end left")
+        return Left("left")
+
+    async def provide_right() -> Right:
+        events.append("start right")
+        await asyncio.sleep(0)
+        events.append("end right")
+        return Right("right")
+
+    def configure(binder: injector.Binder) -> None:
+        quart_injector.bind(binder, Left, provide_left)
+        quart_injector.bind(binder, Right, provide_right)
+
+    container = injector.Injector(configure)
+
+    quart_injector.provider.promote(container)
+
+    async def view(left: injector.Inject[Left], right: injector.Inject[Right]) -> str:
+        return f"{left} {right}"
+
+    wrapped = quart_injector.wrap(view, app, container)
+
+    assert await wrapped() == "left right"
+    assert events[:2] == ["start left", "start right"]
+
+
+@pytest.mark.asyncio
+async def test_it_should_share_awaited_values_within_request_scope() -> None:
+    """
+    it should share awaited values within request scope
+    """
+    app = quart.Quart(__name__)
+
+    calls: list[EmptyClass] = []
+
+    async def provide() -> EmptyClass:
+        calls.append(EmptyClass())
+        return calls[-1]
+
+    container = tests.helpers.container(
+        EmptyClass, provide, quart_injector.RequestScope
+    )
+
+    async def view(empty: injector.Inject[EmptyClass]) -> typing.Any:
+        return empty
+
+    wrapped = quart_injector.wrap(view, app, container)
+
+    container.get(quart_injector.RequestScope).push()
+    instance1 = await wrapped()
+    instance2 = await wrapped()
+    container.get(quart_injector.RequestScope).pop()
+
+    assert instance1 is instance2
+    assert len(calls) == 1
+
+
+def test_it_should_error_when_decorating_synchronous_functions() -> None:
+    """
+    it should error when decorating synchronous functions
+    """
+
+    def provide() -> EmptyClass:  # pragma: no cover
+        return EmptyClass()
+
+    with pytest.raises(
+        TypeError,
+        match=re.escape(f"{provide.__qualname__} is not a coroutine function"),
+    ):
+        quart_injector.async_provider(provide)
+
+
+@pytest.mark.asyncio
+async def test_it_should_release_resources_on_teardown() -> None:
+    """
+    it should release resources on teardown
+    """
+    app = quart.Quart(__name__)
+
+    events: list[str] = []
+
+    def provide() -> collections.abc.Iterator[EmptyClass]:
+        events.append("enter")
+        yield EmptyClass()
+        events.append("exit")
+
+    container = tests.helpers.container(
+        EmptyClass, provide, quart_injector.RequestScope
+    )
+
+    async def view(empty: injector.Inject[EmptyClass]) -> typing.Any:
+        return empty
+
+    wrapped = quart_injector.wrap(view, app, container)
+
+    scope = container.get(quart_injector.RequestScope)
+
+    scope.push()
+    instance1 = await wrapped()
+    instance2 = await wrapped()
+
+    assert events == ["enter"]
+
+    await scope.teardown()
+
+    assert isinstance(instance1, EmptyClass)
+    assert instance1 is instance2
+    assert events == ["enter", "exit"]
+
+
+@pytest.mark.asyncio
+async def test_it_should_release_async_resources_on_teardown() -> None:
+    """
+    it should release asynchronous resources on teardown
+    """
+    app = quart.Quart(__name__)
+
+    events: list[str] = []
+
+    async def provide() -> collections.abc.AsyncIterator[EmptyClass]:
+        events.append("enter")
+        yield EmptyClass()
+        events.append("exit")
+
+    container = tests.helpers.container(
+        EmptyClass, provide, quart_injector.RequestScope
+    )
+
+    async def view(empty: injector.Inject[EmptyClass]) -> typing.Any:
+        return empty
+
+    wrapped = quart_injector.wrap(view, app, container)
+
+    scope = container.get(quart_injector.RequestScope)
+
+    scope.push()
+    instance = await wrapped()
+
+    assert events == ["enter"]
+
+    await scope.teardown()
+
+    assert isinstance(instance, EmptyClass)
+    assert events == ["enter", "exit"]
+
+
+@pytest.mark.parametrize(
+    "scope",
+    [injector.NoScope, injector.SingletonScope],
+)
+def test_it_should_error_when_resources_are_not_request_scoped(
+    scope: type[injector.Scope],
+) -> None:
+    """
+    it should error when resources are not bound in a request scope
+    """
+
+    def provide() -> collections.abc.Iterator[EmptyClass]:  # pragma: no cover
+        yield EmptyClass()
+
+    def configure(binder: injector.Binder) -> None:
+        quart_injector.bind(binder, EmptyClass, provide, scope=scope)
+
+    container = injector.Injector(configure)
+
+    with pytest.raises(
+        RuntimeError,
+        match="is provided by a generator so must be bound in a RequestScope",
+    ):
+        quart_injector.provider.promote(container)
+
+
+@pytest.mark.asyncio
+async def test_it_should_retry_failed_singletons() -> None:
+    """
+    it should retry failed singletons instead of caching the error
+    """
+    app = quart.Quart(__name__)
+
+    calls: list[int] = []
+
+    async def provide() -> EmptyClass:
+        calls.append(len(calls))
+
+        if len(calls) == 1:
+            raise ConnectionError("unavailable")
+
+        return EmptyClass()
+
+    container = tests.helpers.container(EmptyClass, provide, injector.singleton)
+
+    async def view(empty: injector.Inject[EmptyClass]) -> typing.Any:
+        return empty
+
+    wrapped = quart_injector.wrap(view, app, container)
+
+    with pytest.raises(ConnectionError, match="unavailable"):
+        await wrapped()
+
+    instance1 = await wrapped()
+    instance2 = await wrapped()
+
+    assert isinstance(instance1, EmptyClass)
+    assert instance1 is instance2
+    assert calls == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_it_should_promote_bindings_when_wiring() -> None:
+    """
+    it should promote bindings when wiring
+    """
+    app = quart.Quart(__name__)
+
+    async def provide() -> EmptyClass:
+        return EmptyClass()
+
+    def configure(binder: injector.Binder) -> None:
+        quart_injector.bind(binder, EmptyClass, provide)
+
+    quart_injector.wire(app, configure)
+
+    binding, _ = app.extensions["injector"].binder.get_binding(EmptyClass)
+
+    assert isinstance(binding.provider, quart_injector.AsyncProvider)
+
+
+def test_it_should_error_when_sync_providers_depend_on_async_bindings() -> None:
+    """
+    it should error when synchronous providers depend on asynchronous bindings
+    """
+    app = quart.Quart(__name__)
+
+    async def provide() -> EmptyClass:  # pragma: no cover
+        return EmptyClass()
+
+    class _Depends:  # pylint: disable=too-few-public-methods
+        @injector.inject
+        def __init__(self, child: EmptyClass) -> None:  # pragma: no cover
+            self.child = child
+
+    def configure(binder: injector.Binder) -> None:
+        quart_injector.bind(binder, EmptyClass, provide)
+        binder.bind(_Depends)
+
+    with pytest.raises(
+        RuntimeError,
+        match="cannot depend on asynchronous binding .* for 'child'",
+    ):
+        quart_injector.wire(app, configure)
+
+
+@pytest.mark.asyncio
+async def test_it_should_provide_blocking_values_from_an_executor() -> None:
+    """
+    it should provide values from blocking functions using the blocking executor
+    """
+    app = quart.Quart(__name__)
+    app.config["INJECTOR_BLOCKING_MAX_WORKERS"] = 1
+
+    threads: list[str] = []
+
+    def provide(child: injector.Inject[EmptyClass]) -> DependsOnEmptyClass:
+        threads.append(threading.current_thread().name)
+
+        return DependsOnEmptyClass(child)
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(DependsOnEmptyClass, to=quart_injector.BlockingProvider(provide))
+
+    container = injector.Injector([quart_injector.QuartModule(app), configure])
+
+    async def view(depends: injector.Inject[DependsOnEmptyClass]) -> typing.Any:
+        return depends
+
+    wrapped = quart_injector.wrap(view, app, container)
+
+    instance = await wrapped()
+    executor = container.get(quart_injector.BlockingExecutor)
+
+    assert isinstance(instance, DependsOnEmptyClass)
+    assert isinstance(instance.child, EmptyClass)
+    assert threads[0].startswith("quart-injector-blocking")
+    assert getattr(executor, "_max_workers") == 1
+    assert executor is container.get(quart_injector.BlockingExecutor)
+
+
+@pytest.mark.asyncio
+async def test_it_should_shut_down_the_blocking_executor() -> None:
+    """
+    it should shut down the blocking executor after the application stops serving
+    """
+    app = quart.Quart(__name__)
+
+    quart_injector.wire(app)
+
+    async with app.test_app():
+        executor = app.extensions["injector"].get(quart_injector.BlockingExecutor)
+
+    with pytest.raises(RuntimeError, match="after shutdown"):
+        executor.submit(print)
+
+
+@pytest.mark.asyncio
+async def test_it_should_provide_blocking_values_with_the_current_context() -> None:
+    """
+    it should provide values from blocking functions with the current context
+    """
+    app = quart.Quart(__name__)
+
+    def provide(empty: injector.Inject[EmptyClass]) -> DependsOnEmptyClass:
+        assert container.get(EmptyClass) is empty
+
+        return DependsOnEmptyClass(empty)
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(EmptyClass, scope=quart_injector.RequestScope)
+        binder.bind(DependsOnEmptyClass, to=quart_injector.BlockingProvider(provide))
+
+    container = injector.Injector(configure)
+
+    async def view(depends: injector.Inject[DependsOnEmptyClass]) -> typing.Any:
+        return depends
+
+    wrapped = quart_injector.wrap(view, app, container)
+
+    scope = container.get(quart_injector.RequestScope)
+
+    scope.push()
+    instance = await wrapped()
+    scope.pop()
+
+    assert isinstance(instance.child, EmptyClass)
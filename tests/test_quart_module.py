@@ -4,7 +4,10 @@ Tests for :class:`~quart_injector.QuartModule`.
 import logging
 
 import injector
+import pytest
 import quart
+import quart.ctx
+import quart.routing
 import quart.sessions
 
 import quart_injector
@@ -32,38 +35,122 @@ def test_it_should_return_passed_applications_configuration() -> None:
     assert app.config == container.get(quart.Config)
 
 
-def test_it_should_return_request() -> None:
+@pytest.mark.asyncio
+async def test_it_should_return_request() -> None:
     """
-    it should return request
+    it should return the request rather than its proxy
     """
     app = quart.Quart(__name__)
 
     container = injector.Injector(quart_injector.QuartModule(app))
 
-    assert quart.request == container.get(quart.Request)
+    async with app.test_request_context("/"):
+        request = container.get(quart.Request)
 
+        assert request is getattr(quart.request, "_get_current_object")()
+        assert container.get(quart.ctx.RequestContext).request is request
 
-def test_it_should_return_websocket() -> None:
+
+@pytest.mark.asyncio
+async def test_it_should_return_websocket() -> None:
     """
-    it should return websocket
+    it should return the websocket rather than its proxy
+    """
+    app = quart.Quart(__name__)
+    websockets: list[tuple[quart.Websocket, quart.ctx.WebsocketContext]] = []
+
+    @app.websocket("/ws")
+    async def _(
+        websocket: injector.Inject[quart.Websocket],
+        context: injector.Inject[quart.ctx.WebsocketContext],
+    ) -> None:
+        websockets.append((websocket, context))
+
+    quart_injector.wire(app)
+
+    async with app.test_client().websocket("/ws") as test_websocket:
+        await test_websocket.send("hello")
+
+    assert len(websockets) == 1
+
+    websocket, context = websockets[0]
+
+    assert isinstance(websocket, quart.Websocket)
+    assert context.websocket is websocket
+
+
+@pytest.mark.asyncio
+async def test_it_should_return_session() -> None:
+    """
+    it should return the session rather than its proxy
     """
     app = quart.Quart(__name__)
 
     container = injector.Injector(quart_injector.QuartModule(app))
 
-    assert quart.websocket == container.get(quart.Websocket)
+    async with app.test_request_context("/"):
+        # following is ignored as the type checker gets upset about abstract classes
+        session = container.get(quart.sessions.SessionMixin)  # type: ignore
+
+        assert session is getattr(quart.session, "_get_current_object")()
+
+
+@pytest.mark.asyncio
+async def test_it_should_return_application_globals() -> None:
+    """
+    it should return the application context globals
+    """
+    app = quart.Quart(__name__)
+
+    container = injector.Injector(quart_injector.QuartModule(app))
+
+    async with app.app_context():
+        assert (
+            container.get(app.app_ctx_globals_class)
+            is getattr(quart.g, "_get_current_object")()
+        )
+
+
+@pytest.mark.asyncio
+async def test_it_should_return_url_rule_and_view_args() -> None:
+    """
+    it should return the matched URL rule and view arguments
+    """
+    app = quart.Quart(__name__)
+    matches: list[tuple[quart.routing.QuartRule, quart_injector.ViewArgs]] = []
+
+    @app.route("/items/<int:item>")
+    async def _(
+        item: int,
+        rule: injector.Inject[quart.routing.QuartRule],
+        view_args: injector.Inject[quart_injector.ViewArgs],
+    ) -> quart.Response:
+        matches.append((rule, view_args))
+
+        return quart.Response(str(item).encode())
+
+    quart_injector.wire(app)
+
+    await app.test_client().get("/items/3")
+
+    assert len(matches) == 1
+
+    rule, view_args = matches[0]
+
+    assert rule.rule == "/items/<int:item>"
+    assert view_args == {"item": 3}
 
 
-def test_it_should_return_session() -> None:
+def test_it_should_raise_outside_of_a_request() -> None:
     """
-    it should return session
+    it should raise an error when a request is injected outside of a request
     """
     app = quart.Quart(__name__)
 
     container = injector.Injector(quart_injector.QuartModule(app))
 
-    # following is ignored as the type checker gets upset about abstract classes
-    assert quart.session == container.get(quart.sessions.SessionMixin)  # type: ignore
+    with pytest.raises(RuntimeError, match="Not within a request context"):
+        container.get(quart.Request)
 
 
 def test_it_should_return_logger() -> None:
@@ -1,9 +1,16 @@
 """
 Tests for :class:`~quart_injector.RequestScope`.
 """
+import asyncio
+import collections.abc
+import sys
+import typing
+
 import injector
+import pytest
 
 import quart_injector
+import quart_injector.provider
 
 
 class EmptyClass:  # pylint: disable=too-few-public-methods
@@ -133,3 +140,297 @@ def test_it_should_provide_different_values_per_request_scope_using_decorator()
     container.get(quart_injector.RequestScope).pop()
 
     assert instance1.child is not instance2.child
+
+
+class Manager:
+    """
+    Manager.
+
+    A context manager recording when it is exited.
+
+    :param name: name to record
+    :param events: list to record exits in
+    :param error: exception to raise on exit
+    """
+
+    def __init__(
+        self,
+        name: str,
+        events: list[str],
+        error: Exception | None = None,
+    ) -> None:
+        self.name = name
+        self.events = events
+        self.error = error
+
+    def __enter__(self) -> "Manager":
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.events.append(self.name)
+
+        if self.error:
+            raise self.error
+
+
+@pytest.mark.asyncio
+async def test_it_should_exit_registered_managers_in_reverse_order() -> None:
+    """
+    it should exit registered managers in reverse order on teardown
+    """
+    container = injector.Injector()
+    scope = container.get(quart_injector.RequestScope)
+
+    events: list[str] = []
+
+    scope.push()
+    scope.register(Manager("first", events))
+    scope.register(Manager("second", events))
+    await scope.teardown()
+
+    assert events == ["second", "first"]
+
+
+@pytest.mark.asyncio
+async def test_it_should_aggregate_errors_on_teardown() -> None:
+    """
+    it should aggregate errors on teardown
+    """
+    container = injector.Injector()
+    scope = container.get(quart_injector.RequestScope)
+
+    events: list[str] = []
+    first = ValueError("first")
+    second = ValueError("second")
+
+    scope.push()
+    scope.register(Manager("first", events, first))
+    scope.register(Manager("second", events, second))
+
+    with pytest.raises(quart_injector.TeardownError) as info:
+        await scope.teardown()
+
+    assert events == ["second", "first"]
+    assert info.value.errors == [second, first]
+
+
+def test_it_should_restore_outer_values_when_popping_nested_scopes() -> None:
+    """
+    it should restore outer values when popping nested request scopes
+    """
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(EmptyClass, scope=quart_injector.RequestScope)
+
+    container = injector.Injector(configure)
+    scope = container.get(quart_injector.RequestScope)
+
+    scope.push()
+    outer1 = container.get(EmptyClass)
+    scope.push()
+    inner = container.get(EmptyClass)
+    scope.pop()
+    outer2 = container.get(EmptyClass)
+    scope.pop()
+
+    assert outer1 is outer2
+    assert outer1 is not inner
+
+
+def test_it_should_use_the_current_provider_after_rebinding() -> None:
+    """
+    it should use the current provider after a key is rebound
+    """
+    first, second = EmptyClass(), EmptyClass()
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(EmptyClass, to=first, scope=quart_injector.RequestScope)
+
+    container = injector.Injector(configure)
+    scope = container.get(quart_injector.RequestScope)
+
+    scope.push()
+    instance1 = container.get(EmptyClass)
+    scope.pop()
+
+    container.binder.bind(EmptyClass, to=second, scope=quart_injector.RequestScope)
+
+    scope.push()
+    instance2 = container.get(EmptyClass)
+    scope.pop()
+
+    assert instance1 is first
+    assert instance2 is second
+
+
+def test_it_should_error_when_scope_is_not_active() -> None:
+    """
+    it should error when the request scope is not active
+    """
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(EmptyClass, scope=quart_injector.RequestScope)
+
+    container = injector.Injector(configure)
+
+    with pytest.raises(RuntimeError, match="RequestScope is not active"):
+        container.get(EmptyClass)
+
+
+@pytest.mark.asyncio
+async def test_it_should_share_values_with_child_tasks() -> None:
+    """
+    it should share values with child tasks
+    """
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(EmptyClass, scope=quart_injector.RequestScope)
+
+    container = injector.Injector(configure)
+    scope = container.get(quart_injector.RequestScope)
+
+    async def child() -> EmptyClass:
+        return container.get(EmptyClass)
+
+    scope.push()
+    instance1 = await asyncio.ensure_future(child())
+    instance2 = container.get(EmptyClass)
+    scope.pop()
+
+    assert instance1 is instance2
+
+
+def test_it_should_count_instances_held() -> None:
+    """
+    it should count the instances held, and estimate their size when measuring
+    """
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(EmptyClass, scope=quart_injector.RequestScope)
+        binder.bind(DependsOnEmptyClass, scope=quart_injector.RequestScope)
+
+    container = injector.Injector(configure)
+    scope = container.get(quart_injector.RequestScope)
+
+    scope.push()
+    container.get(DependsOnEmptyClass)
+    usage = scope.usage()
+    scope.pop()
+
+    assert usage == quart_injector.ScopeUsage(2, None)
+
+    scope.measure = True
+
+    scope.push()
+    instance = container.get(EmptyClass)
+    usage = scope.usage()
+    scope.pop()
+
+    assert usage == quart_injector.ScopeUsage(1, sys.getsizeof(instance))
+
+
+def test_it_should_warn_when_holding_too_many_instances() -> None:
+    """
+    it should warn once when holding more instances than the limit
+    """
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(EmptyClass, scope=quart_injector.RequestScope)
+        binder.bind(DependsOnEmptyClass, scope=quart_injector.RequestScope)
+
+    container = injector.Injector(configure)
+    scope = container.get(quart_injector.RequestScope)
+    scope.max_instances = 1
+
+    scope.push()
+
+    with pytest.warns(RuntimeWarning, match="holds 2 instances, more than 1"):
+        container.get(DependsOnEmptyClass)
+
+    scope.pop()
+
+
+def test_it_should_error_when_holding_too_much_in_strict_mode() -> None:
+    """
+    it should error when holding more bytes than the limit in strict mode
+    """
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(bytes, to=bytes(1024), scope=quart_injector.RequestScope)
+
+    container = injector.Injector(configure)
+    scope = container.get(quart_injector.RequestScope)
+    scope.max_size = 1000
+    scope.strict = True
+
+    scope.push()
+
+    with pytest.raises(RuntimeError, match="RequestScope holds .* bytes"):
+        container.get(bytes)
+
+    scope.pop()
+
+
+@pytest.mark.asyncio
+async def test_it_should_release_instances_early() -> None:
+    """
+    it should release instances early, exiting their context managers
+    """
+    events: list[str] = []
+
+    def configure(binder: injector.Binder) -> None:
+        quart_injector.bind(
+            binder, EmptyClass, resource, scope=quart_injector.RequestScope
+        )
+
+    def resource() -> collections.abc.Iterator[EmptyClass]:
+        yield EmptyClass()
+        events.append("exit")
+
+    container = injector.Injector(configure)
+    quart_injector.provider.promote(container)
+    scope = container.get(quart_injector.RequestScope)
+
+    scope.push()
+    instance1 = container.get(EmptyClass)
+    await scope.release(EmptyClass)
+
+    assert events == ["exit"]
+    assert scope.usage().instances == 0
+
+    instance2 = container.get(EmptyClass)
+    await scope.teardown()
+
+    assert instance1 is not instance2
+    assert events == ["exit", "exit"]
+
+
+@pytest.mark.asyncio
+async def test_it_should_release_async_resources_early() -> None:
+    """
+    it should release async resources early, exiting their context managers
+    """
+    events: list[str] = []
+
+    def configure(binder: injector.Binder) -> None:
+        quart_injector.bind(
+            binder, EmptyClass, resource, scope=quart_injector.RequestScope
+        )
+
+    async def resource() -> collections.abc.AsyncIterator[EmptyClass]:
+        yield EmptyClass()
+        events.append("exit")
+
+    container = injector.Injector(configure)
+    quart_injector.provider.promote(container)
+    scope = container.get(quart_injector.RequestScope)
+
+    scope.push()
+    await typing.cast(typing.Any, container.get(EmptyClass))
+    await scope.release(EmptyClass)
+
+    assert events == ["exit"]
+
+    await scope.teardown()
+
+    assert events == ["exit"]
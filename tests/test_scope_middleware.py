@@ -0,0 +1,151 @@
+"""
+Tests for :class:`~quart_injector.scope.ScopeMiddleware`.
+"""
+import logging
+import typing
+
+import injector
+import pytest
+
+import quart_injector
+import quart_injector.scope
+
+
+class EmptyClass:  # pylint: disable=too-few-public-methods
+    """
+    Empty class.
+    """
+
+
+def configure(binder: injector.Binder) -> None:
+    """
+    Configure injector.
+
+    Bind empty class to the request scope.
+    """
+    binder.bind(EmptyClass, scope=quart_injector.RequestScope)
+
+
+async def receive() -> typing.Any:  # pragma: no cover
+    """
+    Receive.
+
+    An ASGI receive callable that never receives anything.
+    """
+    return {}
+
+
+async def send(_: typing.Any) -> None:  # pragma: no cover
+    """
+    Send.
+
+    An ASGI send callable that discards messages.
+    """
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scope_type", ["http", "websocket"])
+async def test_it_should_push_scope_around_connections(scope_type: str) -> None:
+    """
+    it should push scope around http and websocket connections
+    """
+    container = injector.Injector(configure)
+
+    args: list[typing.Any] = [None, None]
+
+    async def app(*_: typing.Any) -> None:
+        args[0] = container.get(EmptyClass)
+        args[1] = container.get(EmptyClass)
+
+    middleware = quart_injector.scope.ScopeMiddleware(
+        app, container.get(quart_injector.RequestScope)
+    )
+
+    await middleware({"type": scope_type}, receive, send)
+
+    assert isinstance(args[0], EmptyClass)
+    assert args[0] is args[1]
+
+    with pytest.raises(RuntimeError, match="RequestScope is not active"):
+        container.get(EmptyClass)
+
+
+@pytest.mark.asyncio
+async def test_it_should_not_push_scope_for_lifespan() -> None:
+    """
+    it should not push scope for lifespan
+    """
+    container = injector.Injector(configure)
+
+    async def app(*_: typing.Any) -> None:
+        container.get(EmptyClass)
+
+    middleware = quart_injector.scope.ScopeMiddleware(
+        app, container.get(quart_injector.RequestScope)
+    )
+
+    with pytest.raises(RuntimeError, match="RequestScope is not active"):
+        await middleware({"type": "lifespan"}, receive, send)
+
+
+@pytest.mark.asyncio
+async def test_it_should_teardown_scope_when_application_errors() -> None:
+    """
+    it should teardown scope when the application errors
+    """
+    container = injector.Injector(configure)
+
+    events: list[typing.Any] = []
+
+    class _Manager:
+        def __enter__(self) -> None:  # pragma: no cover
+            pass
+
+        def __exit__(self, *args: typing.Any) -> None:
+            events.append(args[1])
+
+    error = ValueError("error")
+
+    async def app(*_: typing.Any) -> None:
+        container.get(quart_injector.RequestScope).register(_Manager())
+        raise error
+
+    middleware = quart_injector.scope.ScopeMiddleware(
+        app, container.get(quart_injector.RequestScope)
+    )
+
+    with pytest.raises(ValueError, match="error"):
+        await middleware({"type": "http"}, receive, send)
+
+    assert events == [error]
+
+
+@pytest.mark.asyncio
+async def test_it_should_log_teardown_errors(caplog: pytest.LogCaptureFixture) -> None:
+    """
+    it should log errors exiting resources on teardown rather than raise them
+    """
+    container = injector.Injector(configure)
+    error = ValueError("error")
+
+    class _Manager:
+        def __enter__(self) -> None:  # pragma: no cover
+            pass
+
+        def __exit__(self, *args: typing.Any) -> None:
+            raise error
+
+    async def app(*_: typing.Any) -> None:
+        container.get(quart_injector.RequestScope).register(_Manager())
+
+    middleware = quart_injector.scope.ScopeMiddleware(
+        app,
+        container.get(quart_injector.RequestScope),
+        logger=logging.getLogger("tests"),
+    )
+
+    await middleware({"type": "http"}, receive, send)
+
+    assert [(record.name, record.exc_info) for record in caplog.records] == [
+        ("tests", (ValueError, error, error.__traceback__))
+    ]
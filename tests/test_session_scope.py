@@ -0,0 +1,168 @@
+"""
+Tests for :class:`~quart_injector.SessionScope`.
+"""
+import typing
+
+import injector
+import pytest
+import quart
+
+import quart_injector
+
+
+@quart_injector.session
+class Permissions:  # pylint: disable=too-few-public-methods
+    """
+    Permissions.
+
+    A class decorated with the session scope.
+    """
+
+
+class Store(quart_injector.MemorySessionStore):
+    """
+    Store.
+
+    A session store recording the instances stored in it.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.stored: list[tuple[str, typing.Any, typing.Any]] = []
+
+    def set(self, session_id: str, key: typing.Any, value: typing.Any) -> None:
+        """
+        Record and store an instance.
+        """
+        self.stored.append((session_id, key, value))
+        super().set(session_id, key, value)
+
+
+def factory(
+    instances: list[Permissions],
+    modules: typing.Any = None,
+) -> quart.Quart:
+    """
+    Factory.
+
+    Create an application recording the instances injected into its view.
+
+    :param instances: list to record instances in
+    :param modules: modules to wire the application with
+    """
+    app = quart.Quart(__name__)
+    app.secret_key = "secret"
+
+    @app.route("/")
+    async def _(permissions: injector.Inject[Permissions]) -> quart.Response:
+        instances.append(permissions)
+
+        return quart.Response(b"content here")
+
+    @app.route("/logout")
+    async def logout(
+        scope: injector.Inject[quart_injector.SessionScope],
+    ) -> quart.Response:
+        scope.clear()
+
+        return quart.Response(b"")
+
+    quart_injector.wire(app, modules)
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_it_should_provide_same_values_within_a_session() -> None:
+    """
+    it should provide same values within a session and different values per session
+    """
+    instances: list[Permissions] = []
+    app = factory(instances)
+
+    test_client = app.test_client()
+    await test_client.get("/")
+    await test_client.get("/")
+    await app.test_client().get("/")
+
+    assert instances[0] is instances[1]
+    assert instances[0] is not instances[2]
+
+
+@pytest.mark.asyncio
+async def test_it_should_rebuild_values_after_clearing_the_session() -> None:
+    """
+    it should rebuild values after the session has been cleared
+    """
+    instances: list[Permissions] = []
+    app = factory(instances)
+
+    test_client = app.test_client()
+    await test_client.get("/")
+    await test_client.get("/logout")
+    await test_client.get("/")
+
+    assert instances[0] is not instances[1]
+
+
+@pytest.mark.asyncio
+async def test_it_should_use_the_bound_store() -> None:
+    """
+    it should use the bound session store
+    """
+    store = Store()
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(quart_injector.SessionStore, to=store)  # type: ignore
+
+    instances: list[Permissions] = []
+    app = factory(instances, configure)
+
+    test_client = app.test_client()
+    await test_client.get("/")
+    await test_client.get("/")
+
+    assert len(store.stored) == 1
+    assert store.stored[0][1:] == (Permissions, instances[0])
+    assert instances[1] is instances[0]
+
+
+def test_it_should_error_when_there_is_no_session() -> None:
+    """
+    it should error when there is no request or websocket context
+    """
+    container = injector.Injector()
+
+    with pytest.raises(RuntimeError, match="SessionScope is not active"):
+        container.get(Permissions)
+
+
+def test_it_should_expire_stored_values() -> None:
+    """
+    it should expire stored values once their ttl has passed
+    """
+    store = quart_injector.MemorySessionStore(ttl=0)
+
+    store.set("session", "key", "value")
+
+    with pytest.raises(KeyError):
+        store.get("session", "key")
+
+
+def test_it_should_evict_least_recently_used_sessions() -> None:
+    """
+    it should evict the least recently used sessions
+    """
+    store = quart_injector.MemorySessionStore(maxsize=2)
+
+    store.set("first", "key", 1)
+    store.set("second", "key", 2)
+    store.get("first", "key")
+    store.set("third", "key", 3)
+
+    assert store.get("first", "key") == 1
+    assert store.get("third", "key") == 3
+
+    with pytest.raises(KeyError):
+        store.get("second", "key")
@@ -0,0 +1,265 @@
+"""
+Tests for :class:`~quart_injector.Tenancy`.
+"""
+import gc
+import time
+import weakref
+
+import injector
+import pytest
+import quart
+
+import quart_injector
+
+
+class Client:  # pylint: disable=too-few-public-methods
+    """
+    Client.
+
+    A class bound differently per tenant.
+
+    :param name: name of the tenant the client is for
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class EmptyClass:  # pylint: disable=too-few-public-methods
+    """
+    Empty class.
+    """
+
+
+class Session:  # pylint: disable=too-few-public-methods
+    """
+    Session.
+
+    A request scoped class bound per tenant.
+
+    :param client: client of the tenant
+    :param empty: instance of EmptyClass
+    """
+
+    @injector.inject
+    def __init__(self, client: Client, empty: EmptyClass) -> None:
+        self.client = client
+        self.empty = empty
+
+
+class Token:  # pylint: disable=too-few-public-methods
+    """
+    Token.
+
+    A class provided by an async provider of the application's injector.
+    """
+
+
+@injector.inject
+async def provide_token(empty: EmptyClass) -> Token:
+    """
+    Provide token.
+
+    :param empty: instance of EmptyClass
+
+    :return: new token
+    """
+    assert empty
+
+    return Token()
+
+
+def configure_token(binder: injector.Binder) -> None:
+    """
+    Configure token.
+
+    Bind token to its async provider.
+    """
+    quart_injector.bind(binder, Token, provide_token)
+
+
+def configure(binder: injector.Binder) -> None:
+    """
+    Configure injector.
+
+    Bind empty class to the request scope.
+    """
+    binder.bind(EmptyClass, scope=quart_injector.RequestScope)
+
+
+def resolver() -> str:
+    """
+    Resolver.
+
+    :return: tenant named by the request's headers
+    """
+    return quart.request.headers.get("X-Tenant", "default")
+
+
+def modules(tenant: str) -> injector.Module:
+    """
+    Modules.
+
+    :param tenant: tenant to configure
+
+    :return: module binding the tenant's client
+    """
+
+    def configure_tenant(binder: injector.Binder) -> None:
+        binder.bind(Client, to=Client(tenant), scope=injector.singleton)
+        binder.bind(Session, scope=quart_injector.RequestScope)
+
+    return configure_tenant  # type: ignore
+
+
+def factory(records: list[tuple[Client, EmptyClass, EmptyClass]]) -> quart.Quart:
+    """
+    Factory.
+
+    Create an application with a view recording what it was injected with.
+
+    :param records: list to record the client and empty classes in
+    """
+    app = quart.Quart(__name__)
+    request_values: list[EmptyClass] = []
+
+    @app.before_request  # type: ignore
+    async def before(empty: injector.Inject[EmptyClass]) -> None:
+        request_values.append(empty)
+
+    @app.route("/")
+    async def _(
+        client: injector.Inject[Client],
+        empty: injector.Inject[EmptyClass],
+    ) -> quart.Response:
+        records.append((client, empty, request_values[-1]))
+
+        return quart.Response(b"content here")
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_it_should_inject_from_the_tenant_injector() -> None:
+    """
+    it should inject views from the injector of the current tenant
+    """
+    records: list[tuple[Client, EmptyClass, EmptyClass]] = []
+    app = factory(records)
+
+    quart_injector.wire(
+        app, configure, tenancy=quart_injector.Tenancy(resolver, modules)
+    )
+
+    test_client = app.test_client()
+    await test_client.get("/", headers={"X-Tenant": "first"})
+    await test_client.get("/", headers={"X-Tenant": "second"})
+    await test_client.get("/", headers={"X-Tenant": "first"})
+
+    assert [client.name for client, _, _ in records] == ["first", "second", "first"]
+    assert records[0][0] is records[2][0]
+    assert len(app.extensions["injector_tenants"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_it_should_share_request_scope_with_tenant_injectors() -> None:
+    """
+    it should share the request scope between hooks and tenant injected views
+    """
+    records: list[tuple[Client, EmptyClass, EmptyClass]] = []
+    app = factory(records)
+
+    quart_injector.wire(
+        app, configure, tenancy=quart_injector.Tenancy(resolver, modules)
+    )
+
+    await app.test_client().get("/", headers={"X-Tenant": "first"})
+
+    _, empty, before = records[0]
+
+    assert empty is before
+
+
+def test_it_should_evict_least_recently_used_tenants() -> None:
+    """
+    it should evict the least recently used tenant when the pool is full
+    """
+    container = injector.Injector()
+    pool = quart_injector.TenantPool(
+        container, quart_injector.Tenancy(resolver, modules, maxsize=2)
+    )
+
+    first = pool.get("first")
+    pool.get("second")
+    pool.get("first")
+    pool.get("third")
+
+    assert len(pool) == 2
+    assert pool.get("first") is first
+    assert pool.get("first").get(Client).name == "first"
+    assert pool.get("first").parent is container
+
+
+def test_it_should_expire_idle_tenants() -> None:
+    """
+    it should drop tenant injectors not used for longer than the idle timeout
+    """
+    pool = quart_injector.TenantPool(
+        injector.Injector(), quart_injector.Tenancy(resolver, modules, idle=0.01)
+    )
+
+    first = pool.get("first")
+
+    time.sleep(0.02)
+
+    assert pool.get("first") is not first
+
+    pool.evict("first")
+
+    assert not pool
+
+
+@pytest.mark.asyncio
+async def test_it_should_drop_evicted_tenant_injectors() -> None:
+    """
+    it should let evicted tenant injectors, and the slots of their request scoped
+    bindings, be garbage collected
+    """
+    app = quart.Quart(__name__)
+    sessions: list[Session] = []
+
+    @app.route("/")
+    async def _(
+        session: injector.Inject[Session], token: injector.Inject[Token]
+    ) -> quart.Response:
+        assert isinstance(token, Token)
+
+        sessions.append(session)
+
+        return quart.Response(b"content here")
+
+    quart_injector.wire(
+        app,
+        [configure, configure_token],
+        tenancy=quart_injector.Tenancy(resolver, modules),
+    )
+
+    pool = app.extensions["injector_tenants"]
+    scope = app.extensions["injector"].get(quart_injector.RequestScope)
+    test_client = app.test_client()
+
+    await test_client.get("/", headers={"X-Tenant": "first"})
+
+    slots = len(getattr(scope, "_providers"))
+    child = weakref.ref(pool.get("first"))
+
+    await test_client.get("/", headers={"X-Tenant": "second"})
+
+    assert sessions[1].client.name == "second"
+    assert len(getattr(scope, "_providers")) == slots
+
+    pool.evict("first")
+    sessions.clear()
+    gc.collect()
+
+    assert child() is None
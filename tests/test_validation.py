@@ -0,0 +1,262 @@
+"""
+Tests for :class:`~quart_injector.ValidationError`.
+"""
+import abc
+
+import injector
+import pytest
+import quart
+
+import quart_injector
+
+
+class EmptyClass:  # pylint: disable=too-few-public-methods
+    """
+    Empty class.
+    """
+
+
+class Abstract(abc.ABC):  # pylint: disable=too-few-public-methods
+    """
+    Abstract.
+
+    An abstract class without an implementation bound.
+    """
+
+    @abc.abstractmethod
+    def method(self) -> None:
+        """
+        Method.
+        """
+
+
+class First:  # pylint: disable=too-few-public-methods
+    """
+    First.
+
+    Depends on Second, which depends on First.
+
+    :param second: instance of Second
+    """
+
+    @injector.inject
+    def __init__(self, second: "Second") -> None:
+        self.second = second
+
+
+class Second:  # pylint: disable=too-few-public-methods
+    """
+    Second.
+
+    Depends on First.
+
+    :param first: instance of First
+    """
+
+    @injector.inject
+    def __init__(self, first: First) -> None:
+        self.first = first
+
+
+class LazyFirst:  # pylint: disable=too-few-public-methods
+    """
+    Lazy first.
+
+    Depends on LazySecond lazily, which depends on LazyFirst.
+
+    :param second: lazy instance of LazySecond
+    """
+
+    @injector.inject
+    def __init__(self, second: quart_injector.Lazy["LazySecond"]) -> None:
+        self.second = second
+
+
+class LazySecond:  # pylint: disable=too-few-public-methods
+    """
+    Lazy second.
+
+    Depends on LazyFirst.
+
+    :param first: instance of LazyFirst
+    """
+
+    @injector.inject
+    def __init__(self, first: LazyFirst) -> None:
+        self.first = first
+
+
+@injector.singleton
+class Service:  # pylint: disable=too-few-public-methods
+    """
+    Service.
+
+    A singleton depending on a request scoped class.
+
+    :param child: instance of EmptyClass
+    """
+
+    @injector.inject
+    def __init__(self, child: EmptyClass) -> None:
+        self.child = child
+
+
+class Middle:  # pylint: disable=too-few-public-methods
+    """
+    Middle.
+
+    An unscoped class depending on a request scoped class.
+
+    :param child: instance of EmptyClass
+    """
+
+    @injector.inject
+    def __init__(self, child: EmptyClass) -> None:
+        self.child = child
+
+
+@injector.singleton
+class Outer:  # pylint: disable=too-few-public-methods
+    """
+    Outer.
+
+    A singleton depending on a request scoped class through an unscoped one.
+
+    :param middle: instance of Middle
+    """
+
+    @injector.inject
+    def __init__(self, middle: Middle) -> None:
+        self.middle = middle
+
+
+@injector.singleton
+class Handler:  # pylint: disable=too-few-public-methods
+    """
+    Handler.
+
+    A singleton depending on the current request.
+
+    :param request: current request
+    """
+
+    @injector.inject
+    def __init__(self, request: quart.Request) -> None:
+        self.request = request
+
+
+def configure(binder: injector.Binder) -> None:
+    """
+    Configure injector.
+
+    Bind empty class to the request scope.
+    """
+    binder.bind(EmptyClass, scope=quart_injector.RequestScope)
+
+
+def test_it_should_aggregate_problems() -> None:
+    """
+    it should report every problem in the dependency graph together
+    """
+    app = quart.Quart(__name__)
+
+    @app.route("/abstract")
+    async def abstract(value: injector.Inject[Abstract]) -> str:  # pragma: no cover
+        return str(value)
+
+    @app.route("/cycle")
+    async def cycle(value: injector.Inject[First]) -> str:  # pragma: no cover
+        return str(value)
+
+    @app.route("/service")
+    async def service(value: injector.Inject[Service]) -> str:  # pragma: no cover
+        return str(value)
+
+    with pytest.raises(quart_injector.ValidationError) as info:
+        quart_injector.wire(app, configure, validate=True)
+
+    assert info.value.problems == [
+        "cannot instantiate abstract Abstract required by "
+        "test_it_should_aggregate_problems.<locals>.abstract, bind it to an "
+        "implementation",
+        "dependency cycle First -> Second -> First",
+        "Service bound in SingletonScope cannot depend on EmptyClass bound in "
+        "RequestScope",
+    ]
+    assert str(info.value).startswith("3 problem(s) in the dependency graph:\n")
+
+
+def test_it_should_report_missing_bindings() -> None:
+    """
+    it should report missing bindings when not auto binding
+    """
+    app = quart.Quart(__name__)
+
+    @app.before_request  # type: ignore
+    async def before(value: injector.Inject[EmptyClass]) -> None:  # pragma: no cover
+        assert value
+
+    with pytest.raises(quart_injector.ValidationError) as info:
+        quart_injector.wire(app, auto_bind=False, validate=True)
+
+    assert info.value.problems == [
+        "no binding for EmptyClass required by "
+        "test_it_should_report_missing_bindings.<locals>.before"
+    ]
+
+
+def test_it_should_reject_lazy_dependencies_of_classes() -> None:
+    """
+    it should reject classes depending on lazy handles, which injector cannot provide
+    """
+    app = quart.Quart(__name__)
+
+    @app.route("/")
+    async def view(value: injector.Inject[LazyFirst]) -> str:  # pragma: no cover
+        return str(value)
+
+    with pytest.raises(quart_injector.ValidationError) as info:
+        quart_injector.wire(app, configure, validate=True)
+
+    assert info.value.problems == [
+        "LazyFirst cannot depend on Lazy[LazySecond] for 'second', lazy handles are "
+        "only injected into views, hooks and async or resource providers"
+    ]
+
+
+def test_it_should_report_request_values_held_through_unscoped_values() -> None:
+    """
+    it should report singletons holding request scoped values through unscoped ones
+    """
+    app = quart.Quart(__name__)
+
+    @app.route("/")
+    async def view(value: injector.Inject[Outer]) -> str:  # pragma: no cover
+        return str(value)
+
+    with pytest.raises(quart_injector.ValidationError) as info:
+        quart_injector.wire(app, configure, validate=True)
+
+    assert info.value.problems == [
+        "Outer bound in SingletonScope cannot depend on EmptyClass bound in "
+        "RequestScope through Middle"
+    ]
+
+
+def test_it_should_report_request_context_objects() -> None:
+    """
+    it should treat unscoped objects of the request context as request scoped
+    """
+    app = quart.Quart(__name__)
+
+    @app.route("/")
+    async def view(value: injector.Inject[Handler]) -> str:  # pragma: no cover
+        return str(value)
+
+    with pytest.raises(quart_injector.ValidationError) as info:
+        quart_injector.wire(app, configure, validate=True)
+
+    assert info.value.problems == [
+        "Handler bound in SingletonScope cannot depend on Request provided by the "
+        "current request context"
+    ]
@@ -0,0 +1,162 @@
+"""
+Tests for :func:`~quart_injector.warm_up`.
+"""
+import typing
+
+import injector
+import pytest
+import quart
+import quart.views
+
+import quart_injector
+
+built: list[str] = []
+
+
+@injector.singleton
+class Connection:  # pylint: disable=too-few-public-methods
+    """
+    Connection.
+
+    A singleton recording when it is built.
+    """
+
+    def __init__(self) -> None:
+        built.append("connection")
+
+
+@injector.singleton
+class Repository:  # pylint: disable=too-few-public-methods
+    """
+    Repository.
+
+    A singleton depending on another singleton.
+
+    :param connection: connection to use
+    """
+
+    @injector.inject
+    def __init__(self, connection: Connection) -> None:
+        built.append("repository")
+        self.connection = connection
+
+
+class Model:  # pylint: disable=too-few-public-methods
+    """
+    Model.
+
+    A class built asynchronously.
+    """
+
+
+class Unused:  # pylint: disable=too-few-public-methods
+    """
+    Unused.
+
+    A singleton no view depends on.
+    """
+
+    def __init__(self) -> None:  # pragma: no cover
+        built.append("unused")
+
+
+def configure(binder: injector.Binder) -> None:
+    """
+    Configure injector.
+
+    Bind the model to a singleton async provider.
+    """
+
+    async def load() -> Model:
+        built.append("model")
+
+        return Model()
+
+    binder.bind(Model, to=load, scope=injector.singleton)  # type: ignore
+    binder.bind(Unused, scope=injector.singleton)
+
+
+def factory() -> quart.Quart:
+    """
+    Factory.
+
+    Create an application with views depending on the singletons.
+    """
+    app = quart.Quart(__name__)
+
+    @app.route("/")
+    async def _(repository: injector.Inject[Repository]) -> quart.Response:
+        assert isinstance(repository, Repository)
+
+        return quart.Response(b"content here")
+
+    class _View(quart.views.View):
+        methods = ["GET"]
+
+        def __init__(self, model: injector.Inject[Model]) -> None:
+            self.model = model
+
+        async def dispatch_request(  # pylint: disable=unused-argument
+            self,
+            *args: typing.Any,
+            **kwargs: typing.Any,
+        ) -> str:  # pragma: no cover
+            return "content here"
+
+    app.add_url_rule("/model", view_func=_View.as_view("model"))
+
+    return app
+
+
+@pytest.fixture(autouse=True)
+def clear() -> None:
+    """
+    Clear the singletons built.
+    """
+    built.clear()
+
+
+@pytest.mark.asyncio
+async def test_it_should_build_singletons_before_serving() -> None:
+    """
+    it should build the singletons views depend on before serving
+    """
+    app = factory()
+
+    quart_injector.wire(app, configure, warm=True)
+
+    async with app.test_app():
+        assert sorted(built) == ["connection", "model", "repository"]
+
+        await app.test_client().get("/")
+
+    assert len(built) == 3
+
+
+@pytest.mark.asyncio
+async def test_it_should_not_build_singletons_lazily_by_default() -> None:
+    """
+    it should not build singletons before serving unless asked to
+    """
+    app = factory()
+
+    quart_injector.wire(app, configure)
+
+    async with app.test_app():
+        assert not built
+
+
+@pytest.mark.asyncio
+async def test_it_should_report_build_times() -> None:
+    """
+    it should report how long each singleton took to build
+    """
+    app = factory()
+
+    quart_injector.wire(app, configure)
+
+    timings = await quart_injector.warm_up(app)
+
+    assert set(timings) == {Connection, Repository, Model}
+    assert all(duration >= 0 for duration in timings.values())
+    assert built.index("connection") < built.index("repository")
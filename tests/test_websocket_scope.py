@@ -0,0 +1,135 @@
+"""
+Tests for :class:`~quart_injector.WebsocketScope` and
+:class:`~quart_injector.MessageScope`.
+"""
+import collections.abc
+
+import injector
+import pytest
+import quart
+
+import quart_injector
+
+
+class EmptyClass:  # pylint: disable=too-few-public-methods
+    """
+    Empty class.
+    """
+
+
+@quart_injector.websocket
+class ConnectionClass:  # pylint: disable=too-few-public-methods
+    """
+    Connection class.
+
+    Like EmptyClass but decorated with the websocket scope.
+    """
+
+
+@quart_injector.message
+class MessageClass:  # pylint: disable=too-few-public-methods
+    """
+    Message class.
+
+    Like EmptyClass but decorated with the message scope.
+    """
+
+
+@pytest.mark.asyncio
+async def test_it_should_provide_same_values_within_a_connection() -> None:
+    """
+    it should provide same values within a websocket connection and different values
+    per connection
+    """
+    app = quart.Quart(__name__)
+    instances: list[ConnectionClass] = []
+
+    @app.websocket("/ws")
+    async def handler(container: injector.Inject[injector.Injector]) -> None:
+        while True:  # pylint: disable=while-used
+            await quart.websocket.receive()
+            instances.append(container.get(ConnectionClass))
+            await quart.websocket.send("ok")
+
+    quart_injector.wire(app)
+
+    test_client = app.test_client()
+
+    for _ in range(2):
+        async with test_client.websocket("/ws") as test_websocket:
+            for message in ("foo", "bar"):
+                await test_websocket.send(message)
+                await test_websocket.receive()
+
+    assert instances[0] is instances[1]
+    assert instances[2] is instances[3]
+    assert instances[0] is not instances[2]
+
+
+@pytest.mark.asyncio
+async def test_it_should_not_activate_websocket_scope_for_requests() -> None:
+    """
+    it should not activate the websocket scope for requests
+    """
+    app = quart.Quart(__name__)
+
+    @app.route("/")
+    async def _(container: injector.Inject[injector.Injector]) -> quart.Response:
+        with pytest.raises(RuntimeError, match="WebsocketScope is not active"):
+            container.get(ConnectionClass)
+
+        return quart.Response(b"content here")
+
+    quart_injector.wire(app)
+
+    response = await app.test_client().get("/")
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("middleware", [False, True])
+async def test_it_should_provide_different_values_per_message(middleware: bool) -> None:
+    """
+    it should provide different values per message scope, and release resources once
+    each message has been handled
+    """
+    app = quart.Quart(__name__)
+    events: list[str] = []
+    instances: list[MessageClass] = []
+
+    def configure(binder: injector.Binder) -> None:
+        quart_injector.bind(
+            binder, EmptyClass, resource, scope=quart_injector.MessageScope
+        )
+
+    def resource() -> collections.abc.Iterator[EmptyClass]:
+        events.append("enter")
+        yield EmptyClass()
+        events.append("exit")
+
+    @app.websocket("/ws")
+    async def _(container: injector.Inject[injector.Injector]) -> None:
+        scope = container.get(quart_injector.MessageScope)
+
+        while True:  # pylint: disable=while-used
+            message = await quart.websocket.receive()
+
+            async with scope.activate():
+                instances.append(container.get(MessageClass))
+                instances.append(container.get(MessageClass))
+                container.get(EmptyClass)
+                events.append(message)
+
+            await quart.websocket.send("ok")
+
+    quart_injector.wire(app, configure, middleware=middleware)
+
+    async with app.test_client().websocket("/ws") as test_websocket:
+        for message in ("foo", "bar"):
+            await test_websocket.send(message)
+            await test_websocket.receive()
+
+    assert instances[0] is instances[1]
+    assert instances[0] is not instances[2]
+    assert events == ["enter", "foo", "exit", "enter", "bar", "exit"]
@@ -1,6 +1,8 @@
 """
 Tests for :class:`~quart_injector.wire`.
 """
+import asyncio
+import collections.abc
 import typing
 
 import injector
@@ -8,6 +10,9 @@ import pytest
 import quart
 
 import quart_injector
+import quart_injector.scope
+
+import tests.helpers
 
 
 class EmptyClass:  # pylint: disable=too-few-public-methods
@@ -732,3 +737,258 @@ async def test_it_should_inject_differet_values_in_different_requests() -> None:
     assert isinstance(args[0], EmptyClass)
     assert isinstance(args[1], EmptyClass)
     assert args[0] is not args[1]
+
+
+@pytest.mark.asyncio
+async def test_it_should_release_request_scoped_resources() -> None:
+    """
+    it should release request scoped resources
+    """
+    app = factory()
+
+    events: list[str] = []
+
+    async def provide() -> collections.abc.AsyncIterator[EmptyClass]:
+        events.append("enter")
+        yield EmptyClass()
+        events.append("exit")
+
+    @app.route("/test")
+    async def _(empty: injector.Inject[EmptyClass]) -> str:
+        assert isinstance(empty, EmptyClass)
+
+        events.append("view")
+
+        return "content here"
+
+    quart_injector.wire(
+        app,
+        tests.helpers.module(EmptyClass, provide, quart_injector.RequestScope),
+    )
+
+    test_client = app.test_client()
+
+    await test_client.get("/test")
+
+    assert events == ["enter", "view", "exit"]
+
+
+@pytest.mark.asyncio
+async def test_it_should_activate_request_scope_using_middleware() -> None:
+    """
+    it should activate request scope using middleware
+    """
+    app = factory()
+
+    args: list[typing.Any] = [None, None]
+
+    @app.before_request  # type: ignore
+    async def _(empty: injector.Inject[EmptyClass]) -> None:
+        args[0] = empty
+
+    @app.route("/test")
+    async def _(empty: injector.Inject[EmptyClass]) -> quart.Response:
+        args[1] = empty
+
+        return quart.Response(b"content here")
+
+    quart_injector.wire(app, configure, middleware=True)
+
+    assert len(app.before_request_funcs[None]) == 1
+    assert isinstance(app.asgi_app, quart_injector.scope.ScopeMiddleware)
+
+    messages: list[typing.Any] = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive() -> typing.Any:
+        if requests:
+            return requests.pop()
+
+        return await asyncio.Future()  # wait until cancelled
+
+    async def send(message: typing.Any) -> None:
+        messages.append(message)
+
+    async with app.test_app():
+        await app(
+            {
+                "type": "http",
+                "asgi": {},
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "path": "/test",
+                "raw_path": b"/test",
+                "query_string": b"",
+                "root_path": "",
+                "headers": [(b"host", b"localhost")],
+                "client": ("127.0.0.1", 80),
+                "server": ("localhost", 80),
+                "extensions": {},
+            },
+            receive,
+            send,
+        )
+
+    assert messages[0]["status"] == 200
+    assert isinstance(args[0], EmptyClass)
+    assert args[0] is args[1]
+
+
+@pytest.mark.asyncio
+async def test_it_should_incrementally_inject_into_app_views() -> None:
+    """
+    it should incrementally inject into app views added after wiring
+    """
+    app = factory()
+
+    args: list[typing.Any] = [None, None]
+
+    quart_injector.wire(app, configure, incremental=True)
+
+    @app.route("/test")
+    @app.route("/other")
+    @injector.inject
+    async def _(empty: EmptyClass) -> str:
+        args[0] = empty
+
+        return "content here"
+
+    def other(empty: injector.Inject[EmptyClass]) -> str:
+        args[1] = empty
+
+        return "content here"
+
+    app.add_url_rule("/sync", view_func=other)
+
+    test_client = app.test_client()
+
+    await test_client.get("/test")
+    await test_client.get("/sync")
+
+    assert isinstance(args[0], EmptyClass)
+    assert isinstance(args[1], EmptyClass)
+
+
+@pytest.mark.asyncio
+async def test_it_should_incrementally_inject_into_app_hooks() -> None:
+    """
+    it should incrementally inject into app hooks added after wiring
+    """
+    app = factory()
+
+    args: list[typing.Any] = [None, None, None]
+
+    quart_injector.wire(app, configure, incremental=True)
+
+    @app.before_request  # type: ignore
+    @injector.inject
+    async def _(empty: EmptyClass) -> None:
+        args[0] = empty
+
+    @app.errorhandler(CustomError)  # type: ignore
+    @injector.inject
+    async def _(_: CustomError, empty: EmptyClass) -> str:
+        args[1] = empty
+
+        return "content here"
+
+    @app.teardown_request  # type: ignore
+    @injector.inject
+    async def _(_: BaseException | None, empty: EmptyClass) -> None:
+        args[2] = empty
+
+    test_client = app.test_client()
+
+    await test_client.get("/error")
+
+    assert isinstance(args[0], EmptyClass)
+    assert args[0] is args[1]
+    assert args[0] is args[2]
+
+
+@pytest.mark.asyncio
+async def test_it_should_incrementally_inject_into_blueprints() -> None:
+    """
+    it should incrementally inject into blueprints registered after wiring
+    """
+    app, blueprint = blueprint_factory()
+
+    args: list[typing.Any] = [None, None]
+
+    @blueprint.before_request  # type: ignore
+    @injector.inject
+    async def _(empty: EmptyClass) -> None:
+        args[0] = empty
+
+    @blueprint.route("/test")
+    @injector.inject
+    async def _(empty: EmptyClass) -> str:
+        args[1] = empty
+
+        return "content here"
+
+    quart_injector.wire(app, configure, incremental=True)
+
+    app.register_blueprint(blueprint)
+
+    test_client = app.test_client()
+
+    await test_client.get("/test")
+
+    assert isinstance(args[0], EmptyClass)
+    assert args[0] is args[1]
+
+
+def test_it_should_not_wrap_functions_twice() -> None:
+    """
+    it should not wrap functions that are already wrapped
+    """
+    app = factory()
+
+    quart_injector.wire(app, configure, incremental=True)
+
+    wrapped = app.view_functions["view"]
+
+    app.register_blueprint(quart.Blueprint("bar", __name__))
+
+    assert app.view_functions["view"] is wrapped
+    assert quart_injector.wrap(wrapped, app, app.extensions["injector"]) is wrapped
+
+
+def test_it_should_leave_functions_without_dependencies_untouched() -> None:
+    """
+    it should leave functions without injectable parameters untouched
+    """
+    app = factory()
+
+    @app.after_request
+    async def after(response: quart.Response) -> quart.Response:  # pragma: no cover
+        return response
+
+    quart_injector.wire(app, configure)
+
+    assert app.view_functions["view"] is view
+    assert after in app.after_request_funcs[None]
+
+
+def test_it_should_configure_scope_limits() -> None:
+    """
+    it should configure scope limits from the application's configuration
+    """
+    app = factory()
+    app.config.update(
+        INJECTOR_SCOPE_MAX_INSTANCES=10,
+        INJECTOR_SCOPE_MAX_SIZE=1024,
+        INJECTOR_SCOPE_STRICT=True,
+    )
+
+    quart_injector.wire(app, configure)
+
+    for scope_cls in (quart_injector.RequestScope, quart_injector.WebsocketScope):
+        scope = app.extensions["injector"].get(scope_cls)
+
+        assert scope.max_instances == 10
+        assert scope.max_size == 1024
+        assert not scope.measure
+        assert scope.strict
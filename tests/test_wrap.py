@@ -1,9 +1,11 @@
 """
 Tests for :class:`~quart_injector.wrap`.
 """
+import asyncio
 import collections.abc
 import functools
 import re
+import threading
 import typing
 
 import injector
@@ -12,6 +14,9 @@ import quart
 import quart.views
 
 import quart_injector
+import quart_injector.provider
+
+import tests.helpers
 
 
 class EmptyClass:  # pylint: disable=too-few-public-methods
@@ -103,6 +108,81 @@ async def test_it_should_wrap_async_functions_with_injector() -> None:
     assert isinstance(args[1], EmptyClass)
 
 
+def test_it_should_not_wrap_functions_without_injectable_parameters() -> None:
+    """
+    it should not wrap functions without injectable parameters
+    """
+    app = quart.Quart(__name__)
+
+    container = injector.Injector()
+
+    def view(arg: str) -> str:  # pragma: no cover
+        return arg
+
+    assert quart_injector.wrap(view, app, container) is view
+
+
+def test_it_should_not_wrap_class_based_views_without_injectable_parameters() -> None:
+    """
+    it should not wrap class based views without injectable parameters
+    """
+    app = quart.Quart(__name__)
+
+    container = injector.Injector()
+
+    class _View(quart.views.View):  # pragma: no cover
+        methods = ["GET"]
+
+        def __init__(self, arg: str) -> None:
+            self.arg = arg
+
+        async def dispatch_request(  # pylint: disable=unused-argument
+            self,
+            *args: typing.Any,
+            **kwargs: typing.Any,
+        ) -> str:
+            return self.arg
+
+    view = _View.as_view("view", arg="foo")
+
+    assert quart_injector.wrap(view, app, container) is view
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("inline", [False, True])
+async def test_it_should_call_inline_functions_on_the_event_loop(inline: bool) -> None:
+    """
+    it should call inline functions on the event loop instead of in an executor
+    """
+    app = quart.Quart(__name__)
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(EmptyClass)
+
+    container = injector.Injector(configure)
+
+    def view(empty: injector.Inject[EmptyClass]) -> int:
+        assert isinstance(empty, EmptyClass)
+
+        return threading.get_ident()
+
+    def hook() -> int:
+        return threading.get_ident()
+
+    if inline:
+        view = quart_injector.inline(view)
+        hook = quart_injector.inline(hook)
+
+    wrapped_view = quart_injector.wrap(view, app, container)
+    wrapped_hook = quart_injector.wrap(hook, app, container)
+
+    assert (await wrapped_view() == threading.get_ident()) is inline
+    assert (wrapped_hook is hook) is not inline
+
+    if inline:
+        assert await wrapped_hook() == threading.get_ident()
+
+
 @pytest.mark.asyncio
 async def test_it_should_wrap_class_based_views_with_injector() -> None:
     """
@@ -199,7 +279,7 @@ async def test_it_should_wrap_class_based_views_using_decorators() -> None:
     container = injector.Injector(configure)
 
     def decorator(
-        func: collections.abc.Callable[..., str]
+        func: collections.abc.Callable[..., str],
     ) -> collections.abc.Callable[..., str]:
         @functools.wraps(func)
         def wrapper() -> str:
@@ -236,3 +316,210 @@ async def test_it_should_wrap_class_based_views_using_decorators() -> None:
     assert _args[0] == "foo"
     assert isinstance(_args[1], EmptyClass)
     assert _args[2] == "bar"
+
+
+@pytest.mark.asyncio
+async def test_it_should_wrap_class_based_views_with_sync_dispatch() -> None:
+    """
+    it should wrap class based views with a synchronous dispatch request
+    """
+    app = quart.Quart(__name__)
+
+    _args: list[typing.Any] = [None, None]
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(EmptyClass)
+
+    container = injector.Injector(configure)
+
+    class _View(quart.views.View):
+        methods = ["GET"]
+
+        def __init__(self, empty: injector.Inject[EmptyClass]) -> None:
+            self.empty = empty
+
+        # pylint: disable=invalid-overridden-method
+        def dispatch_request(  # type: ignore[override] # pylint: disable=W0613
+            self,
+            *args: typing.Any,
+            **kwargs: typing.Any,
+        ) -> str:
+            _args[0] = self.empty
+            _args[1] = kwargs["arg"]
+
+            return "baz"
+
+    view = _View.as_view("view")
+
+    wrapped = quart_injector.wrap(view, app, container)
+
+    assert await wrapped(arg="bar") == "baz"
+    assert isinstance(_args[0], EmptyClass)
+    assert _args[1] == "bar"
+
+
+@pytest.mark.asyncio
+async def test_it_should_create_class_based_view_instances_per_call() -> None:
+    """
+    it should create class based view instances per call
+    """
+    app = quart.Quart(__name__)
+
+    instances: list[typing.Any] = []
+
+    container = injector.Injector()
+
+    class _View(quart.views.View):
+        methods = ["GET"]
+
+        def __init__(self, empty: injector.Inject[EmptyClass]) -> None:
+            self.empty = empty
+
+        async def dispatch_request(  # pylint: disable=unused-argument
+            self,
+            *args: typing.Any,
+            **kwargs: typing.Any,
+        ) -> str:
+            instances.append(self)
+
+            return "baz"
+
+    wrapped = quart_injector.wrap(_View.as_view("view"), app, container)
+
+    await wrapped()
+    await wrapped()
+
+    assert instances[0] is not instances[1]
+    assert instances[0].empty is not instances[1].empty
+
+
+@pytest.mark.asyncio
+async def test_it_should_reuse_reusable_class_based_view_instances() -> None:
+    """
+    it should reuse reusable class based view instances
+    """
+    app = quart.Quart(__name__)
+
+    instances: list[typing.Any] = []
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(EmptyClass, scope=injector.singleton)
+
+    container = injector.Injector(configure)
+
+    @quart_injector.reusable
+    class _View(quart.views.View):
+        methods = ["GET"]
+
+        def __init__(self, empty: injector.Inject[EmptyClass]) -> None:
+            self.empty = empty
+
+        async def dispatch_request(  # pylint: disable=unused-argument
+            self,
+            *args: typing.Any,
+            **kwargs: typing.Any,
+        ) -> str:
+            instances.append(self)
+
+            return "baz"
+
+    wrapped = quart_injector.wrap(_View.as_view("view"), app, container)
+
+    await asyncio.gather(wrapped(), wrapped())
+
+    assert instances[0] is instances[1]
+    assert isinstance(instances[0].empty, EmptyClass)
+
+
+@pytest.mark.parametrize(
+    "scope",
+    [injector.NoScope, quart_injector.RequestScope],
+)
+def test_it_should_error_when_reusing_views_with_non_singleton_dependencies(
+    scope: type[injector.Scope],
+) -> None:
+    """
+    it should error when reusing class based views with non singleton dependencies
+    """
+    app = quart.Quart(__name__)
+
+    def configure(binder: injector.Binder) -> None:
+        binder.bind(EmptyClass, scope=scope)
+
+    container = injector.Injector(configure)
+
+    @quart_injector.reusable
+    class _View(quart.views.View):  # pragma: no cover
+        methods = ["GET"]
+
+        def __init__(self, empty: injector.Inject[EmptyClass]) -> None:
+            self.empty = empty
+
+        async def dispatch_request(  # pylint: disable=unused-argument
+            self,
+            *args: typing.Any,
+            **kwargs: typing.Any,
+        ) -> str:
+            return "baz"
+
+    with pytest.raises(
+        RuntimeError,
+        match="cannot reuse _View instances as 'empty' is not bound as a singleton",
+    ):
+        quart_injector.wrap(_View.as_view("view"), app, container)
+
+
+def test_it_should_error_when_reusing_views_with_unresolved_annotations() -> None:
+    """
+    it should error when reusing class based views with unresolved annotations
+    """
+    app = quart.Quart(__name__)
+
+    container = injector.Injector()
+
+    @quart_injector.reusable
+    class _View(quart.views.View):  # pragma: no cover
+        methods = ["GET"]
+
+        def __init__(self, empty: injector.Inject["Missing"]) -> None:  # type: ignore
+            self.empty = empty
+
+        async def dispatch_request(  # pylint: disable=unused-argument
+            self,
+            *args: typing.Any,
+            **kwargs: typing.Any,
+        ) -> str:
+            return "baz"
+
+    with pytest.raises(NameError):
+        quart_injector.wrap(_View.as_view("view"), app, container)
+
+
+@pytest.mark.asyncio
+async def test_it_should_wrap_class_based_views_with_async_providers() -> None:
+    """
+    it should wrap class based views with asynchronous providers
+    """
+    app = quart.Quart(__name__)
+
+    async def provide() -> EmptyClass:
+        return EmptyClass()
+
+    container = tests.helpers.container(EmptyClass, provide)
+
+    class _View(quart.views.View):
+        methods = ["GET"]
+
+        def __init__(self, empty: injector.Inject[EmptyClass]) -> None:
+            self.empty = empty
+
+        async def dispatch_request(  # pylint: disable=unused-argument
+            self,
+            *args: typing.Any,
+            **kwargs: typing.Any,
+        ) -> typing.Any:
+            return self.empty
+
+    wrapped = quart_injector.wrap(_View.as_view("view"), app, container)
+
+    assert isinstance(await wrapped(), EmptyClass)